@@ -0,0 +1,74 @@
+"""
+Benchmark: characteristic collapse pressure p_c for N pipe geometries.
+
+Compares a per-point loop over the scipy Newton solver
+(`characteristic_collapse_pressure`) and the closed-form solution
+(`characteristic_collapse_pressure_analytic`) with one call of the
+array-native `characteristic_collapse_pressure_vectorized`.
+
+    python benchmarks/bench_collapse.py [N]
+"""
+import sys
+import time
+
+import numpy as np
+
+from pdover2t.DNVSTF101.buckling_collapse import (elastic_collapse_pressure,
+    plastic_collapse_pressure, characteristic_collapse_pressure,
+    characteristic_collapse_pressure_analytic,
+    characteristic_collapse_pressure_vectorized)
+
+
+def design_matrix(N, seed=0):
+    rng = np.random.default_rng(seed)
+    D_o = rng.uniform(0.1683, 1.0668, N)
+    t = D_o / rng.uniform(12.0, 45.0, N)
+    O_0 = rng.uniform(0.005, 0.03, N)
+    f_y = rng.choice([358.e6, 413.e6, 448.e6, 485.e6], N) * 0.96
+    p_el = elastic_collapse_pressure(D_o, t, 207.e9, 0.3)
+    p_p = plastic_collapse_pressure(D_o, t, f_y, 0.93)
+    return D_o, t, p_el, p_p, O_0
+
+
+def newton_per_point(rows):
+    """The per-point scipy call, started from p_c=0; Newton's method does
+    not converge for every geometry, count those and use the closed form."""
+    p_c, failed = [], 0
+    for row in rows:
+        try:
+            p_c.append(characteristic_collapse_pressure(*row, p_c_0=0.0))
+        except RuntimeError:
+            failed += 1
+            p_c.append(characteristic_collapse_pressure_analytic(*row))
+    return np.array(p_c), failed
+
+
+def timed(func):
+    t0 = time.perf_counter()
+    ret = func()
+    return ret, time.perf_counter() - t0
+
+
+if __name__ == "__main__":
+    N = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    D_o, t, p_el, p_p, O_0 = design_matrix(N)
+    rows = list(zip(*(x.tolist() for x in (D_o, t, p_el, p_p, O_0))))
+
+    (p_c_newton, failed), t_newton = timed(lambda: newton_per_point(rows))
+    p_c_analytic, t_analytic = timed(lambda: np.array(
+        [characteristic_collapse_pressure_analytic(*row) for row in rows]))
+    p_c_vec, t_vec = timed(lambda: characteristic_collapse_pressure_vectorized(
+        D_o, t, p_el, p_p, O_0))
+    p_c_vec0, t_vec0 = timed(lambda: characteristic_collapse_pressure_vectorized(
+        D_o, t, p_el, p_p, O_0, polish=False))
+
+    print(f"p_c for N={N} geometries")
+    print(f"  scipy newton, per point      {t_newton:9.4f} s")
+    print(f"  closed form, per point       {t_analytic:9.4f} s")
+    print(f"  vectorized, closed form      {t_vec0:9.4f} s  ({t_newton/t_vec0:7.0f}x)")
+    print(f"  vectorized, Newton polished  {t_vec:9.4f} s  ({t_newton/t_vec:7.0f}x)")
+    print(f"  scipy newton failed to converge for {failed} points")
+    other_root = ~np.isclose(p_c_newton, p_c_analytic, rtol=1.e-6)
+    print(f"  scipy newton converged to another root for {other_root.sum()} points")
+    print(f"  max rel. difference vectorized vs closed form per point: "
+          f"{np.max(np.abs(p_c_vec - p_c_analytic) / p_c_analytic):.2e}")
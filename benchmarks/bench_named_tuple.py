@@ -0,0 +1,81 @@
+"""
+Microbenchmark: cost of building the result namedtuple of a calculation.
+
+Compares the original frame-inspecting `make_return_namedtuple` (which
+built a new namedtuple class on every call, reproduced below as
+`legacy_make_return_namedtuple`), the cached compatibility version, a
+precompiled `result_namedtuple` type and a plain tuple.
+
+    python benchmarks/bench_named_tuple.py
+"""
+from collections import namedtuple
+import inspect
+import timeit
+
+from pdover2t.util.named_tuple import make_return_namedtuple, result_namedtuple
+from pdover2t.DNVSTF101.propagation_buckling import local_buckling_propagation_all
+
+
+def legacy_make_return_namedtuple(field_names, typename=None):
+    if isinstance(field_names, str):
+        field_names = field_names.replace(',', ' ').split()
+    field_names = list(map(str, field_names))
+    if not typename:
+        typename = inspect.currentframe().f_back.f_code.co_name
+    func_locals = dict(inspect.currentframe().f_back.f_locals)
+    field_dict = {}
+    for _name in field_names:
+        field_dict[_name] = func_locals[_name]
+    retTuple = namedtuple(typename, field_names)
+    return retTuple(**field_dict)
+
+
+_fields = """D_over_t_check, p_pr, p_e, lb_prop_uty, lb_prop_check"""
+_result = result_namedtuple("bench_result", _fields)
+
+
+def f_legacy(a):
+    D_over_t_check, p_pr, p_e, lb_prop_uty, lb_prop_check = a, a+1, a+2, a+3, a+4
+    return legacy_make_return_namedtuple(_fields)
+
+
+def f_compat(a):
+    D_over_t_check, p_pr, p_e, lb_prop_uty, lb_prop_check = a, a+1, a+2, a+3, a+4
+    return make_return_namedtuple(_fields)
+
+
+def f_precompiled(a):
+    D_over_t_check, p_pr, p_e, lb_prop_uty, lb_prop_check = a, a+1, a+2, a+3, a+4
+    return _result(D_over_t_check, p_pr, p_e, lb_prop_uty, lb_prop_check)
+
+
+def f_tuple(a):
+    D_over_t_check, p_pr, p_e, lb_prop_uty, lb_prop_check = a, a+1, a+2, a+3, a+4
+    return (D_over_t_check, p_pr, p_e, lb_prop_uty, lb_prop_check)
+
+
+basecase = {
+    "D_o": 0.6096, "t_nom": 0.0159, "t_fab": 0.001, "t_corr": 0.0, "t_ero": 0.0,
+    "SMYS": 450.e6, "SMTS": 535.e6, "α_U": 0.96, "f_ytemp": 35.e6,
+    "α_fab": 0.93, "ρ_xwater": 1025., "h_l": -55.0, "γ_m": 1.15, "γ_SCLB": 1.14,
+}
+
+
+def bench(stmt, number):
+    best = min(timeit.repeat(stmt, number=number, repeat=5))
+    return best / number * 1.e6
+
+
+if __name__ == "__main__":
+    number = 20000
+    timings = [
+        ("legacy make_return_namedtuple", bench(lambda: f_legacy(1.0), number//10)),
+        ("cached make_return_namedtuple", bench(lambda: f_compat(1.0), number)),
+        ("precompiled result_namedtuple", bench(lambda: f_precompiled(1.0), number)),
+        ("plain tuple", bench(lambda: f_tuple(1.0), number)),
+    ]
+    print("result construction, µs/call")
+    for name, usec in timings:
+        print(f"  {name:32s} {usec:8.3f}  ({timings[0][1]/usec:6.1f}x)")
+    usec = bench(lambda: local_buckling_propagation_all(**basecase), number)
+    print(f"local_buckling_propagation_all, µs/call {usec:8.3f}")
@@ -2,7 +2,7 @@
 DNV Rules 1976 (1980)
 """
 from ..pipe.environment import external_water_pressure
-from ..util.named_tuple import make_return_namedtuple
+from ..util.named_tuple import result_namedtuple
 
 
 def barlow_hoop_stress(*, D_o, t_nom, p_i, p_e, **kwargs):
@@ -30,6 +30,8 @@ def pressure_contain_unity(σ_y, σ_yp):
 
 
 
+_pressure_containment_result = result_namedtuple("pressure_containment", """σ_hoop, unity""")
+
 def pressure_containment(*,
     t_nom, p_d, D_o,
     SMYS, Df=0.72, k_t=1.0, h_l, ρ_xwater,
@@ -38,7 +40,7 @@ def pressure_containment(*,
     σ_hoop = barlow_hoop_stress(D_o=D_o, t_nom=t_nom, p_i=p_d, p_e=p_e)
     σ_yp = allowable_hoop_stress(σ_f=SMYS, Dfactor=Df, k_t=k_t)
     unity = pressure_contain_unity(σ_hoop, σ_yp)
-    return make_return_namedtuple("""σ_hoop, unity""") 
+    return _pressure_containment_result(σ_hoop, unity)
 
 
 if __name__ == "__main__":
@@ -2,19 +2,12 @@
 """
 #import sys
 
-# Note: if using numpy, it _must_ be imported before PDover2t modules are imported
-from ..config import use_numpy
-
-#use_numpy = False
-if use_numpy:
-    import numpy as np
-    from numpy import sqrt, pi, abs as _abs, cos, acos
-    from scipy.optimize import newton
-else:
-    from math import sqrt, pi, cos, acos
-    _abs = abs
-
-from ..util.named_tuple import make_return_namedtuple
+import numpy as np
+from scipy.optimize import newton
+
+from ..util.backend import sqrt, pi, cos, acos, maximum, any_array
+from ..util.named_tuple import result_namedtuple
+from ..util.dual import gradient_option, implicit_root, is_dual
 from ..pipe.environment import external_water_pressure
 from ..pipe.material import characteristic_material_strength
 from ..pipe.pipe import characteristic_WT
@@ -22,8 +15,19 @@ from ..pipe.pipe import characteristic_WT
 
 
 
+def _as_column(x):
+    """Sequence inputs (e.g. lists read from a dataset) as float arrays."""
+    if isinstance(x, (list, tuple)):
+        return np.asarray(x, dtype=float)
+    return x
+
+
 def pipe_ovality(D, D_max=None, D_min=None) -> "O_0":
-    """Calculate pipe ovality.
+    """Calculate pipe ovality, not to be taken less than 0.005.
+
+    D, D_max, D_min may be arrays (e.g. measured joint diameters), in which
+    case the minimum is applied element-wise.
+
     Reference:
     DNVGL-ST-F101 (2017-12) 
         sec:5.4.4.2 eq:5.14 page:96 $O_0$
@@ -33,8 +37,7 @@ def pipe_ovality(D, D_max=None, D_min=None) -> "O_0":
     if D_min is None:
         D_min = D
     O_0 = (D_max - D_min) / D
-    if O_0 < 0.005:
-        O_0 = 0.005
+    O_0 = maximum(O_0, 0.005)
     return O_0
 
 
@@ -73,7 +76,7 @@ def characteristic_collapse_pressure(D_o, t_nom, p_el, p_p, O_0, p_c_0=10.e5):
         return (p_c-p_el)*(p_c**2-p_p**2) - p_c*p_el*p_p*O_0*D_o/t_nom
 
     def p_c_func_deriv(p_c, p_el, p_p, O_0, D_o, t_nom):
-        return 3*p_c**2 - 2*p_c*p_el - p_p**2 - p_el*p_p**O_0*D_o/t_nom
+        return 3*p_c**2 - 2*p_c*p_el - p_p**2 - p_el*p_p*O_0*D_o/t_nom
 
     p_c = newton(p_c_func, p_c_0, p_c_func_deriv, args=(p_el, p_p, O_0, D_o, t_nom))
     return p_c
@@ -97,6 +100,72 @@ def characteristic_collapse_pressure_analytic(D_o, t_nom, p_el, p_p, O_0):
     return p_c
 
 
+def collapse_pressure_residual(p_c, D_o, t_nom, p_el, p_p, O_0):
+    """Residual of the collapse pressure equation, zero at p_c.
+    Reference:
+    DNV-ST-F101 (2021-08) 
+        sec:5.4.4.2 eq:5.11 page:95 $p_c$
+    """
+    return (p_c-p_el)*(p_c**2-p_p**2) - p_c*p_el*p_p*O_0*D_o/t_nom
+
+
+def characteristic_collapse_pressure_vectorized(D_o, t_nom, p_el, p_p, O_0, 
+        polish=True, tol=1.e-12, maxiter=10):
+    """Calculate p_c for arrays of pipe geometries and materials.
+
+    Array-native solution of eq:5.11: the closed-form (trigonometric) root
+    of the cubic eq:13.10 for all N inputs in one pass, optionally polished
+    by vectorised Newton iterations on eq:5.11.
+
+    :param polish: apply Newton iterations to the closed-form solution
+    :param tol: relative step tolerance for the Newton polish
+    :param maxiter: maximum number of Newton iterations
+    :returns: p_c, array broadcast from the inputs
+
+    Reference:
+    DNV-ST-F101 (2021-08) 
+        sec:5.4.4.2 eq:5.11 page:95 $p_c$
+        sec:13.4.7 eq:13.10 page:292 $p_c$
+    """
+    D_o, t_nom, p_el, p_p, O_0 = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (D_o, t_nom, p_el, p_p, O_0)))
+    k = p_el * p_p * O_0 * D_o / t_nom
+    b = -p_el
+    c = -(p_p**2 + k)
+    d = p_el * p_p**2
+    u = 1/3 * (-1/3 * b**2 + c)
+    v = 1/2 * (2/27 * b**3 - 1/3 * b*c + d)
+    # clip round-off outside the domain of arccos
+    phi = np.arccos(np.clip(-v / np.sqrt(-u**3), -1.0, 1.0))
+    p_c = -2 * np.sqrt(-u) * np.cos(phi/3 + 60*pi/180) - 1/3 * b
+    if polish:
+        for _ in range(maxiter):
+            f = (p_c-p_el)*(p_c**2-p_p**2) - p_c*k
+            df = 3*p_c**2 - 2*p_c*p_el - p_p**2 - k
+            step = f / df
+            p_c = p_c - step
+            if np.all(np.abs(step) <= tol * np.abs(p_c)):
+                break
+    return p_c
+
+
+def characteristic_collapse_pressure_solve(D_o, t_nom, p_el, p_p, O_0):
+    """Calculate p_c with the solver for the input type: closed-form for
+    numbers, `characteristic_collapse_pressure_vectorized` for arrays, and
+    implicit differentiation of eq:5.11 for dual numbers (gradients).
+
+    Reference:
+    DNV-ST-F101 (2021-08) 
+        sec:5.4.4.2 eq:5.11 page:95 $p_c$
+    """
+    if is_dual(D_o, t_nom, p_el, p_p, O_0):
+        return implicit_root(characteristic_collapse_pressure_vectorized,
+                    collapse_pressure_residual, D_o, t_nom, p_el, p_p, O_0)
+    if any_array(D_o, t_nom, p_el, p_p, O_0):
+        return characteristic_collapse_pressure_vectorized(D_o, t_nom, p_el, p_p, O_0)
+    return characteristic_collapse_pressure_analytic(D_o, t_nom, p_el, p_p, O_0)
+
+
 def local_buckling_collapse_unity(p_e, p_min, p_c, γ_m, γ_SCLB):
     """Local buckling collapse unity check.
 
@@ -110,34 +179,68 @@ def local_buckling_collapse_unity(p_e, p_min, p_c, γ_m, γ_SCLB):
     return lbuck_collapse_uty
 
 
+def local_buckling_collapse_check(p_e, p_min, p_c, γ_m, γ_SCLB):
+    """Local buckling collapse check.
+
+    Reference:
+    DNV-ST-F101 (2021-08) 
+        sec:5.4.4.1 eq:5.12 p:92 
+    """
+    lb_collapse_check = (p_e - p_min) <= p_c / (γ_m * γ_SCLB)
+    return lb_collapse_check
+
+
+
 
 
 
+_local_buckling_collapse_all_result = result_namedtuple("local_buckling_collapse_all", """p_el, f_y, p_p, p_c, p_e, lb_collapse_uty, lb_collapse_check""")
 
+@gradient_option
 def local_buckling_collapse_all(*,
-    t_nom, D_o, ν, E, O_0, t_fab, t_corr, t_ero,
+    t_nom, D_o, ν, E, O_0=None, t_fab, t_corr, t_ero,
     SMYS, f_ytemp,
     ρ_xwater, h_l, p_min=0.0, 
     α_U, α_fab, γ_m, γ_SCLB,
+    D_max=None, D_min=None,
     **kwargs ):
+    """Local buckling, system collapse check.
+
+    Batch mode: any of the numeric inputs (`O_0`, `t_nom`, `h_l`, `D_o`,
+    `SMYS`, `p_min`, ...) may be columns (sequences or arrays), e.g. the joints of a linepipe inspection
+    dataset or points along the route; `lb_collapse_uty` and
+    `lb_collapse_check` are then returned as arrays from a single
+    vectorised pass.  With `wrt` (input names, e.g. `wrt=["t_nom", "h_l"]`)
+    the derivatives of the results are returned as well, see
+    `util.dual.with_gradients`.  If `O_0` is not given, it is calculated from the
+    measured diameters `D_max`, `D_min` with `pipe_ovality`.
+
+    Reference:
+    DNV-ST-F101 (2021-08) 
+        sec:5.4.4.1 eq:5.10 eq:5.12 p:92 
     """
-    """
+    (t_nom, D_o, ν, E, t_fab, t_corr, t_ero, SMYS, f_ytemp, ρ_xwater, h_l, p_min, 
+        α_U, α_fab, γ_m, γ_SCLB) = map(_as_column, (t_nom, D_o, ν, E, t_fab, t_corr, 
+        t_ero, SMYS, f_ytemp, ρ_xwater, h_l, p_min, α_U, α_fab, γ_m, γ_SCLB))
+    if O_0 is None:
+        O_0 = pipe_ovality(D_o, _as_column(D_max), _as_column(D_min))
+    O_0 = _as_column(O_0)
 
     t_1, _ = characteristic_WT(t_nom, t_fab, t_corr, t_ero)
     _t = t_1
     p_el = elastic_collapse_pressure(D_o, _t, E, ν)
     f_y = characteristic_material_strength(SMYS, α_U, f_ytemp=f_ytemp)
     p_p = plastic_collapse_pressure(D_o, _t, f_y, α_fab)
-    try:
-        p_c = characteristic_collapse_pressure(D_o, _t, p_el, p_p, O_0, p_c_0=p_p)
-    except NameError:   # NameError: name 'newton' is not defined (if not using numpy/scipy)
-        p_c = characteristic_collapse_pressure_analytic(D_o, _t, p_el, p_p, O_0)
+    # NOTE: Newton's method started from p_c_0=p_p can converge on the largest
+    # root of eq:5.11, use the closed-form (smallest root) solution instead
+    # p_c = characteristic_collapse_pressure(D_o, _t, p_el, p_p, O_0, p_c_0=p_p)
+    p_c = characteristic_collapse_pressure_solve(D_o, _t, p_el, p_p, O_0)
 
     p_e   = external_water_pressure(ρ_xwater, h_l=h_l)
     lb_collapse_uty = local_buckling_collapse_unity(p_e, p_min, p_c, γ_m, γ_SCLB)
-    lb_collapse_check = (p_e - p_min) <= p_c / (γ_m * γ_SCLB)  # DNV-ST-F101 eq:5.12 
+    lb_collapse_check = local_buckling_collapse_check(p_e, p_min, p_c, γ_m, γ_SCLB)  # DNV-ST-F101 eq:5.12 
 
-    return make_return_namedtuple("""p_el, f_y, p_p, p_c, p_e, lb_collapse_uty, lb_collapse_check""")
+    return _local_buckling_collapse_all_result(p_el, f_y, p_p, p_c, p_e, lb_collapse_uty, lb_collapse_check)
 
 
 
@@ -0,0 +1,307 @@
+"""
+Dependency graph evaluation of the DNV-ST-F101 checks.
+
+Each DNV quantity (`t_1`, `t_2`, `f_y`, `f_u`, `p_e`, `p_li`, ...) is a
+node of the graph, declared with the function that calculates it; the
+node inputs are the function parameter names, either load case inputs or
+other nodes.  Evaluating several limit states for a load case computes
+every node they need once, and shares it between the limit states, e.g.
+`f_y` for pressure containment, collapse and propagation buckling.
+`IncrementalEvaluation` keeps the node values of a load case, and
+recomputes only the nodes depending on changed inputs.
+
+>>> res = evaluate_limit_states(**basecase)
+>>> res["uty_p_li"], res["lb_collapse_uty"], res["lb_prop_uty"]
+"""
+from functools import lru_cache
+import inspect
+import logging
+
+import numpy as np
+
+from ..pipe.pipe import characteristic_WT
+from ..pipe.material import characteristic_material_strength
+from ..pipe.environment import external_water_pressure
+from .pressure_containment_bursting import (pressure_containment_resistance,
+    incidental_reference_pressure, local_incidental_pressure,
+    pressure_containment_resistance_unity, system_test_pressure,
+    local_test_pressure, local_test_pressure_unity, mill_test_pressure,
+    mill_test_pressure_unity, pressure_containment_limits, limit_unity_check)
+from .buckling_collapse import (pipe_ovality, elastic_collapse_pressure,
+    plastic_collapse_pressure, characteristic_collapse_pressure_solve,
+    local_buckling_collapse_unity, local_buckling_collapse_check)
+from .propagation_buckling import (propagating_pressure,
+    local_buckling_propagation_unity, local_buckling_propagation_check,
+    propagation_D_over_t_check)
+
+
+logger = logging.getLogger(__name__)
+
+# node name -> (function, input names)
+graph_nodes = {}
+
+# default values of optional load case inputs
+graph_defaults = {"f_ytemp": 0.0, "f_utemp": 0.0, "p_min": 0.0,
+                  "D_max": None, "D_min": None}
+
+
+def graph_node(name, inputs=None):
+    """Decorator registering a function as the graph node `name`; the node
+    inputs are the function parameter names (unless given)."""
+    def register(func):
+        _inputs = tuple(inputs or inspect.signature(func).parameters)
+        graph_nodes[name] = (func, _inputs)
+        evaluation_plan.cache_clear()
+        return func
+    return register
+
+
+@lru_cache(maxsize=256)
+def evaluation_plan(targets, given=()):
+    """Nodes to evaluate for `targets`, in dependency order, and the load
+    case inputs needed.
+
+    :param targets: tuple of node names
+    :param given: tuple of names supplied as inputs (nodes given as inputs
+        are not calculated)
+    :returns: tuple of node names, tuple of input names
+    """
+    order, inputs, visiting = [], [], set()
+    def visit(name):
+        if name in order or name in inputs:
+            return
+        if name in given or name not in graph_nodes:
+            inputs.append(name)
+            return
+        if name in visiting:
+            raise ValueError(f"evaluation_plan: circular dependency at node «{name}»")
+        visiting.add(name)
+        for dep in graph_nodes[name][1]:
+            visit(dep)
+        order.append(name)
+    for target in targets:
+        visit(target)
+    return tuple(order), tuple(inputs)
+
+
+def evaluate_nodes(targets, **loadcase):
+    """Evaluate graph nodes for a load case, every node once.
+
+    :param targets: node names to evaluate
+    :param loadcase: load case inputs; numbers or arrays (a node name given
+        as an input overrides the node)
+    :returns: dict of all evaluated node values (the targets and their
+        dependencies)
+    """
+    plan, inputs = evaluation_plan(tuple(targets), tuple(sorted(loadcase)))
+    values = {}
+    for name in inputs:
+        if name in loadcase:
+            value = loadcase[name]
+            values[name] = np.asarray(value, dtype=float) if isinstance(value, (list, tuple)) else value
+        elif name in graph_defaults:
+            values[name] = graph_defaults[name]
+        else:
+            raise TypeError(f"evaluate_nodes: missing load case input «{name}»")
+    for name in plan:
+        func, deps = graph_nodes[name]
+        values[name] = func(*[values[dep] for dep in deps])
+    return values
+
+
+# limit states, and the nodes reported for each
+limit_state_outputs = {
+    "pressure_containment": ("p_cont_res_uty", "p_lt_uty", "p_mpt_uty",
+        "uty_p_li", "check_p_li", "governing_p_li", "uty_p_lt", "check_p_lt",
+        "governing_p_lt"),
+    "collapse": ("p_c", "p_e", "lb_collapse_uty", "lb_collapse_check"),
+    "propagation": ("D_over_t_check", "p_pr", "lb_prop_uty", "lb_prop_check"),
+}
+
+
+def evaluate_limit_states(limit_states=("pressure_containment", "collapse", "propagation"),
+        **loadcase):
+    """Evaluate DNV-ST-F101 limit states for a load case, sharing the
+    intermediate quantities between them.
+
+    :param limit_states: keys of `limit_state_outputs`
+    :param loadcase: load case inputs, as for the check functions
+    :returns: dict of the limit state outputs and all intermediate values
+    """
+    targets = [node for ls in limit_states for node in limit_state_outputs[ls]]
+    return evaluate_nodes(targets, **loadcase)
+
+
+
+def _same_value(a, b):
+    if a is b:
+        return True
+    try:
+        return np.shape(a) == np.shape(b) and bool(np.array_equal(a, b))
+    except (TypeError, ValueError):
+        return False
+
+
+class IncrementalEvaluation:
+    """Load case evaluation that keeps the node values, and on `update`
+    recomputes only the nodes downstream of the changed inputs.
+
+    :param limit_states: limit states evaluated, keys of `limit_state_outputs`
+    :param targets: node names evaluated (instead of `limit_states`)
+    :param loadcase: load case inputs
+
+    >>> ev = IncrementalEvaluation(**basecase)
+    >>> ev.update(p_d=200.e5)  # p_b, p_e, f_y, ... are not recomputed
+    >>> ev["uty_p_li"]
+    """
+
+    def __init__(self, limit_states=("pressure_containment", "collapse", "propagation"),
+            targets=None, **loadcase):
+        if targets is None:
+            targets = [node for ls in limit_states for node in limit_state_outputs[ls]]
+        self.targets = tuple(targets)
+        self.inputs = {}
+        self.values = {}
+        self.recomputed = ()
+        self.update(**loadcase)
+
+    def __getitem__(self, name):
+        return self.values[name]
+
+    def __repr__(self):
+        return f"IncrementalEvaluation(targets={len(self.targets)}, nodes={len(self.values)})"
+
+    @property
+    def results(self):
+        """Dict of the target node values."""
+        return {name: self.values[name] for name in self.targets}
+
+    def update(self, **changes):
+        """Change load case inputs and recompute the affected nodes.
+
+        :param changes: changed load case inputs (unchanged values are ignored)
+        :returns: tuple of the recomputed node names
+        """
+        changes = {k: np.asarray(v, dtype=float) if isinstance(v, (list, tuple)) else v
+                   for k, v in changes.items()}
+        dirty = {k for k, v in changes.items()
+                 if k not in self.inputs or not _same_value(self.inputs[k], v)}
+        self.inputs.update(changes)
+        plan, inputs = evaluation_plan(self.targets, tuple(sorted(self.inputs)))
+        for name in inputs:
+            if name in self.inputs:
+                self.values[name] = self.inputs[name]
+            elif name in graph_defaults:
+                self.values.setdefault(name, graph_defaults[name])
+            else:
+                raise TypeError(f"IncrementalEvaluation: missing load case input «{name}»")
+        recomputed = []
+        for name in plan:
+            func, deps = graph_nodes[name]
+            if name in self.values and not dirty.intersection(deps):
+                continue
+            self.values[name] = func(*[self.values[dep] for dep in deps])
+            dirty.add(name)
+            recomputed.append(name)
+        self.recomputed = tuple(recomputed)
+        return self.recomputed
+
+
+# wall thickness, material and pressures ====================================
+# Reference: DNV-ST-F101 (2021-08) s:5.3.4.1 p:89 t:5-5
+@graph_node("t_1")
+def _t_1(t_nom, t_fab, t_corr, t_ero):
+    return characteristic_WT(t_nom, t_fab, t_corr, t_ero)[0]
+
+@graph_node("t_2")
+def _t_2(t_nom, t_fab, t_corr, t_ero):
+    return characteristic_WT(t_nom, t_fab, t_corr, t_ero)[1]
+
+@graph_node("t_min_mpt")
+def _t_min_mpt(t_nom, t_fab):
+    return characteristic_WT(t_nom, t_fab, t_corr=0.0, t_ero=0.0)[0]
+
+@graph_node("f_y")
+def _f_y(SMYS, α_U, f_ytemp):
+    return characteristic_material_strength(SMYS, α_U, f_ytemp=f_ytemp)
+
+@graph_node("f_u")
+def _f_u(SMTS, α_U, f_utemp):
+    return characteristic_material_strength(SMTS, α_U, f_ytemp=f_utemp)
+
+@graph_node("p_e")
+def _p_e(ρ_xwater, h_l):
+    return external_water_pressure(ρ_xwater, h_l=h_l)
+
+
+# pressure containment ======================================================
+graph_node("p_b", ("D_o", "t_1", "f_y", "f_u"))(pressure_containment_resistance)
+graph_node("p_inc")(incidental_reference_pressure)
+graph_node("p_li", ("p_inc", "ρ_cont_d", "h_l", "h_ref"))(local_incidental_pressure)
+graph_node("p_cont_res_uty")(pressure_containment_resistance_unity)
+graph_node("p_t")(system_test_pressure)
+graph_node("p_lt", ("p_t", "ρ_t", "h_l", "h_ref"))(local_test_pressure)
+graph_node("p_lt_uty")(local_test_pressure_unity)
+graph_node("p_mpt_uty")(mill_test_pressure_unity)
+
+@graph_node("p_mpt")
+def _p_mpt(D_o, t_min_mpt, SMYS, SMTS, α_U, α_mpt):
+    return mill_test_pressure(D_o, t_min_mpt, SMYS, SMTS, α_U, α_mpt, k=1.15)
+
+graph_node("pressure_containment_limits")(pressure_containment_limits)
+
+@graph_node("limits_p_li")
+def _limits_p_li(pressure_containment_limits):
+    return pressure_containment_limits.limits_p_li
+
+@graph_node("limit_check_p_li")
+def _limit_check_p_li(p_li, p_e, limits_p_li):
+    return limit_unity_check(p_li - p_e, limits_p_li)
+
+@graph_node("uty_p_li")
+def _uty_p_li(limit_check_p_li):
+    return limit_check_p_li.uty
+
+@graph_node("check_p_li")
+def _check_p_li(limit_check_p_li):
+    return limit_check_p_li.check
+
+@graph_node("governing_p_li")
+def _governing_p_li(limit_check_p_li):
+    return limit_check_p_li.governing
+
+@graph_node("limits_p_lt")
+def _limits_p_lt(pressure_containment_limits):
+    return pressure_containment_limits.limits_p_lt
+
+@graph_node("limit_check_p_lt")
+def _limit_check_p_lt(p_lt, p_e, limits_p_lt):
+    return limit_unity_check(p_lt - p_e, limits_p_lt)
+
+@graph_node("uty_p_lt")
+def _uty_p_lt(limit_check_p_lt):
+    return limit_check_p_lt.uty
+
+@graph_node("check_p_lt")
+def _check_p_lt(limit_check_p_lt):
+    return limit_check_p_lt.check
+
+@graph_node("governing_p_lt")
+def _governing_p_lt(limit_check_p_lt):
+    return limit_check_p_lt.governing
+
+
+# local buckling, collapse ==================================================
+graph_node("O_0", ("D_o", "D_max", "D_min"))(pipe_ovality)
+graph_node("p_el", ("D_o", "t_1", "E", "ν"))(elastic_collapse_pressure)
+graph_node("p_p", ("D_o", "t_1", "f_y", "α_fab"))(plastic_collapse_pressure)
+graph_node("p_c", ("D_o", "t_1", "p_el", "p_p", "O_0"))(characteristic_collapse_pressure_solve)
+graph_node("lb_collapse_uty")(local_buckling_collapse_unity)
+graph_node("lb_collapse_check")(local_buckling_collapse_check)
+
+
+# propagation buckling ======================================================
+graph_node("p_pr", ("D_o", "t_2", "f_y", "α_fab"))(propagating_pressure)
+graph_node("lb_prop_uty")(local_buckling_propagation_unity)
+graph_node("lb_prop_check")(local_buckling_propagation_check)
+graph_node("D_over_t_check", ("D_o", "t_2"))(propagation_D_over_t_check)
@@ -0,0 +1,322 @@
+"""
+Load case schema, validation and normalisation.
+
+The check functions take their inputs as keyword arguments and ignore
+keys they do not use, so a misspelled key (`SMYs`, `alpha_u`) silently
+falls back on a default or fails much later.  `validate_load_case`
+checks a whole batch of load cases once against `load_case_schema`:
+
+* unknown keys (with the closest schema names as suggestions),
+* duplicate keys, between input sources or ASCII/Greek spellings
+  (`alpha_U` and `α_U`),
+* numeric types, NaN/inf values and column lengths,
+* units (`units={"p_d": "bar"}` converts to SI) and plausible ranges,
+  which also catch values given in the wrong unit,
+* factor labels (`γ_SCPC="medium"`), resolved to values,
+* inputs required by the `entry_points` functions.
+
+The result is a frozen `LoadCase`: a read-only mapping of SI columns
+(read-only float arrays, or floats for scalar inputs) that is passed
+straight to the check functions, `func(**loadcase)`, with no further
+validation or conversion on the per-call path.
+"""
+from collections import namedtuple
+from collections.abc import Mapping
+import difflib
+import inspect
+import logging
+import re
+
+import numpy as np
+
+from ..pipe.factor import factor_tables, resolve_factor
+from ..util.greek_chars import greek_letters_map
+
+
+logger = logging.getLogger(__name__)
+
+
+ParamSpec = namedtuple("ParamSpec", ["unit", "low", "high", "factor"], defaults=(None, None, None, None))
+
+# SI unit of a parameter, plausible range (low, high), factor table for labels;
+# unit None: text (not validated)
+load_case_schema = {
+    # pipe geometry
+    "D_o": ParamSpec("m", 0.01, 5.0),
+    "t_nom": ParamSpec("m", 1.e-4, 0.5),
+    "t_fab": ParamSpec("m", 0.0, 0.05),
+    "t_corr": ParamSpec("m", 0.0, 0.05),
+    "t_ero": ParamSpec("m", 0.0, 0.05),
+    "t_corr_mill_test": ParamSpec("m", 0.0, 0.05),
+    "O_0": ParamSpec("-", 0.0, 0.1),
+    "D_max": ParamSpec("m", 0.01, 5.0),
+    "D_min": ParamSpec("m", 0.01, 5.0),
+    "coat_thk": ParamSpec("m", 0.0, 1.0),
+    "coat_ρ": ParamSpec("kg/m3", 0.0, 20000.),
+    "ρ_pipe": ParamSpec("kg/m3", 1000., 20000.),
+    # material
+    "SMYS": ParamSpec("Pa", 1.e8, 1.5e9),
+    "SMTS": ParamSpec("Pa", 1.e8, 2.e9),
+    "f_ytemp": ParamSpec("Pa", 0.0, 5.e8),
+    "f_utemp": ParamSpec("Pa", 0.0, 5.e8),
+    "E": ParamSpec("Pa", 1.e10, 5.e11),
+    "ν": ParamSpec("-", 0.0, 0.5),
+    "α_U": ParamSpec("-", 0.9, 1.0, "alpha_U"),
+    "α_U_spt": ParamSpec("-", 0.9, 1.0, "alpha_U"),
+    "α_fab": ParamSpec("-", 0.8, 1.0, "alpha_fab"),
+    "mill_test_k": ParamSpec("-", 0.5, 1.5),
+    # buckle arrestor
+    "t_BA": ParamSpec("m", 1.e-4, 0.5),
+    "L_BA": ParamSpec("m", 0.0, 100.),
+    "D_BA": ParamSpec("m", 0.01, 5.0),
+    "SMYS_BA": ParamSpec("Pa", 1.e8, 1.5e9),
+    "f_ytemp_BA": ParamSpec("Pa", 0.0, 5.e8),
+    "α_fab_BA": ParamSpec("-", 0.8, 1.0, "alpha_fab"),
+    # pressures, contents and environment
+    "p_d": ParamSpec("Pa", 1.e4, 2.e9),
+    "p_t": ParamSpec("Pa", 1.e4, 2.e9),
+    "p_min": ParamSpec("Pa", 0.0, 2.e9),
+    "γ_inc": ParamSpec("-", 1.0, 1.5),
+    "ρ_cont_d": ParamSpec("kg/m3", 0.0, 2500.),
+    "ρ_t": ParamSpec("kg/m3", 0.0, 2500.),
+    "ρ_xwater": ParamSpec("kg/m3", 990., 1100.),
+    "h_l": ParamSpec("m", -12000., 2000.),
+    "h_ref": ParamSpec("m", -12000., 2000.),
+    "LAT": ParamSpec("m", -100., 100.),
+    # safety factors
+    "γ_m": ParamSpec("-", 1.0, 1.5, "gamma_m"),
+    "γ_SCPC": ParamSpec("-", 1.0, 1.5, "gamma_SCPC"),
+    "γ_SCPC_pt": ParamSpec("-", 1.0, 1.5, "gamma_SCPC"),
+    "γ_SCLB": ParamSpec("-", 1.0, 1.5, "gamma_SCLB"),
+    "α_spt": ParamSpec("-", 1.0, 1.2, "alpha_spt"),
+    "α_mpt": ParamSpec("-", 1.0, 1.5, "alpha_mpt"),
+    # descriptive
+    "name": ParamSpec(),
+    "comment": ParamSpec(),
+    "NPS": ParamSpec(),
+}
+
+# unit: (SI unit, scale to SI)
+unit_scale = {
+    "m": ("m", 1.0), "mm": ("m", 1.e-3), "in": ("m", 0.0254), "km": ("m", 1.e3),
+    "Pa": ("Pa", 1.0), "kPa": ("Pa", 1.e3), "bar": ("Pa", 1.e5), "MPa": ("Pa", 1.e6),
+    "GPa": ("Pa", 1.e9), "psi": ("Pa", 6894.757293168), "ksi": ("Pa", 6894757.293168),
+    "kg/m3": ("kg/m3", 1.0), "g/cm3": ("kg/m3", 1.e3),
+    "-": ("-", 1.0), "%": ("-", 1.e-2),
+}
+
+# ASCII spelling of the Greek letters, e.g. alpha_U -> α_U
+_greek_words = {k: v for k, v in greek_letters_map.items() if k.islower()}
+_greek_words["rho"] = "ρ"
+_greek_words["nu"] = "ν"
+_greek_re = re.compile(r"^(%s)(?=_|$)" % "|".join(sorted(_greek_words, key=len, reverse=True)))
+
+
+def canonical_name(key):
+    """Schema spelling of a parameter name (`alpha_U` -> `α_U`)."""
+    return _greek_re.sub(lambda m: _greek_words[m.group(1)], key)
+
+
+class LoadCase(Mapping):
+    """Validated, frozen, columnar load case (see `validate_load_case`).
+
+    A read-only mapping of parameter name: value in SI units, a float for
+    scalar inputs or a read-only float array (N,) for columns; `size` is the
+    number of load cases N.
+    """
+
+    __slots__ = ("_columns", "size")
+
+    def __init__(self, columns, size):
+        object.__setattr__(self, "_columns", columns)
+        object.__setattr__(self, "size", size)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("LoadCase is read-only")
+
+    def __reduce__(self):
+        return (LoadCase, (self._columns, self.size))
+
+    def __repr__(self):
+        return f"LoadCase(size={self.size}, keys={list(self._columns)})"
+
+    def __len__(self):
+        return len(self._columns)
+
+    def __iter__(self):
+        return iter(self._columns)
+
+    def __contains__(self, key):
+        return key in self._columns
+
+    def __getitem__(self, key):
+        return self._columns[key]
+
+    def take(self, index):
+        """Subset of the load cases (a slice shares the column memory)."""
+        columns = {k: v[index] if isinstance(v, np.ndarray) else v
+                   for k, v in self._columns.items()}
+        size = len(range(*index.indices(self.size))) if isinstance(index, slice) \
+            else len(np.arange(self.size)[index])
+        return LoadCase(columns, size)
+
+    def replace(self, units=None, **changes):
+        """New LoadCase with `changes`, validating only the changed keys."""
+        new = validate_load_case(changes, units=units)
+        columns = dict(self._columns)
+        columns.update(new._columns)
+        return LoadCase(columns, _batch_size(columns))
+
+
+def _records_to_columns(records, errors):
+    keys = list(records[0]) if records else []
+    for ii, rec in enumerate(records):
+        if set(rec) != set(keys):
+            errors.append(f"load case {ii} keys differ from load case 0: "
+                          f"{sorted(set(rec) ^ set(keys))}")
+    return {k: [rec.get(k) for rec in records] for k in keys}
+
+
+def _sources(cases, errors):
+    """Input sources as dicts of columns."""
+    for case in cases:
+        if isinstance(case, Mapping):
+            yield case
+        elif isinstance(case, (list, tuple)) and all(isinstance(c, Mapping) for c in case):
+            yield _records_to_columns(list(case), errors)
+        else:
+            errors.append(f"load case input of type {type(case).__name__}, expected a mapping or a list of mappings")
+
+
+def _normalise(name, value, spec, unit, errors):
+    """SI value, float or read-only float array, of one parameter."""
+    if spec.unit is None:
+        return value
+    if spec.factor is not None:
+        labels = np.asarray(value, dtype=object) if isinstance(value, (list, tuple)) else value
+        labels = [v for v in np.ravel(labels).tolist() if isinstance(v, str)] \
+            if not isinstance(labels, str) else [labels]
+        table = factor_tables[spec.factor]
+        bad = {v for v in labels if v.replace(" ", "").upper() not in table}
+        if bad:
+            errors.append(f"«{name}»: unknown label(s) {sorted(bad)}, expected one of {sorted(table)}")
+            return None
+        if labels:
+            value = resolve_factor(spec.factor, value)
+    try:
+        arr = np.asarray(value, dtype=float)
+    except (TypeError, ValueError):
+        errors.append(f"«{name}»: not numeric ({value!r:.60})")
+        return None
+    if unit is not None:
+        si, scale = unit_scale.get(unit, (None, None))
+        if si != spec.unit:
+            errors.append(f"«{name}»: unit «{unit}» not convertible to «{spec.unit}»")
+            return None
+        arr = arr * scale
+    if not np.all(np.isfinite(arr)):
+        errors.append(f"«{name}»: NaN or infinite values")
+        return None
+    if np.any(arr < spec.low) or np.any(arr > spec.high):
+        errors.append(f"«{name}»: value(s) {np.min(arr):g}..{np.max(arr):g} outside the "
+                      f"range [{spec.low:g}, {spec.high:g}] {spec.unit} (wrong unit?)")
+        return None
+    if arr.ndim == 0:
+        return float(arr)
+    arr = np.ascontiguousarray(arr)
+    arr.flags.writeable = False
+    return arr
+
+
+def _batch_size(columns):
+    sizes = {np.shape(v)[0] for k, v in columns.items()
+             if isinstance(v, np.ndarray) and v.ndim > 0}
+    if len(sizes) > 1:
+        raise ValueError(f"validate_load_case: columns of different lengths {sorted(sizes)}")
+    return sizes.pop() if sizes else 1
+
+
+def _required(func):
+    params = inspect.signature(inspect.unwrap(func)).parameters.values()
+    return [p.name for p in params if p.default is inspect.Parameter.empty
+            and p.kind in (p.KEYWORD_ONLY, p.POSITIONAL_OR_KEYWORD)]
+
+
+def validate_load_case(*cases, units=None, entry_points=(), strict=True,
+        schema=None):
+    """Validate and normalise a batch of load cases, once.
+
+    :param cases: input sources, mappings of parameter: number or column
+        (dicts, `PipeSet`, `LoadCase`) or lists of per load case dicts;
+        the sources are merged and may not repeat a parameter
+    :param units: dict of parameter: unit (keys of `unit_scale`) of inputs
+        not given in SI units
+    :param entry_points: check functions the load case is for; their
+        required inputs must be present, and their other keyword parameters
+        are accepted
+    :param strict: raise on unknown keys (else they are dropped, with a
+        warning)
+    :param schema: parameter schema (default `load_case_schema`)
+    :returns: `LoadCase`
+    :raises ValueError: listing all the problems found
+
+    Example:
+    >>> case = validate_load_case(basecase, dict(h_l=np.linspace(-100., -1500., 1000)),
+    ...     units={"p_d": "bar"}, entry_points=[local_buckling_collapse_all])
+    >>> local_buckling_collapse_all(**case)
+    """
+    if (len(cases) == 1 and isinstance(cases[0], LoadCase) and not units
+            and not entry_points):
+        return cases[0]
+    schema = load_case_schema if schema is None else schema
+    units = {canonical_name(k): v for k, v in (units or {}).items()}
+    accepted = set(schema)
+    for func in entry_points:
+        accepted.update(p for p in inspect.signature(inspect.unwrap(func)).parameters
+                        if p not in ("args", "kwargs", "wrt"))
+    errors = []
+    merged = {}
+    origin = {}
+    for isrc, source in enumerate(_sources(cases, errors)):
+        for key, value in source.items():
+            name = canonical_name(key)
+            if name in merged:
+                where = "the same input" if origin[name][0] == isrc else f"inputs {origin[name][0]} and {isrc}"
+                errors.append(f"duplicate parameter «{name}» («{origin[name][1]}», «{key}») in {where}")
+                continue
+            merged[name] = value
+            origin[name] = (isrc, key)
+
+    columns = {}
+    for name, value in merged.items():
+        if name not in accepted:
+            close = difflib.get_close_matches(name, accepted, n=3, cutoff=0.6)
+            msg = f"unknown parameter «{origin[name][1]}»" + (
+                f", did you mean {', '.join('«%s»' % c for c in close)}?" if close else "")
+            if strict:
+                errors.append(msg)
+            else:
+                logger.warning("validate_load_case: %s (ignored)" % msg)
+            continue
+        spec = schema.get(name)
+        if spec is None:
+            # accepted by an entry point, not in the schema: numeric, no range
+            spec = ParamSpec("-", -np.inf, np.inf)
+        value = _normalise(name, value, spec, units.get(name), errors)
+        if value is not None:
+            columns[name] = value
+    for name in units:
+        if name not in merged:
+            errors.append(f"unit given for missing parameter «{name}»")
+    for func in entry_points:
+        missing = [p for p in _required(func) if p not in merged]
+        if missing:
+            errors.append(f"{func.__name__} requires {', '.join('«%s»' % p for p in missing)}")
+    if not errors:
+        try:
+            size = _batch_size(columns)
+        except ValueError as err:
+            errors.append(str(err).split(": ", 1)[1])
+    if errors:
+        raise ValueError("validate_load_case: " + "; ".join(errors))
+    return LoadCase(columns, size)
@@ -4,27 +4,14 @@
 from collections import namedtuple
 #import sys
 
-# https://stackoverflow.com/questions/30483246/how-can-i-check-if-a-module-has-been-imported
-# use_numpy = False
-# if use_numpy:
-#if use_numpy and "numpy" in sys.modules:
-#from .. import use_numpy
-
-from ..config import use_numpy
-#print(f"{__name__} {use_numpy=}")
-
-if use_numpy:
-    import numpy as np
-    from numpy import sqrt, abs as _abs
-    #_abs = np.abs
-else:
-    from math import sqrt
-    _abs = abs
+import numpy as np
 
+from ..util.backend import sqrt, absolute as _abs
 from ..pipe.pipe import pipe_Do_Di_WT, characteristic_WT
 from ..pipe.material import characteristic_material_strength
 from ..util.utils import min_nums_vectors
-from ..util.named_tuple import make_return_namedtuple
+from ..util.named_tuple import result_namedtuple
+from ..util.dual import gradient_option
 
 
 
@@ -243,6 +230,68 @@ def mill_test_pressure_unity(p_li, p_e, p_mpt):
 
 
 
+# governing limit labels, in the order the limits are stacked in
+# pressure_containment_bursting_check; the batch engine returns the index
+# into these tuples as its governing-limit code
+governing_p_li_labels = ("p_b", "p_lt", "p_mpt")
+governing_p_lt_labels = ("p_b", "p_mpt")
+
+
+def governing_limit(limits):
+    """Index of the governing (minimum) limit, element-wise.
+
+    :param limits: sequence of limit values (numbers or arrays, broadcast
+        against each other)
+    :returns: index into `limits` of the smallest limit; an integer array
+        for array input.  Ties resolve to the first limit, as list.index.
+    """
+    return np.argmin(np.stack(np.broadcast_arrays(*limits)), axis=0)
+
+
+_limit_unity_check_result = result_namedtuple("limit_unity_check", """uty, check, governing""")
+
+def limit_unity_check(delta_p, limits):
+    """Unity value, check and governing limit (index into `limits`) of a
+    pressure difference `delta_p` against the smallest of the `limits`.
+    """
+    min_limit = min_nums_vectors(limits)
+    return _limit_unity_check_result(delta_p / min_limit, delta_p <= min_limit, 
+                governing_limit(limits))
+
+
+def governing_limit_label(limits, labels):
+    """Label of the governing (minimum) limit, element-wise; a list of
+    labels for array input.
+    """
+    if all(isinstance(lim, (int, float)) for lim in limits):
+        return labels[limits.index(min(limits))]
+    return np.asarray(labels)[governing_limit(limits)].tolist()
+
+
+_pressure_containment_limits_result = result_namedtuple("pressure_containment_limits", """limits_p_li, limits_p_lt""")
+
+def pressure_containment_limits(p_e, p_b, p_lt, p_mpt, γ_m, γ_SCPC, α_spt, α_U, α_mpt):
+    """Pressure containment limits of the local incidental (eq:5.7) and
+    local test (eq:5.8) pressure differences.
+
+    :returns: namedtuple of the limit tuples `limits_p_li` and
+        `limits_p_lt`, ordered as `governing_p_li_labels` and
+        `governing_p_lt_labels`
+
+    Reference:
+        DNV-ST-F101 (2021-08) 
+        sec:5.4.2.1 eq:5.7 eq:5.8 p:90
+    """
+    limit_p_b   = p_b / (γ_m * γ_SCPC)
+    limit_p_lt  = p_lt / α_spt - p_e
+    limit_p_mpt = p_mpt * α_U / α_mpt
+    return _pressure_containment_limits_result((limit_p_b, limit_p_lt, limit_p_mpt), 
+                (limit_p_b, p_mpt))
+
+
+_pressure_containment_bursting_result = result_namedtuple("pressure_containment_bursting", """t_1, f_y, f_u, p_b, p_e, p_inc, p_li, p_mpt, p_t, p_lt, p_lt_uty, p_mpt_uty, p_cont_res_uty""")
+
+@gradient_option
 def pressure_containment_bursting(*,
     D_o, t_nom, t_fab, t_corr, t_ero,
     SMYS, SMTS, α_U, f_ytemp=0.0, f_utemp=0.0,
@@ -251,6 +300,9 @@ def pressure_containment_bursting(*,
     **kwargs
 ):
     """DNVSTF101_pressure_containment
+
+    With `wrt` (input names, e.g. `wrt=["t_nom", "p_d"]`) the derivatives
+    of the results are returned as well, see `util.dual.with_gradients`.
     """
     t_1, _ = characteristic_WT(t_nom, t_fab, t_corr, t_ero)
     f_y = characteristic_material_strength(SMYS, α_U, f_ytemp=f_ytemp)
@@ -274,8 +326,10 @@ def pressure_containment_bursting(*,
     p_mpt = mill_test_pressure(D_o, t_min_mill_test, SMYS, SMTS, α_U, α_mpt, k=1.15)
     p_mpt_uty = mill_test_pressure_unity(p_li, p_e, p_mpt)
 
-    return make_return_namedtuple("""t_1, f_y, f_u, p_b, p_e, p_inc, p_li, p_mpt, p_t, p_lt, p_lt_uty, p_mpt_uty, p_cont_res_uty""")
+    return _pressure_containment_bursting_result(t_1, f_y, f_u, p_b, p_e, p_inc, p_li, p_mpt, p_t, p_lt, p_lt_uty, p_mpt_uty, p_cont_res_uty)
+
 
+_pressure_containment_bursting_check_result = result_namedtuple("pressure_containment_bursting_check", """delta_p_li, limit_p_b, limit_p_lt, limit_p_mpt, check_p_li, governing_p_li, delta_p_lt, check_p_lt, governing_p_lt""")
 
 def pressure_containment_bursting_check(*, p_e, p_li, p_b, p_lt, p_mpt, γ_m, γ_SCPC, α_spt, α_U, α_mpt, **kwargs):
     """ Pressure containment bursting p_li check
@@ -285,70 +339,28 @@ def pressure_containment_bursting_check(*, p_e, p_li, p_b, p_lt, p_mpt, γ_m, γ
         sec:5.4.2.1 eq:5.7 eq:5.8 p:90
     
     """
+    limits_p_li, limits_p_lt = pressure_containment_limits(p_e, p_b, p_lt, p_mpt, 
+                                    γ_m, γ_SCPC, α_spt, α_U, α_mpt)
+    limit_p_b, limit_p_lt, limit_p_mpt = limits_p_li
+
     # DNV-ST-F101 eq:5.7
     delta_p_li  = p_li - p_e
-    limit_p_b   = p_b / (γ_m * γ_SCPC)
-    limit_p_lt  = p_lt / α_spt - p_e
-    limit_p_mpt = p_mpt * α_U / α_mpt
-    limits_p_li = (limit_p_b, limit_p_lt, limit_p_mpt)
     # if "numpy" in sys.modules:
     #     min_p_li = np.min( np.column_stack( np.broadcast_arrays(*limits_p_li) ), axis=1)
     # else:
     #     min_p_li = min(limits_p_li)
     min_p_li = min_nums_vectors(limits_p_li)
     check_p_li  = delta_p_li <= min_p_li  # DNV-ST-F101 eq:5.7
-    try:
-        idx_p_li = limits_p_li.index(min_p_li)
-        governing_p_li = ("p_b", "p_lt", "p_mpt")[idx_p_li]
-    except ValueError:
-        governing_p_li = []
-        for ii, val in enumerate(min_p_li):
-            try:
-                lim_p_b = limit_p_b[ii]
-            except TypeError:
-                lim_p_b = limit_p_b
-            try:
-                lim_p_lt = limit_p_lt[ii]
-            except (TypeError, IndexError):
-                lim_p_lt = limit_p_lt
-            try:
-                lim_p_mpt = limit_p_mpt[ii]
-            except TypeError:
-                lim_p_mpt = limit_p_mpt
-            idx_p_lt = [lim_p_b, lim_p_lt, lim_p_mpt].index(val)
-            governing_p_li.append(("p_b", "p_lt", "p_mpt")[idx_p_lt])
+    governing_p_li = governing_limit_label(limits_p_li, governing_p_li_labels)
 
     # DNV-ST-F101 eq:5.8
     delta_p_lt  = p_lt - p_e
-    limits_p_lt = (limit_p_b, p_mpt)
-    #min_p_lt = minimum(limits_p_lt)
-    # if "numpy" in sys.modules:
-    #     min_p_lt = np.min( np.column_stack( np.broadcast_arrays(*limits_p_lt) ), axis=1)
-    # else:
-    #     min_p_lt = min(limits_p_lt)
     min_p_lt = min_nums_vectors(limits_p_lt)
-    # print(f"{min_p_lt=}")
-    # print(f"{limits_p_lt=}")
     check_p_lt  = delta_p_lt <= min_p_lt  # DNV-ST-F101 eq:5.8
-    try:
-        idx_p_lt = limits_p_lt.index(min_p_lt)
-        governing_p_lt = ("p_b", "p_mpt")[idx_p_lt]
-    except ValueError:
-        governing_p_lt = []
-        for ii, val in enumerate(min_p_lt):
-            try:
-                lim_p_b = limit_p_b[ii]
-            except TypeError:
-                lim_p_b = limit_p_b
-            try:
-                lim_p_mpt = p_mpt[ii]
-            except TypeError:
-                lim_p_mpt = p_mpt
-            idx_p_lt = [lim_p_b, lim_p_mpt].index(val)
-            governing_p_lt.append(("p_b", "p_mpt")[idx_p_lt])
-        #governing_p_lt = [limits_p_lt.index(x) for x in min_p_lt]
-
-    return make_return_namedtuple("""delta_p_li, limit_p_b, limit_p_lt, limit_p_mpt, check_p_li, governing_p_li, delta_p_lt, check_p_lt, governing_p_lt""")
+    governing_p_lt = governing_limit_label(limits_p_lt, governing_p_lt_labels)
+
+    return _pressure_containment_bursting_check_result(delta_p_li, limit_p_b, limit_p_lt, limit_p_mpt, check_p_li, governing_p_li, delta_p_lt, check_p_lt, governing_p_lt)
+
 
     # retTuple = namedtuple('DNVSTF101PressureContainment', 't_1, f_y, f_u, p_inc, p_li')
     # return retTuple(t_1, f_y, f_u, p_inc, p_li)
@@ -362,6 +374,51 @@ def pressure_containment_bursting_check(*, p_e, p_li, p_b, p_lt, p_mpt, γ_m, γ
     # }
 
 
+_pressure_containment_bursting_batch_result = result_namedtuple("pressure_containment_bursting_batch", """p_cont_res_uty, p_lt_uty, p_mpt_uty, uty_p_li, check_p_li, governing_p_li, uty_p_lt, check_p_lt, governing_p_lt""")
+
+def pressure_containment_bursting_batch(**kwargs):
+    """Pressure containment bursting check for a batch of load cases.
+
+    Vectorised combination of `pressure_containment_bursting` and
+    `pressure_containment_bursting_check` for evaluating many load cases
+    (e.g. KP/elevation points along a route profile) in one pass.  Takes
+    the same keyword arguments; any of them may be a column (sequence or
+    array), scalars are broadcast against the columns.  There is no Python
+    loop over rows: the governing limits are found with an argmin over the
+    stacked limits.
+
+    :returns: namedtuple of arrays; unity values `p_cont_res_uty`,
+        `p_lt_uty`, `p_mpt_uty`, `uty_p_li` (eq:5.7), `uty_p_lt` (eq:5.8),
+        pass/fail masks `check_p_li`, `check_p_lt` and governing-limit codes
+        `governing_p_li`, `governing_p_lt` (indices into
+        `governing_p_li_labels` and `governing_p_lt_labels`).
+
+    Reference:
+        DNV-ST-F101 (2021-08) 
+        sec:5.4.2.1 eq:5.7 eq:5.8 p:90
+    """
+    columns = {k: np.asarray(v, dtype=float) if isinstance(v, (list, tuple)) else v
+                for k, v in kwargs.items()}
+    pc = pressure_containment_bursting(**columns)
+    γ_m, γ_SCPC = columns["γ_m"], columns["γ_SCPC"]
+    α_spt, α_U, α_mpt = columns["α_spt"], columns["α_U"], columns["α_mpt"]
+
+    limits_p_li, limits_p_lt = pressure_containment_limits(pc.p_e, pc.p_b, pc.p_lt, 
+                                    pc.p_mpt, γ_m, γ_SCPC, α_spt, α_U, α_mpt)
+
+    # DNV-ST-F101 eq:5.7
+    uty_p_li, check_p_li, governing_p_li = limit_unity_check(pc.p_li - pc.p_e, limits_p_li)
+    governing_p_li = governing_p_li.astype(np.int8)
+
+    # DNV-ST-F101 eq:5.8
+    uty_p_lt, check_p_lt, governing_p_lt = limit_unity_check(pc.p_lt - pc.p_e, limits_p_lt)
+    governing_p_lt = governing_p_lt.astype(np.int8)
+
+    results = np.broadcast_arrays(pc.p_cont_res_uty, pc.p_lt_uty, pc.p_mpt_uty, 
+                    uty_p_li, check_p_li, governing_p_li, uty_p_lt, check_p_lt, governing_p_lt)
+    return _pressure_containment_bursting_batch_result._make(map(np.ascontiguousarray, results))
+
+
 if __name__ == "__main__":
     from environment import still_water_level
     # use_numpy = use_numpy
@@ -401,7 +458,6 @@ if __name__ == "__main__":
 
         "α_spt": 1.05,  # DNVGL-ST-F101 (2017-12) p94gamma
         "α_mpt": 1.088,  # p94
-        "α_spt": 1.05,  # p94
         "γ_SCPC": 1.138,  # safety class resistance factor for pressure containment
         "γ_SCPC_pt": 1.046,  # safety class resistance factor for hydrotest
 
@@ -2,18 +2,15 @@
 
 """
 
-from ..config import use_numpy
+import numpy as np
 
-#use_numpy = False
-if use_numpy:
-    from numpy import exp
-else:
-    from math import exp
-
-from ..util.named_tuple import make_return_namedtuple
+from ..util.backend import exp
+from ..util.named_tuple import result_namedtuple
+from ..util.dual import gradient_option
 from ..pipe.pipe import characteristic_WT
 from ..pipe.material import characteristic_material_strength
 from ..pipe.environment import external_water_pressure
+from ..pipe.factor import gamma_m_map, gamma_SCLB_map
 
 
 
@@ -43,15 +40,43 @@ def local_buckling_propagation_unity(p_e, p_min, p_pr, γ_m, γ_SCLB):
     return lbuck_collapse_uty
 
 
+def local_buckling_propagation_check(p_e, p_min, p_pr, γ_m, γ_SCLB):
+    """Propagation buckling check.
+
+    Reference:
+    DNV-ST-F101 (2021-08) 
+        sec:5.4.5.2 eq:5.21 p:94 
+    """
+    lb_prop_check = (p_e - p_min) <= p_pr / (γ_m * γ_SCLB)
+    return lb_prop_check
+
+
+def propagation_D_over_t_check(D, t):
+    """Validity range of the propagating pressure, 15 < D/t <= 45.
+
+    Reference:
+    DNV-ST-F101 (2021-08) 
+        sec:5.4.5.1 eq:5.21 p:94 
+    """
+    D_over_t_check = (15.0 < D/t) & (D/t <= 45.0)
+    return D_over_t_check
+
+
+
 
+_local_buckling_propagation_all_result = result_namedtuple("local_buckling_propagation_all", """D_over_t_check, p_pr, p_e, lb_prop_uty, lb_prop_check""")
 
+@gradient_option
 def local_buckling_propagation_all(*, 
     D_o, t_nom, t_fab, t_corr, t_ero,
     SMYS, SMTS, α_U, f_ytemp=0.0, f_utemp=0.0,
     α_fab, ρ_xwater, h_l, p_min=0.0, 
     γ_m, γ_SCLB,
     **kwargs ):
-    """
+    """Propagation buckling check.
+
+    With `wrt` (input names, e.g. `wrt=["t_nom", "h_l"]`) the derivatives
+    of the results are returned as well, see `util.dual.with_gradients`.
 
     Reference:
         DNV-ST-F101 (2021-08) 
@@ -60,13 +85,13 @@ def local_buckling_propagation_all(*,
     _, t_2 = characteristic_WT(t_nom, t_fab, t_corr, t_ero)
     f_y = characteristic_material_strength(SMYS, α_U, f_ytemp=f_ytemp)
     # D_over_t_check = 15.0 < D_o/t_2 <= 45.0  # The truth value of an array with more than one element is ambiguous. Use a.any() or a.all()
-    D_over_t_check = (15.0 < D_o/t_2) & (D_o/t_2 <= 45.0)
+    D_over_t_check = propagation_D_over_t_check(D_o, t_2)
     p_pr = propagating_pressure(D_o, t_2, f_y, α_fab)
     p_e   = external_water_pressure(ρ_xwater, h_l=h_l)
     lb_prop_uty = local_buckling_propagation_unity(p_e, p_min, p_pr, γ_m, γ_SCLB)
-    lb_prop_check = (p_e - p_min) <= p_pr / (γ_m * γ_SCLB)  # DNV-ST-F101 eq:5.21 
+    lb_prop_check = local_buckling_propagation_check(p_e, p_min, p_pr, γ_m, γ_SCLB)  # DNV-ST-F101 eq:5.21 
 
-    return make_return_namedtuple("""D_over_t_check, p_pr, p_e, lb_prop_uty, lb_prop_check""")
+    return _local_buckling_propagation_all_result(D_over_t_check, p_pr, p_e, lb_prop_uty, lb_prop_check)
 
 
 
@@ -89,9 +114,100 @@ def buckle_arrestor_unity(p_e, p_x,
         sec:5.4.5.3 eq:5.22 p:95 
     """    
     if gamma_m is None:
-        gamma_m = factor.gamma_m_map[limit_state]
+        gamma_m = gamma_m_map(limit_state)
     if gamma_SCLB is None:
-        gamma_SCLB = factor.gamma_SCLB_map[SC]
+        gamma_SCLB = gamma_SCLB_map(SC)
     propbuck_arrestor_uty = p_e * 1.1 * gamma_m * gamma_SCLB / p_x
     return propbuck_arrestor_uty
 
+
+def buckle_arrestor_min_length(p_e, p_pr, p_prBA, D, t_2, γ_m, γ_SCLB):
+    """Minimum buckle arrestor length, eq:5.23 solved for `L_BA` with
+    the crossover pressure equal to the eq:5.22 limit.
+
+    :returns: `L_BA`; 0.0 where the pipe itself stops a running buckle,
+        NaN where the arrestor propagating pressure `p_prBA` is too low
+        for any arrestor length
+
+    Reference:
+        DNV-ST-F101 (2021-08) 
+        sec:5.4.5.3 eq:5.22 eq:5.23 p:95 
+    """
+    p_x_req = 1.1 * γ_m * γ_SCLB * p_e
+    with np.errstate(invalid="ignore", divide="ignore"):
+        ratio = (p_x_req - p_pr) / (p_prBA - p_pr)
+        L_BA = -D**2 / (20.0 * t_2) * np.log1p(-ratio)
+    L_BA = np.where(p_x_req <= p_pr, 0.0, L_BA)
+    return np.where((p_x_req > p_pr) & (p_x_req >= p_prBA), np.nan, L_BA)
+
+
+_buckle_arrestor_batch_result = result_namedtuple("buckle_arrestor_batch", """p_pr, p_prBA, p_x, p_e, ba_uty, ba_check, L_BA_min""")
+
+def buckle_arrestor_batch(*,
+    D_o, t_nom, t_fab, t_corr, t_ero,
+    SMYS, α_U, f_ytemp=0.0, α_fab,
+    t_BA, L_BA, D_BA=None, SMYS_BA=None, f_ytemp_BA=None, α_fab_BA=None,
+    ρ_xwater, h_l, γ_m, γ_SCLB,
+    **kwargs ):
+    """Buckle arrestor design check, for arrays of water depth `h_l`,
+    arrestor length `L_BA` and arrestor wall thickness `t_BA` in one pass.
+
+    The inputs are broadcast against each other, e.g. for screening all
+    combinations: `h_l[:,None,None]`, `L_BA[None,:,None]`,
+    `t_BA[None,None,:]`.  The arrestor material and diameter default to
+    those of the pipe.
+
+    :returns: namedtuple of arrays; `p_pr` pipe and `p_prBA` arrestor
+        propagating pressures, `p_x` crossover pressure, `p_e`, unity
+        `ba_uty` and check `ba_check` (eq:5.22), and `L_BA_min` the
+        minimum arrestor length (see `buckle_arrestor_min_length`)
+
+    Reference:
+        DNV-ST-F101 (2021-08) 
+        sec:5.4.5.3 eq:5.22 eq:5.23 p:95 
+    """
+    t_BA, L_BA, h_l = (np.asarray(x, dtype=float) if isinstance(x, (list, tuple)) else x 
+                       for x in (t_BA, L_BA, h_l))
+    D_BA = D_o if D_BA is None else D_BA
+    SMYS_BA = SMYS if SMYS_BA is None else SMYS_BA
+    f_ytemp_BA = f_ytemp if f_ytemp_BA is None else f_ytemp_BA
+    α_fab_BA = α_fab if α_fab_BA is None else α_fab_BA
+    _γ_m, _γ_SCLB = gamma_m_map(γ_m), gamma_SCLB_map(γ_SCLB)
+
+    _, t_2 = characteristic_WT(t_nom, t_fab, t_corr, t_ero)
+    _, t_2BA = characteristic_WT(t_BA, t_fab, t_corr, t_ero)
+    f_y = characteristic_material_strength(SMYS, α_U, f_ytemp=f_ytemp)
+    f_yBA = characteristic_material_strength(SMYS_BA, α_U, f_ytemp=f_ytemp_BA)
+    p_pr = propagating_pressure(D_o, t_2, f_y, α_fab)
+    p_prBA = propagating_pressure(D_BA, t_2BA, f_yBA, α_fab_BA)
+    p_x = crossover_pressure(p_pr, p_prBA, D_o, t_2, L_BA)
+    p_e = external_water_pressure(ρ_xwater, h_l=h_l)
+    ba_uty = buckle_arrestor_unity(p_e, p_x, gamma_m=_γ_m, gamma_SCLB=_γ_SCLB)
+    ba_check = ba_uty <= 1.0
+    L_BA_min = buckle_arrestor_min_length(p_e, p_pr, p_prBA, D_o, t_2, _γ_m, _γ_SCLB)
+
+    results = np.broadcast_arrays(p_pr, p_prBA, p_x, p_e, ba_uty, ba_check, L_BA_min)
+    return _buckle_arrestor_batch_result._make(results)
+
+
+def buckle_arrestor_band_length(h_l, L_BA_min, depth_bands):
+    """Minimum buckle arrestor length per water depth band, the maximum
+    `L_BA_min` of the points in each band.
+
+    :param h_l: elevations (or water depths) of the points
+    :param L_BA_min: minimum arrestor lengths, first axis along `h_l` (e.g.
+        `buckle_arrestor_batch(...).L_BA_min` with `t_BA` options on the
+        other axes)
+    :param depth_bands: band edges, increasing water depths; a point on an
+        edge belongs to the shallower band
+    :returns: array of `L_BA` per band (first axis); NaN if no arrestor
+        length is sufficient in a band, or if a band has no points
+    """
+    depth = np.abs(np.ravel(h_l))
+    L_BA_min = np.asarray(L_BA_min)
+    iband = np.digitize(depth, depth_bands, right=True) - 1
+    inside = (iband >= 0) & (iband < len(depth_bands) - 1)
+    L_BA = np.zeros((len(depth_bands) - 1,) + L_BA_min.shape[1:])
+    np.maximum.at(L_BA, iband[inside], L_BA_min[inside])
+    L_BA[np.bincount(iband[inside], minlength=len(L_BA)) == 0] = np.nan
+    return L_BA
@@ -0,0 +1,216 @@
+"""
+Structural reliability of the DNV-ST-F101 limit states by simulation.
+
+Random inputs (wall thickness, yield strength, ovality, pressures, ...)
+are given as distributions with a `ppf` method (e.g. frozen
+`scipy.stats` distributions).  Samples are generated in chunks, mapped
+through the distribution `ppf`, and the vectorised limit state functions
+g(x) (failure for g ≤ 0) are evaluated for a whole chunk at once.
+
+Sampling methods:
+    "mc"  plain Monte Carlo
+    "lhs" Latin hypercube (stratified per chunk)
+    "is"  importance sampling, standard normal sampling density shifted
+          towards the failure region (e.g. the design point)
+
+https://docs.scipy.org/doc/scipy/reference/stats.html
+"""
+import logging
+
+import numpy as np
+from scipy import stats
+
+from ..util.named_tuple import result_namedtuple
+from ..pipe.pipe import characteristic_WT
+from ..pipe.material import characteristic_material_strength
+from ..pipe.environment import external_water_pressure
+from .pressure_containment_bursting import (pressure_containment_resistance,
+    incidental_reference_pressure, local_incidental_pressure)
+from .buckling_collapse import local_buckling_collapse_all
+from .propagation_buckling import propagating_pressure
+
+
+logger = logging.getLogger(__name__)
+
+
+def burst_limit_state(*, D_o, t_nom, t_fab, t_corr, t_ero, SMYS, SMTS, α_U,
+        f_ytemp=0.0, f_utemp=0.0, p_d, γ_inc, ρ_cont_d, h_l, h_ref, ρ_xwater,
+        **kwargs):
+    """Burst limit state, pressure containment resistance less the local
+    incidental differential pressure, g = p_b - (p_li - p_e).
+
+    Reference:
+    DNV-ST-F101 (2021-08)
+        sec:5.4.2.1 eq:5.6 p:90
+    """
+    t_1, _ = characteristic_WT(t_nom, t_fab, t_corr, t_ero)
+    f_y = characteristic_material_strength(SMYS, α_U, f_ytemp=f_ytemp)
+    f_u = characteristic_material_strength(SMTS, α_U, f_ytemp=f_utemp)
+    p_b = pressure_containment_resistance(D_o, t_1, f_y, f_u)
+    p_li = local_incidental_pressure(incidental_reference_pressure(p_d, γ_inc),
+                                     ρ_cont_d, h_l, h_ref)
+    p_e = external_water_pressure(ρ_xwater, h_l=h_l)
+    return p_b - (p_li - p_e)
+
+
+def collapse_limit_state(*, p_min=0.0, **kwargs):
+    """Collapse limit state, g = p_c - (p_e - p_min).
+
+    Reference:
+    DNV-ST-F101 (2021-08)
+        sec:5.4.4.1 eq:5.10 p:92
+    """
+    ret = local_buckling_collapse_all(p_min=p_min, **kwargs)
+    return ret.p_c - (ret.p_e - p_min)
+
+
+def propagation_limit_state(*, D_o, t_nom, t_fab, t_corr, t_ero, SMYS, α_U,
+        f_ytemp=0.0, α_fab, ρ_xwater, h_l, p_min=0.0, **kwargs):
+    """Propagation buckling limit state, g = p_pr - (p_e - p_min).
+
+    Reference:
+    DNV-ST-F101 (2021-08)
+        sec:5.4.5.2 eq:5.21 p:94
+    """
+    _, t_2 = characteristic_WT(t_nom, t_fab, t_corr, t_ero)
+    f_y = characteristic_material_strength(SMYS, α_U, f_ytemp=f_ytemp)
+    p_pr = propagating_pressure(D_o, t_2, f_y, α_fab)
+    return p_pr - (external_water_pressure(ρ_xwater, h_l=h_l) - p_min)
+
+
+reliability_limit_states = {
+    "burst": burst_limit_state,
+    "collapse": collapse_limit_state,
+    "propagation": propagation_limit_state,
+}
+
+# smallest/largest probability passed to the distribution ppf
+_u_eps = 1.e-15
+
+
+def sample_uniform(method, nsamples, nvars, rng, shift=None):
+    """Samples in the unit hypercube, and their importance sampling weights.
+
+    :param method: "mc", "lhs" or "is"
+    :param shift: importance sampling shift, standard normal space
+    :returns: array (nsamples, nvars) of probabilities, array of weights
+        (None for "mc" and "lhs")
+    """
+    if method == "mc":
+        return rng.random((nsamples, nvars)), None
+    if method == "lhs":
+        strata = np.argsort(rng.random((nsamples, nvars)), axis=0)
+        return (strata + rng.random((nsamples, nvars))) / nsamples, None
+    if method == "is":
+        shift = np.zeros(nvars) if shift is None else np.asarray(shift, dtype=float)
+        z = rng.standard_normal((nsamples, nvars)) + shift
+        # density ratio φ(z)/φ(z - shift)
+        weights = np.exp(-z @ shift + 0.5 * shift @ shift)
+        return stats.norm.cdf(z), weights
+    raise ValueError(f"sample_uniform: unknown sampling method «{method}»")
+
+
+def _limit_state(limit_state):
+    if callable(limit_state):
+        return limit_state
+    return reliability_limit_states[limit_state]
+
+
+def _evaluate(g, names, distributions, u, loadcase):
+    u = np.clip(u, _u_eps, 1.0 - _u_eps)
+    sample = {name: dist.ppf(u[:, ii]) for ii, (name, dist)
+              in enumerate(zip(names, distributions))}
+    return np.asarray(g(**dict(loadcase, **sample)))
+
+
+def design_point_shift(limit_state, variables, nsamples=10000, scale=2.0,
+        seed=None, **loadcase):
+    """Estimate an importance sampling shift, the failing sample closest to
+    the origin of standard normal space in a pilot run with the sampling
+    standard deviation scaled by `scale`.
+
+    :returns: array, shift in standard normal space (None if no pilot sample
+        fails)
+    """
+    g = _limit_state(limit_state)
+    names = list(variables)
+    rng = np.random.default_rng(seed)
+    z = scale * rng.standard_normal((nsamples, len(names)))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        gval = _evaluate(g, names, variables.values(), stats.norm.cdf(z), loadcase)
+    failed = gval <= 0.0
+    if not np.any(failed):
+        logger.warning("design_point_shift: no failures in %d pilot samples" % nsamples)
+        return None
+    zf = z[failed]
+    return zf[np.argmin(np.einsum("ij,ij->i", zf, zf))]
+
+
+_failure_probability_result = result_namedtuple("failure_probability", """pf, ci_low, ci_high, cov, beta, nsamples, nfail""")
+
+def failure_probability(limit_state, variables, nsamples=10**6, method="mc",
+        chunksize=100000, seed=None, confidence=0.95, shift=None, **loadcase):
+    """Failure probability P[g(X) ≤ 0] of a limit state by simulation.
+
+    :param limit_state: key of `reliability_limit_states` ("burst",
+        "collapse", "propagation"), or a vectorised function g(**case)
+    :param variables: dict of input name: distribution (with a `ppf`
+        method, e.g. `scipy.stats.norm(0.0159, 0.0004)`)
+    :param nsamples: number of samples
+    :param method: "mc", "lhs" or "is"
+    :param chunksize: samples evaluated per vectorised call
+    :param confidence: confidence level of the interval
+    :param shift: importance sampling shift in standard normal space
+        (array, or dict by variable name; "auto" or None, estimated with
+        `design_point_shift`)
+    :param loadcase: deterministic inputs
+    :returns: namedtuple `pf`, confidence interval `ci_low`, `ci_high`,
+        coefficient of variation `cov` of the estimate, reliability index
+        `beta`, `nsamples`, `nfail` (number of failing samples)
+
+    Example:
+    >>> failure_probability("collapse", {"t_nom": stats.norm(0.0159, 0.0004),
+    ...     "SMYS": stats.lognorm(0.05, scale=470.e6), "O_0": stats.uniform(0.005, 0.01)},
+    ...     method="is", **basecase)
+    """
+    g = _limit_state(limit_state)
+    names = list(variables)
+    distributions = list(variables.values())
+    rng = np.random.default_rng(seed)
+    if method == "is":
+        if isinstance(shift, dict):
+            shift = [shift.get(name, 0.0) for name in names]
+        elif shift is None or isinstance(shift, str):
+            shift = design_point_shift(g, variables, seed=rng, **loadcase)
+        if shift is None:
+            method = "mc"
+
+    nfail = 0
+    sum_w = sum_w2 = 0.0
+    for start in range(0, nsamples, chunksize):
+        nchunk = min(chunksize, nsamples - start)
+        u, weights = sample_uniform(method, nchunk, len(names), rng, shift)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            failed = _evaluate(g, names, distributions, u, loadcase) <= 0.0
+        nfail += int(np.count_nonzero(failed))
+        if weights is not None:
+            w = weights[failed]
+            sum_w += float(np.sum(w))
+            sum_w2 += float(np.sum(w * w))
+
+    zq = stats.norm.ppf(0.5 + 0.5 * confidence)
+    if method == "is":
+        pf = sum_w / nsamples
+        std = np.sqrt(max(sum_w2 / nsamples - pf**2, 0.0) / nsamples)
+        ci_low, ci_high = max(pf - zq * std, 0.0), pf + zq * std
+    else:
+        pf = nfail / nsamples
+        std = np.sqrt(pf * (1.0 - pf) / nsamples)
+        # Wilson score interval
+        centre = (nfail + 0.5 * zq**2) / (nsamples + zq**2)
+        half = zq * np.sqrt(nsamples * pf * (1.0 - pf) + 0.25 * zq**2) / (nsamples + zq**2)
+        ci_low, ci_high = max(centre - half, 0.0), min(centre + half, 1.0)
+    cov = std / pf if pf > 0.0 else np.inf
+    beta = -stats.norm.ppf(pf) if pf > 0.0 else np.inf
+    return _failure_probability_result(float(pf), float(ci_low), float(ci_high),
+                float(cov), float(beta), nsamples, nfail)
@@ -0,0 +1,175 @@
+"""
+Streaming evaluation of DNV-ST-F101 checks along a route profile.
+
+Route survey files (KP, elevation, ...) are read in fixed-size chunks;
+each chunk is evaluated with the vectorised pressure containment, collapse
+and propagation buckling checks and the results are written out before
+the next chunk is read, so memory use does not depend on route length.
+
+https://pandas.pydata.org/docs/user_guide/io.html#iterating-through-files-chunk-by-chunk
+https://numpy.org/doc/stable/reference/generated/numpy.memmap.html
+"""
+import logging
+import os
+
+import numpy as np
+import pandas as pd
+
+from ..util.named_tuple import result_namedtuple
+from ..pipe.material import characteristic_strength_profile
+from .pressure_containment_bursting import pressure_containment_bursting_batch
+from .buckling_collapse import local_buckling_collapse_all
+from .propagation_buckling import local_buckling_propagation_all
+from .zoning import RouteZones
+
+
+logger = logging.getLogger(__name__)
+
+# checks that can be run on a route chunk, and the result fields written
+route_checks = {
+    "pressure_containment": (pressure_containment_bursting_batch,
+        ("p_cont_res_uty", "p_lt_uty", "p_mpt_uty", "uty_p_li", "check_p_li",
+         "governing_p_li", "uty_p_lt", "check_p_lt", "governing_p_lt")),
+    "collapse": (local_buckling_collapse_all,
+        ("p_c", "p_e", "lb_collapse_uty", "lb_collapse_check")),
+    "propagation": (local_buckling_propagation_all,
+        ("p_pr", "lb_prop_uty", "lb_prop_check")),
+}
+
+# fields summarised (max over the route) by evaluate_route_profile
+_unity_fields = ("uty_p_li", "uty_p_lt", "lb_collapse_uty", "lb_prop_uty")
+
+
+def read_route_chunks(filename, chunksize=100000, columns=None, dtype=None,
+        column_map=None, **kwargs):
+    """Read a route survey file in chunks.
+
+    :param filename: CSV file (`.csv`, `.txt`, read with pandas), NumPy
+        `.npy` file of a structured array (memory-mapped), or a raw binary
+        file of records (memory-mapped, `dtype` must be given)
+    :param chunksize: number of rows per chunk
+    :param columns: columns to read (default all)
+    :param dtype: structured dtype of the records in a raw binary file
+    :param column_map: rename columns, e.g. `{"elevation": "h_l"}`
+    :param kwargs: passed to `pandas.read_csv`
+    :returns: generator of dicts of column arrays
+    """
+    column_map = column_map or {}
+    ext = os.path.splitext(filename)[1].lower()
+    if ext in (".csv", ".txt"):
+        reader = pd.read_csv(filename, chunksize=chunksize, usecols=columns, **kwargs)
+        for df in reader:
+            yield {column_map.get(k, k): df[k].to_numpy() for k in df.columns}
+        return
+    if ext == ".npy":
+        records = np.load(filename, mmap_mode="r")
+    elif dtype is not None:
+        records = np.memmap(filename, dtype=dtype, mode="r")
+    else:
+        raise ValueError(f"read_route_chunks: «dtype» must be specified for binary file «{filename}».")
+    if records.dtype.names is None:
+        raise ValueError(f"read_route_chunks: file «{filename}» is not a structured array.")
+    names = columns or records.dtype.names
+    for start in range(0, len(records), chunksize):
+        block = records[start:start+chunksize]
+        yield {column_map.get(k, k): np.ascontiguousarray(block[k]) for k in names}
+
+
+def evaluate_route_chunk(chunk, checks=("pressure_containment", "collapse", "propagation"),
+        thermal=None, zones=None, **loadcase):
+    """Run the DNV-ST-F101 checks on one chunk of a route profile.
+
+    :param chunk: dict of column arrays, e.g. `KP`, `h_l`; columns override
+        the same-named load case parameters
+    :param checks: names of checks to run, keys of `route_checks`
+    :param thermal: temperature de-rating along the route, dict of
+        `characteristic_strength_profile` arguments (`material` and the
+        `temperature_profile` arguments); a `T` column in the chunk is used
+        instead of the profile.  `f_ytemp` and `f_utemp` are calculated from
+        `KP` and added to the results.
+    :param zones: safety class zones, `RouteZones` (or its `zones`
+        argument); the zone factors `γ_SCPC`, `γ_SCLB`, `α_mpt`, `α_spt`,
+        `γ_m` are looked up from `KP` and added to the results
+    :param loadcase: load case parameters common to the whole chunk
+    :returns: dict of result column arrays, the chunk columns first
+    """
+    nrows = len(next(iter(chunk.values())))
+    case = dict(loadcase, **chunk)
+    results = dict(chunk)
+    if thermal is not None:
+        sp = characteristic_strength_profile(chunk["KP"], case["SMYS"], case["SMTS"],
+                case["α_U"], T=chunk.get("T"), **thermal)
+        case.update(f_ytemp=sp.f_ytemp, f_utemp=sp.f_utemp)
+        results.update(T=sp.T, f_ytemp=sp.f_ytemp, f_utemp=sp.f_utemp)
+    if zones is not None:
+        if not isinstance(zones, RouteZones):
+            zones = RouteZones(zones)
+        zone_columns = zones.factors(chunk["KP"])
+        case.update(zone_columns)
+        results.update(zone_columns)
+    for name in checks:
+        func, fields = route_checks[name]
+        ret = func(**case)
+        for field in fields:
+            results[field] = np.broadcast_to(getattr(ret, field), (nrows,))
+    return results
+
+
+_route_profile_summary = result_namedtuple("evaluate_route_profile",
+        """nrows, nchunks, max_uty, nfail""")
+
+def evaluate_route_profile(filename, output, chunksize=100000,
+        checks=("pressure_containment", "collapse", "propagation"),
+        columns=None, dtype=None, column_map=None, thermal=None, zones=None,
+        **loadcase):
+    """Evaluate the DNV-ST-F101 checks along a route profile file.
+
+    The route file is streamed in chunks of `chunksize` rows (see
+    `read_route_chunks`) and the results of each chunk are appended to
+    `output` before the next chunk is read.
+
+    :param filename: route survey file
+    :param output: results file; `.csv` is written as CSV text, anything
+        else as raw binary records (the record dtype is logged)
+    :param thermal: temperature de-rating along the route, see
+        `evaluate_route_chunk`
+    :param zones: safety class zones, see `evaluate_route_chunk`
+    :param loadcase: load case parameters common to the whole route
+    :returns: namedtuple `nrows`, `nchunks`, `max_uty` (dict of the maximum
+        unity values over the route), `nfail` (dict of the number of rows
+        failing each check)
+
+    Example:
+    >>> evaluate_route_profile("route.csv", "results.csv",
+    ...     column_map={"elevation": "h_l"}, **basecase)
+    """
+    as_csv = os.path.splitext(output)[1].lower() == ".csv"
+    if zones is not None and not isinstance(zones, RouteZones):
+        zones = RouteZones(zones)
+    nrows = nchunks = 0
+    max_uty = {}
+    nfail = {}
+    with open(output, "w" if as_csv else "wb") as fh:
+        for chunk in read_route_chunks(filename, chunksize, columns=columns,
+                dtype=dtype, column_map=column_map):
+            results = evaluate_route_chunk(chunk, checks=checks, thermal=thermal,
+                            zones=zones, **loadcase)
+            nchunk = len(next(iter(results.values())))
+            if as_csv:
+                pd.DataFrame(results, copy=False).to_csv(fh, header=(nchunks==0),
+                    index=False, lineterminator="\n")
+            else:
+                records = np.empty(nchunk, dtype=[(k, v.dtype) for k, v in results.items()])
+                for k, v in results.items():
+                    records[k] = v
+                if nchunks == 0:
+                    logger.info("evaluate_route_profile: «%s» record dtype %s" % (output, records.dtype))
+                records.tofile(fh)
+            for field, values in results.items():
+                if field in _unity_fields:
+                    max_uty[field] = max(max_uty.get(field, -np.inf), float(np.max(values)))
+                elif field.startswith("check_") or field.endswith("_check"):
+                    nfail[field] = nfail.get(field, 0) + int(np.count_nonzero(~values))
+            nrows += nchunk
+            nchunks += 1
+    return _route_profile_summary(nrows, nchunks, max_uty, nfail)
@@ -0,0 +1,155 @@
+"""
+Wall thickness sizing to DNV-ST-F101.
+
+Solves for the minimum nominal wall thickness `t_nom` meeting all the
+selected limit state unity checks (unity ≤ 1), for many design points at
+once.  Each limit state unity decreases with `t_nom`, so the required
+thickness is found by vectorised bisection: every iteration is one
+batch evaluation of the check functions for all design points.
+"""
+import logging
+
+import numpy as np
+
+from ..util.named_tuple import result_namedtuple
+from .pressure_containment_bursting import pressure_containment_bursting_batch
+from .buckling_collapse import local_buckling_collapse_all
+from .propagation_buckling import local_buckling_propagation_all
+
+
+logger = logging.getLogger(__name__)
+
+
+def pressure_containment_sizing_uty(**case):
+    """Pressure containment unity, the greater of DNV-ST-F101 eq:5.7 and eq:5.8."""
+    pc = pressure_containment_bursting_batch(**case)
+    return np.maximum(pc.uty_p_li, pc.uty_p_lt)
+
+
+def collapse_sizing_uty(**case):
+    """Local buckling, system collapse unity, DNV-ST-F101 eq:5.10."""
+    return local_buckling_collapse_all(**case).lb_collapse_uty
+
+
+def propagation_sizing_uty(**case):
+    """Propagation buckling unity, DNV-ST-F101 eq:5.21."""
+    return local_buckling_propagation_all(**case).lb_prop_uty
+
+
+# limit states available for sizing, and their unity functions of the load case
+sizing_limit_states = {
+    "pressure_containment": pressure_containment_sizing_uty,
+    "collapse": collapse_sizing_uty,
+    "propagation": propagation_sizing_uty,
+}
+
+
+def _columns(loadcase):
+    return {k: np.asarray(v, dtype=float) if isinstance(v, (list, tuple)) else v
+            for k, v in loadcase.items()}
+
+
+def _unity(limit_state, t_nom, case):
+    with np.errstate(invalid="ignore", divide="ignore"):
+        uty = sizing_limit_states[limit_state](**dict(case, t_nom=t_nom))
+    return np.broadcast_to(uty, t_nom.shape)
+
+
+def required_wall_thickness(limit_state, *, t_lo, t_hi, shape=(), tol=1.e-6,
+        maxiter=60, **loadcase):
+    """Minimum nominal wall thickness for one limit state, by bisection.
+
+    :param limit_state: key of `sizing_limit_states`
+    :param t_lo: lower bound of the search interval
+    :param t_hi: upper bound of the search interval
+    :param shape: shape of the design point arrays
+    :param tol: thickness tolerance, the solution is within `tol` above the
+        exact required thickness
+    :param loadcase: load case parameters, numbers or columns
+    :returns: array of required `t_nom`; `t_lo` where `t_lo` is sufficient,
+        NaN where `t_hi` is not sufficient
+    """
+    case = _columns(loadcase)
+    lo = np.broadcast_to(np.asarray(t_lo, dtype=float), shape).copy()
+    hi = np.broadcast_to(np.asarray(t_hi, dtype=float), shape).copy()
+    ok_lo = _unity(limit_state, lo, case) <= 1.0
+    ok_hi = _unity(limit_state, hi, case) <= 1.0
+    for _ in range(maxiter):
+        if np.all(hi - lo <= tol):
+            break
+        mid = 0.5 * (lo + hi)
+        ok = _unity(limit_state, mid, case) <= 1.0
+        hi = np.where(ok, mid, hi)
+        lo = np.where(ok, lo, mid)
+    return np.where(ok_lo, t_lo, np.where(ok_hi, hi, np.nan))
+
+
+_wall_thickness_sizing_result = result_namedtuple("wall_thickness_sizing", """t_nom_req, governing, t_nom, uty""")
+
+def wall_thickness_sizing(*, catalogue=None,
+        limit_states=("pressure_containment", "collapse", "propagation"),
+        t_lo=None, t_hi=None, tol=1.e-6, maxiter=60, **loadcase):
+    """Minimum nominal wall thickness meeting all limit state checks.
+
+    Takes the same load case keyword arguments as the check functions,
+    any of them may be columns (one row per design point), except `t_nom`
+    which is solved for.
+
+    :param catalogue: standard wall thicknesses; the selected `t_nom` is the
+        thinnest catalogue thickness meeting all checks
+    :param limit_states: limit states to size for, keys of
+        `sizing_limit_states`; propagation buckling is often handled with
+        buckle arrestors instead, and can then be left out
+    :param t_lo: search interval lower bound (default `D_o`/100)
+    :param t_hi: search interval upper bound (default `D_o`/8)
+    :param tol: thickness tolerance of the bisection
+    :returns: namedtuple of arrays, `t_nom_req` required thickness,
+        `governing` governing limit state label, `t_nom` selected thickness
+        (`t_nom_req`, or the catalogue thickness), `uty` max unity at `t_nom`;
+        NaN thicknesses where no thickness up to `t_hi` (or in the catalogue)
+        meets the checks
+
+    Example:
+    >>> ret = wall_thickness_sizing(**dict(basecase, h_l=[-100., -500., -1500.]),
+    ...         catalogue=[0.0127, 0.0143, 0.0159, 0.0175, 0.0191, 0.0206, 0.0222])
+    """
+    loadcase.pop("t_nom", None)
+    case = _columns(loadcase)
+    shape = np.broadcast_shapes(*(np.shape(v) for v in case.values()
+                                  if isinstance(v, np.ndarray) and v.dtype.kind in "fiub"))
+    scalar = shape == ()
+    if scalar:
+        shape = (1,)
+    D_o = case["D_o"]
+    t_lo = D_o / 100.0 if t_lo is None else t_lo
+    t_hi = D_o / 8.0 if t_hi is None else t_hi
+
+    t_req = np.stack([required_wall_thickness(ls, t_lo=t_lo, t_hi=t_hi, shape=shape,
+                        tol=tol, maxiter=maxiter, **case) for ls in limit_states])
+    t_req = np.where(np.isnan(t_req), np.inf, t_req)
+    igov = np.argmax(t_req, axis=0)
+    governing = np.asarray(limit_states)[igov]
+    t_nom_req = np.max(t_req, axis=0)
+    t_nom_req[np.isinf(t_nom_req)] = np.nan
+
+    if catalogue is None:
+        t_nom = t_nom_req
+    else:
+        catalogue = np.unique(np.asarray(catalogue, dtype=float))
+        # first catalogue thickness at or above the bisection interval
+        idx = np.searchsorted(catalogue, np.nan_to_num(t_nom_req - tol, nan=np.inf))
+        t_cat = catalogue[np.minimum(idx, len(catalogue) - 1)]
+        ok = _max_unity(limit_states, t_cat, case) <= 1.0
+        idx = np.where(ok, idx, idx + 1)
+        t_nom = np.where(idx < len(catalogue), catalogue[np.minimum(idx, len(catalogue) - 1)], np.nan)
+    uty = _max_unity(limit_states, np.where(np.isnan(t_nom), t_hi, t_nom), case)
+    uty = np.where(np.isnan(t_nom), np.nan, uty)
+    ret = _wall_thickness_sizing_result(t_nom_req, governing, t_nom, uty)
+    if scalar:
+        return ret._make(x[0].item() for x in ret)
+    return ret
+
+
+def _max_unity(limit_states, t_nom, case):
+    t_nom = np.asarray(t_nom, dtype=float)
+    return np.max([_unity(ls, t_nom, case) for ls in limit_states], axis=0)
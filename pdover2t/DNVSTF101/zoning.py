@@ -0,0 +1,99 @@
+"""
+Safety class zoning along the pipeline route.
+
+A route is divided into KP intervals (e.g. zone 1, and zone 2 near a
+platform) with a safety class and limit state each.  The zone factors
+are resolved once per zone and expanded to factor arrays along the route
+through an interval index (`np.searchsorted` on the zone start KPs), so
+the DNV-ST-F101 checks run for the whole route in one vectorised call.
+
+Reference:
+DNVGL-ST-F101 (2017-12)
+    table:2.1 sec:2.4.3 page:31 (safety class)
+"""
+import logging
+
+import numpy as np
+
+from ..pipe.factor import (gamma_m_map, gamma_SCPC_map, gamma_SCLB_map,
+    alpha_mpt_map, alpha_spt_map)
+
+
+logger = logging.getLogger(__name__)
+
+# zone dependent factors, and the factor map resolving each from the
+# zone safety class (or limit state, for γ_m)
+zone_factor_maps = {
+    "γ_SCPC": gamma_SCPC_map,
+    "γ_SCLB": gamma_SCLB_map,
+    "α_mpt": alpha_mpt_map,
+    "α_spt": alpha_spt_map,
+    "γ_m": gamma_m_map,
+}
+
+
+class RouteZones:
+    """Safety class zones along a route, compiled to an interval index.
+
+    :param zones: zone intervals, sequence of `(KP_from, KP_to,
+        safety_class)` or `(KP_from, KP_to, safety_class, limit_state)`
+        tuples; zones must not overlap, a KP on a shared boundary belongs
+        to the following zone
+    :param default: safety class for KP outside all zones (default `None`,
+        KP outside the zones raise `ValueError`)
+    :param limit_state: limit state of zones without one (default "ULS")
+
+    >>> zones = RouteZones([(0.0, 0.5, "high"), (0.5, 24.5, "medium"),
+    ...                     (24.5, 25.0, "high")])
+    >>> zones.factors(KP)["γ_SCPC"]
+    """
+
+    def __init__(self, zones, default=None, limit_state="ULS"):
+        zones = sorted((tuple(z) + (limit_state,))[:4] for z in zones)
+        if default is not None:
+            zones.append((np.inf, np.inf, default, limit_state))
+        if not zones:
+            raise ValueError("RouteZones: no zones specified.")
+        KP_from, KP_to, safety_class, limit_states = zip(*zones)
+        self.KP_from = np.array(KP_from, dtype=float)
+        self.KP_to = np.array(KP_to, dtype=float)
+        if np.any(self.KP_to < self.KP_from) or np.any(self.KP_from[1:] < self.KP_to[:-1]):
+            raise ValueError(f"RouteZones: zones are overlapping or not valid intervals: {zones}")
+        self.safety_class = np.array(safety_class)
+        self.limit_state = np.array(limit_states)
+        self.default = default
+        self.zone_factors = {}
+        for factor, factor_map in zone_factor_maps.items():
+            labels = self.limit_state if factor == "γ_m" else self.safety_class
+            self.zone_factors[factor] = np.asarray(factor_map(labels), dtype=float)
+
+    def __len__(self):
+        return len(self.KP_from) - (self.default is not None)
+
+    def __repr__(self):
+        return f"RouteZones({len(self)} zones, default={self.default!r})"
+
+    def index(self, KP):
+        """Zone index of each KP (interval index lookup)."""
+        KP = np.asarray(KP, dtype=float)
+        idx = np.searchsorted(self.KP_from, KP, side="right") - 1
+        inside = (idx >= 0) & (KP <= self.KP_to[np.maximum(idx, 0)])
+        if self.default is not None:
+            return np.where(inside, idx, len(self.KP_from) - 1)
+        if not np.all(inside):
+            outside = np.asarray(KP)[~inside]
+            raise ValueError(f"RouteZones.index: KP not in any zone: {outside[:10]}")
+        return idx
+
+    def factors(self, KP):
+        """Zone factor arrays along the route.
+
+        :param KP: route positions
+        :returns: dict of factor arrays (keys of `zone_factor_maps`) and
+            the zone `safety_class` and `limit_state` labels
+        """
+        idx = self.index(KP)
+        columns = {factor: values[idx] for factor, values in self.zone_factors.items()}
+        columns["safety_class"] = self.safety_class[idx]
+        columns["limit_state"] = self.limit_state[idx]
+        return columns
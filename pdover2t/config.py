@@ -5,3 +5,6 @@ https://stackoverflow.com/questions/1977362/how-to-create-module-wide-variables-
 https://stackoverflow.com/questions/15959534/visibility-of-global-variables-in-imported-modules
 """
 use_numpy = False
+# NOTE: `use_numpy` is no longer read by the calculation modules; scalar
+# (math) or array (numpy) functions are selected per call from the argument
+# types, see pdover2t/util/backend.py.  Retained for backwards compatibility.
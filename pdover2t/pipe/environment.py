@@ -3,12 +3,7 @@
 from collections import namedtuple
 #import sys
 
-from ..config import use_numpy
-
-if use_numpy:
-    from numpy import abs as _abs
-else:
-    _abs = abs
+from ..util.backend import absolute as _abs
 
 
 
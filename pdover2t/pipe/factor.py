@@ -1,181 +1,160 @@
 """
+Safety and material factors from the DNVGL-ST-F101 tables.
+
+The factor tables are built once, at import; label lookups are cached.
+The `*_map` functions accept a number (returned as is), a label, or an
+array of labels (e.g. safety class per route segment), which is mapped to
+an array of factor values.
 """
+from functools import lru_cache
+import logging
+from math import sqrt
+
+import numpy as np
+
+
+logger = logging.getLogger(__name__)
+
+
+# factor tables, label -> value; the "DEFAULT" value is used for unrecognised labels
+factor_tables = {
+    # Reference: DNVGL-ST-F101 (2017-12) table:5.1 sec:5.3.2.3 page:87
+    "gamma_m": {"SLS": 1.15, "ULS": 1.15, "ALS": 1.15, "FLS": 1.00, 
+                "DEFAULT": 1.00},
+    # Reference: DNVGL-ST-F101 (2017-12) table:5.2 sec:5.3.2.4 page:88
+    "gamma_SCPC": {"LOW": 1.046, "MEDIUM": 1.138, "HIGH": 1.308, 
+                   "DEFAULT": 1.308},
+    "gamma_SCLB": {"LOW": 1.04, "MEDIUM": 1.14, "HIGH": 1.26, 
+                   "DEFAULT": 1.26},
+    # Reference: DNVGL-ST-F101 (2017-12) table:5.3 sec:5.3.3.6 page:90
+    # (supplementary requirement U, or P system pressure test)
+    "alpha_U": {"U": 1.00, "P": 1.00, "DEFAULT": 0.96},
+    # Reference: DNVGL-ST-F101 (2017-12) table:5.8 sec:5.4.2.1 page:94
+    "alpha_mpt": {"LOW": 1.000, "MEDIUM": 1.088, "HIGH": 1.251, 
+                  "DEFAULT": 1.251},
+    "alpha_spt": {"LOW": 1.03, "MEDIUM": 1.05, "HIGH": 1.05, 
+                  "DEFAULT": 1.05},
+    # Reference: DNVGL-ST-F101 (2017-12) table:5.4 sec:5.3.3.7 page:91
+    "alpha_fab": {"SEAMLESS": 1.0, "UO": 0.93, "TRB": 0.93, "ERW": 0.93, 
+                  "HFW": 0.93, "UOE": 0.85, "DEFAULT": 0.85},
+}
+
+# range of standard values, numeric factors outside the range are logged
+factor_ranges = {
+    "gamma_m": (1.00, 1.15),
+    "gamma_SCPC": (1.046, 1.308),
+    "gamma_SCLB": (1.04, 1.26),
+    "alpha_U": (0.96, 1.0),
+    "alpha_mpt": (1.000, 1.251),
+    "alpha_spt": (1.03, 1.05),
+    "alpha_fab": (0.85, 1.0),
+}
+
+
+@lru_cache(maxsize=1024)
+def factor_lookup(factor, label):
+    """Factor value for a (case and whitespace insensitive) label."""
+    table = factor_tables[factor]
+    return table.get(str(label).replace(" ", "").upper(), table["DEFAULT"])
+
+
+def resolve_factor(factor, value="default"):
+    """Resolve a factor specified as a number, a label, or an array of
+    numbers or labels.
+
+    :param factor: factor name, key of `factor_tables`
+    :param value: factor value or label(s)
+    :returns: factor value, or array of values for an array of labels
+    """
+    if isinstance(value, str):
+        return factor_lookup(factor, value)
+    if isinstance(value, (float, int)):
+        vmin, vmax = factor_ranges[factor]
+        if not vmin<=value<=vmax:
+            logger.warning("%s_map: check argument «%s»=%s non-standard value!" % (factor, factor, value))
+        return value
+    if isinstance(value, (list, tuple)) and len({isinstance(v, str) for v in value}) > 1:
+        value = np.array(value, dtype=object)  # keep numbers in a mixed list
+    value = np.asarray(value)
+    if value.dtype.kind in "fiu":
+        vmin, vmax = factor_ranges[factor]
+        if np.any((value < vmin) | (value > vmax)):
+            logger.warning("%s_map: check argument «%s» non-standard values!" % (factor, factor))
+        return value
+    if value.dtype.kind in "US":
+        labels, inverse = np.unique(value, return_inverse=True)
+        values = np.array([factor_lookup(factor, label) for label in labels.tolist()])
+        return values[inverse].reshape(value.shape)
+    # object array, mixed labels and numbers
+    return np.array([resolve_factor(factor, v) for v in value.ravel().tolist()],
+                    dtype=float).reshape(value.shape)
 
 
-# factor.py ========================================================================================
-# Reference: DNVGL-ST-F101 (2017-12) table:5.1 sec:5.3.2.3 page:87
 def gamma_m_map(gamma_m="default") -> "gamma_m":
     r"""Map value for material resistance factor, $\gamma_m$
     Reference: DNVGL-ST-F101 (2017-12) table:5.1 sec:5.3.2.3 page:87
     """
-    if isinstance(gamma_m, (float, int)):
-        if not 1.00<=gamma_m<=1.15:
-            logger.warning("gamma_m_map: check argument «gamma_m»=%d non-standard value!" % (gamma_m, ))
-        return gamma_m
-    elif gamma_m.upper() in ["SLS", "ULS", "ALS"]:
-        return 1.15
-    elif gamma_m.upper() == "FLS":
-        return 1.00
-    else:
-        return 1.00
-# gamma_m_map = {
-#     "SLS": 1.15,
-#     "ULS": 1.15,
-#     "ALS": 1.15,
-#     "FLS": 1.00,
-# }
-
-# Reference: DNVGL-ST-F101 (2017-12) table:5.2 sec:5.3.2.4 page:88
+    return resolve_factor("gamma_m", gamma_m)
+
+
 def gamma_SCPC_map(gamma_SCPC="default") -> "gamma_SCPC":
     r"""Map value for safety class resistance factor for 
     pressure containment, $\gamma_{SC,PC}$
     Reference: DNVGL-ST-F101 (2017-12) table:5.2 sec:5.3.2.4 page:88
     """
-    if isinstance(gamma_SCPC, (float, int)):
-        if not 1.046<=gamma_SCPC<=1.308:
-            logger.warning("gamma_SCPC_map: check argument «gamma_SCPC»=%d non-standard value!" % (gamma_SCPC, ))
-        return gamma_SCPC
-    elif gamma_SCPC.upper() == "HIGH":
-        return 1.308
-    elif gamma_SCPC.upper() == "MEDIUM":
-        return 1.138
-    elif gamma_SCPC.upper() == "LOW":
-        return 1.046
-    else:
-        return 1.308
-# gamma_SCPC_map = {
-#     "low": 1.046,
-#     "medium": 1.138,
-#     "high": 1.308,
-# }
+    return resolve_factor("gamma_SCPC", gamma_SCPC)
+
+
 def gamma_SCLB_map(gamma_SCLB="default") -> "gamma_SCLB":
     r"""Map value for safety class resistance factor for 
     local buckling, collapse and load controlled, $\gamma_{SC,LB}$
     Reference: DNVGL-ST-F101 (2017-12) table:5.2 sec:5.3.2.4 page:88
     """
-    if isinstance(gamma_SCLB, (float, int)):
-        if not 1.04<=gamma_SCLB<=1.26:
-            logger.warning("gamma_SCLB_map: check argument «gamma_SCLB»=%d non-standard value!" % (gamma_SCLB, ))
-        return gamma_SCLB
-    elif gamma_SCLB.upper() == "HIGH":
-        return 1.26
-    elif gamma_SCLB.upper() == "MEDIUM":
-        return 1.14
-    elif gamma_SCLB.upper() == "LOW":
-        return 1.04
-    else:
-        return 1.26
-# gamma_SCLB_map = {
-#     "low": 1.04,
-#     "medium": 1.14,
-#     "high": 1.26,
-# }
-
-# Reference: DNVGL-ST-F101 (2017-12) table:5.3 sec:5.3.3.6 page:90
+    return resolve_factor("gamma_SCLB", gamma_SCLB)
+
+
 def alpha_U_map(alpha_U="default", system_pressure_test=False,
                     supplementary_requirement=None):
-    """Map value for material strength factor, $\alpha_U$
+    r"""Map value for material strength factor, $\alpha_U$
     Reference: DNVGL-ST-F101 (2017-12) table:5.3 sec:5.3.3.6 page:90
     """
-    if isinstance(alpha_U, (float, int)):
-        if not 0.96<=alpha_U<=1.0:
-            logger.warning("alpha_U_map: check argument «alpha_U»=%d non-standard value!" % (alpha_U, ))
-        return alpha_U
-    elif system_pressure_test or supplementary_requirement.upper() in ["P", "U"]:
+    if isinstance(alpha_U, (float, int)) or np.asarray(alpha_U).dtype.kind in "fiu":
+        return resolve_factor("alpha_U", alpha_U)
+    if system_pressure_test:
         return 1.00
-    else:
-        return 0.96
-# alpha_U_map = {
-#     "normal": 1.00,
-#     "U": 1.00,
-#     "other": 0.96,
-#     "default": 0.96,
-# }
-
-# Reference: DNVGL-ST-F101 (2017-12) table:5.8 sec:5.4.2.1 page:94
+    if supplementary_requirement is not None:
+        return resolve_factor("alpha_U", supplementary_requirement)
+    return resolve_factor("alpha_U", alpha_U)
+
+
 def alpha_mpt_map(alpha_mpt="default", gamma_m=None, gamma_SCPC=None) -> "alpha_mpt":
-    """Map value for pressure test factor for
+    r"""Map value for pressure test factor for
     mill test pressure, $\alpha_{mpt}$
     Reference: DNVGL-ST-F101 (2017-12) table:5.8 sec:5.4.2.1 page:94
     """
     if isinstance(alpha_mpt, (float, int)):
-        if not 1.000<=alpha_mpt<=1.251:
-            logger.warning("alpha_mpt_map: check argument «alpha_mpt»=%d non-standard value!" % (alpha_mpt, ))
-        return alpha_mpt
-    elif gamma_m and gamma_SCPC:
+        return resolve_factor("alpha_mpt", alpha_mpt)
+    if gamma_m is not None and gamma_SCPC is not None:
         alpha_mpt = gamma_m * gamma_SCPC * 0.96 *(sqrt(3)/2)
-        logger.warning("alpha_mpt_map: calculating «alpha_mpt»=%d " % (alpha_mpt, ))
+        logger.warning("alpha_mpt_map: calculating «alpha_mpt»=%s " % (alpha_mpt, ))
         return alpha_mpt
-    elif alpha_mpt.upper() == "HIGH":
-        return 1.251
-    elif alpha_mpt.upper() == "MEDIUM":
-        return 1.088
-    elif alpha_mpt.upper() == "LOW":
-        return 1.000
-    else:
-        return 1.251
-# alpha_mpt_map = {
-#     "low": 1.000,
-#     "medium": 1.088,
-#     "high": 1.251,
-# }
-# def calc_alpha_mpt(gamma_m, gamma_SCPC):
-#     """Calculate pressure test factor alpha_mpt using DNVGL-ST-F101 formula.
-#     Reference:
-#     DNVGL-ST-F101 (2017-12) 
-#         table:5.8 sec:5.4.2.1 page:94
-#     """
-#     return gamma_m * gamma_SCPC * 0.96 *(math.sqrt(3)/2)
+    return resolve_factor("alpha_mpt", alpha_mpt)
+
 
 def alpha_spt_map(alpha_spt="default") -> "alpha_spt":
-    """Map value for pressure test factor for
+    r"""Map value for pressure test factor for
     system pressure test, $\alpha_{spt}$
     Reference: DNVGL-ST-F101 (2017-12) table:5.8 sec:5.4.2.1 page:94
     """
-    if isinstance(alpha_spt, (float, int)):
-        if not 1.03<=alpha_spt<=1.05:
-            logger.warning("alpha_spt_map: check argument «alpha_spt»=%d non-standard value!" % (alpha_spt, ))
-        return alpha_spt
-    elif alpha_spt.upper() == "HIGH":
-        return 1.05
-    elif alpha_spt.upper() == "MEDIUM":
-        return 1.05
-    elif alpha_spt.upper() == "LOW":
-        return 1.03
-    else:
-        return 1.05
-# alpha_spt_map = {
-#     "low": 1.03,
-#     "medium": 1.05,
-#     "high": 1.05,
-# }
-
-# Reference: DNVGL-ST-F101 (2017-12) table:5.4 sec:5.3.3.7 page:91
+    return resolve_factor("alpha_spt", alpha_spt)
+
+
 def alpha_fab_map(alpha_fab="default"):
-    """Reference: DNVGL-ST-F101 (2017-12) table:5.4 sec:5.3.3.7 page:91
+    r"""Map value for fabrication factor, $\alpha_{fab}$
+    Reference: DNVGL-ST-F101 (2017-12) table:5.4 sec:5.3.3.7 page:91
     """
-    if isinstance(alpha_fab, (float, int)):
-        if not 0.85<=alpha_fab<=1.0:
-            logger.warning("alpha_fab_map: check argument «alpha_fab»=%d non-standard value!" % (alpha_fab, ))
-        return alpha_fab
-    elif alpha_fab.upper() == "SEAMLESS":
-        return 1.0
-    elif alpha_fab.upper() in ["UO", "TRB", "ERW", "HFW"]:
-        return 0.93
-    elif alpha_fab.upper() == "UOE":
-        return 0.85
-    else:
-        return 0.85
-    
-# alpha_fab_map = {
-#     "seamless": 1.0,
-#     "UO": 0.93,
-#     "TRB": 0.93,
-#     "ERW": 0.93,
-#     "HFW": 0.93,
-#     "UOE": 0.85,
-#     "default": 0.85,
-# }
+    return resolve_factor("alpha_fab", alpha_fab)
+
 
 # def stab_gamma_SC_lookup(SC, soil_type):
 #     """lookup gamma_SC for on-bottom stability check.
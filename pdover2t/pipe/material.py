@@ -1,20 +1,15 @@
 """
 
 """
+from functools import lru_cache
 import logging
 import re
 #import sys
 
-from ..config import use_numpy
-
-#use_numpy = False
-if use_numpy:
-    import numpy as np
-    from numpy import sqrt
-else:
-    from math import sqrt
+import numpy as np
 
 from .factor import alpha_U_map
+from ..util.named_tuple import result_namedtuple
 
 
 logger = logging.getLogger(__name__)
@@ -57,15 +52,65 @@ def characteristic_material_strength(SMYS, α_U, material=None, T=None, f_ytemp=
     return (SMYS - f_ytemp) * _α_U
 
 
+# de-rating curve registry, material key -> ((T, f_ytemp), (T, f_utemp)) arrays
+derating_curves = {}
+
+
+@lru_cache(maxsize=256)
+def material_key(material):
+    """Normalised material name used as registry key, e.g. "C-Mn" -> "CMN".
+    """
+    return re.sub(r"\s|-", "", material).upper()
+
+
+def _compile_curve(curve):
+    xy = np.array(curve, dtype=float).T
+    if xy.ndim != 2 or xy.shape[0] != 2 or np.any(np.diff(xy[0]) <= 0.0):
+        raise ValueError(f"de-rating curve must be a list of (T, value) points with increasing T: {curve}")
+    return np.ascontiguousarray(xy[0]), np.ascontiguousarray(xy[1])
+
+
+@lru_cache(maxsize=64)
+def _compile_curve_cached(curve):
+    return _compile_curve(curve)
+
+
+def register_derating_curve(material, curve, curve_u=None):
+    """Register a material strength de-rating curve.
+
+    The curve is compiled to arrays once, and used by
+    `material_strength_derating` and `temperature_derating`.
+
+    :param material: material name (spaces, hyphens and case are ignored)
+    :param curve: yield strength de-rating curve f_ytemp, list of (T, value)
+        points with increasing T
+    :param curve_u: tensile strength de-rating curve f_utemp, (default the
+        same as `curve`)
+    """
+    curve_y = _compile_curve(curve)
+    curve_u = curve_y if curve_u is None else _compile_curve(curve_u)
+    derating_curves[material_key(material)] = (curve_y, curve_u)
+
+
+# Reference: DNVGL-ST-F101 (2017-12) fig:5.2 sec:5.3.3.4 page:90
+for _mat in ("CMn", "13Cr"):
+    register_derating_curve(_mat, [(50., 0.), (100., 30.e6), (200., 70.e6)])
+for _mat in ("22Cr", "25Cr", "DSS"):
+    register_derating_curve(_mat, [(20., 0.), (50., 40.e6), (100., 90.e6), 
+                                   (150., 120.e6), (200., 140.e6)])
+
+
 def material_strength_derating(T, material=None, curve=None):
     """Material strength de-rating value qith temperature, 
     according to DNVGL-ST-F101.
     
-    :param T: de-rating temperature 
+    :param T: de-rating temperature, number or array (e.g. a temperature
+     profile along the pipeline)
     :param material: material to be de-rated; 'CMn' for carbon-manganese steel,
-     or '22Cr' for duplex stainless steel; (material strength units: Pa)
+     or '22Cr' for duplex stainless steel, or a material added with
+     `register_derating_curve`; (material strength units: Pa)
     :param curve: de-rating curve, specified as a list of points (tuples)
-    :returns: de-rating value
+    :returns: de-rating value (array for array `T`)
 
     Reference:
     DNVGL-ST-F101 (2017-12) 
@@ -77,18 +122,99 @@ def material_strength_derating(T, material=None, curve=None):
     >>> mat_strength_derating(120, curve=[(40,0), (100,50), (200,100)])
     60.0
     """
-    if not curve:
-        #if material.replace(" ", "").replace("-", "").upper() in ["CMN", "13CR"]:
-        if re.sub(r"\s|-", "", material).upper() in ["CMN", "13CR"]:
-            curve = [(50., 0.), (100., 30.e6), (200., 70.e6) ]
-        elif re.sub(r"\s|-", "", material).upper() in ["22CR", "25CR", "DSS"]:
-            curve = [(20., 0.), (50., 40.e6), (100., 90.e6), (150., 120.e6), 
-                     (200., 140.e6) ]
-        else:
+    if curve:
+        x, y = _compile_curve_cached(tuple(map(tuple, curve)))
+    else:
+        try:
+            (x, y), _ = derating_curves[material_key(material)]
+        except (KeyError, TypeError):
             logger.error("mat_strength_derating: args not specified properly «material»=«%s», «curve»=«%s»" % (material,curve))
             return None 
-    xy = np.array( list(zip(*curve)) )
-    return np.interp(T, xy[0,:], xy[1,:])
+    return np.interp(T, x, y)
 
 
+_temperature_derating_result = result_namedtuple("temperature_derating", """f_ytemp, f_utemp""")
 
+def temperature_derating(T, material):
+    """Yield and tensile strength de-rating values, f_ytemp and f_utemp,
+    for a temperature or temperature profile `T`.
+
+    Reference:
+    DNVGL-ST-F101 (2017-12) 
+        fig:5.2 sec:5.3.3.4 page:90 f_ytemp, f_utemp
+    """
+    try:
+        curve_y, curve_u = derating_curves[material_key(material)]
+    except (KeyError, TypeError):
+        logger.error("temperature_derating: no de-rating curve for «material»=«%s»" % (material,))
+        raise ValueError(f"temperature_derating: no de-rating curve for material «{material}», "
+                         f"registered: {', '.join(sorted(derating_curves))}.") from None
+    f_ytemp = np.interp(T, *curve_y)
+    f_utemp = f_ytemp if curve_u is curve_y else np.interp(T, *curve_u)
+    return _temperature_derating_result(f_ytemp, f_utemp)
+
+
+def temperature_profile(KP, T_inlet=None, T_ambient=None, decay_length=None,
+        KP_inlet=0.0, table=None):
+    r"""Design temperature along the pipeline route.
+
+    Either tabulated, `table` a list of (KP, T) points (linear interpolation),
+    or an exponential decay from the inlet temperature towards the ambient
+    (seawater) temperature:
+
+    .. math::
+        T(KP) = T_{amb} + \left(T_{in} - T_{amb}\right) e^{-|KP - KP_{in}|/L}
+
+    :param KP: route position(s), number or array
+    :param T_inlet: inlet temperature $T_{in}$
+    :param T_ambient: ambient temperature $T_{amb}$
+    :param decay_length: decay length $L$ (same units as KP)
+    :param KP_inlet: position of the inlet
+    :param table: tabulated profile, points with increasing KP
+    :returns: temperature(s) at `KP`
+    """
+    if table is not None:
+        return np.interp(KP, *_compile_curve_cached(tuple(map(tuple, table))))
+    if T_inlet is None or T_ambient is None or not decay_length:
+        logger.error("temperature_profile: args not specified properly «T_inlet»=«%s», «T_ambient»=«%s», «decay_length»=«%s»" % (T_inlet, T_ambient, decay_length))
+        raise ValueError('temperature_profile: arguments not correctly specified.')
+    KP = np.asarray(KP, dtype=float)
+    return T_ambient + (T_inlet - T_ambient) * np.exp(-np.abs(KP - KP_inlet) / decay_length)
+
+
+_characteristic_strength_profile_result = result_namedtuple("characteristic_strength_profile", """T, f_ytemp, f_utemp, f_y, f_u""")
+
+def characteristic_strength_profile(KP, SMYS, SMTS, α_U, material, T=None, **profile):
+    """Characteristic material strength along the pipeline route,
+    in one pass for all route positions.
+
+    :param KP: route positions, array
+    :param T: temperatures at `KP` (if not given, calculated with
+        `temperature_profile` from the `profile` arguments)
+    :param profile: `temperature_profile` arguments, `T_inlet`, `T_ambient`,
+        `decay_length`, `KP_inlet` or `table`
+    :returns: namedtuple of arrays `T`, `f_ytemp`, `f_utemp`, `f_y`, `f_u`;
+        `f_ytemp` and `f_utemp` can be passed directly to the check
+        functions (e.g. `pressure_containment_bursting_batch`,
+        `local_buckling_collapse_all`) with `KP` as a column.
+
+    Reference:
+    DNVGL-ST-F101 (2017-12) 
+        eq:5.4 sec:5.3.3.2 page:89 f_y
+        eq:5.5 sec:5.3.3.2 page:89 f_u
+        fig:5.2 sec:5.3.3.4 page:90 f_ytemp, f_utemp
+
+    Example:
+    >>> sp = characteristic_strength_profile(KP, 450.e6, 535.e6, 0.96, "CMn",
+    ...         T_inlet=120., T_ambient=4., decay_length=8000.)
+    >>> pressure_containment_bursting_batch(**dict(basecase, KP=KP, 
+    ...         f_ytemp=sp.f_ytemp, f_utemp=sp.f_utemp))
+    """
+    if T is None:
+        T = temperature_profile(KP, **profile)
+    T = np.broadcast_to(np.asarray(T, dtype=float), np.shape(KP))
+    f_ytemp, f_utemp = temperature_derating(T, material)
+    _α_U = alpha_U_map(α_U)
+    f_y = (SMYS - f_ytemp) * _α_U
+    f_u = (SMTS - f_utemp) * _α_U
+    return _characteristic_strength_profile_result(T, f_ytemp, f_utemp, f_y, f_u)
@@ -1,13 +1,10 @@
 from collections import namedtuple
 import logging
 
-from ..config import use_numpy
-if use_numpy:
-    from numpy import pi
-else:
-    from math import pi
+import numpy as np
 
-from ..util.named_tuple import make_return_namedtuple, isinstance_namedtuple
+from ..util.backend import pi
+from ..util.named_tuple import result_namedtuple, isinstance_namedtuple
 
 logger = logging.getLogger(__name__)
 
@@ -16,9 +13,29 @@ pipeCoatLayer = namedtuple("PipeCoatLayer", ["thickness", "density", "name"])
 
 
 class PipeCoat:
+    """Coating stack, list of `pipeCoatLayer`, innermost layer first."""
+
+    __slots__ = ("layers",)
+
     def __init__(self, layers):
         self.layers = layers
 
+    @classmethod
+    def from_arrays(cls, thickness, density, names=None):
+        """PipeCoat from layer thickness and density arrays (zero thickness
+        padding layers are dropped)."""
+        names = [""] * len(thickness) if names is None else names
+        return cls([pipeCoatLayer(float(t), float(ρ), name)
+                    for t, ρ, name in zip(thickness, density, names) if t > 0.0])
+
+    @property
+    def thickness(self):
+        return np.array([layer.thickness for layer in self.layers], dtype=float)
+
+    @property
+    def density(self):
+        return np.array([layer.density for layer in self.layers], dtype=float)
+
 
 def pipe_Do_Di_WT(*, Do=None, Di=None, WT=None):
     """Calculate pipe wall thickness / outer diameter / inner diameter.
@@ -45,6 +62,8 @@ def tubular_linear_mass(CSA, ρ):
     return CSA * ρ
 
 
+_tubular_properties_result = result_namedtuple("tubular_properties", """CSA, mass_ld, mass""")
+
 def tubular_properties(Do, WT, ρ, length=None, ρ_xwater=None):
     """
     https://en.wikipedia.org/wiki/Linear_density
@@ -61,20 +80,29 @@ def tubular_properties(Do, WT, ρ, length=None, ρ_xwater=None):
     # else:
     #     linear_buoyancy = None
     #     sub_linear_ρ = None
-    return make_return_namedtuple("""CSA, mass_ld, mass""")
+    return _tubular_properties_result(CSA, mass_ld, mass)
+
 
 
 
+_linepipe_properties_result = result_namedtuple("linepipe_properties", """CSA, mass_ld, mass""")
+_linepipe_properties_inputs_result = result_namedtuple("linepipe_properties", """D_o, t_nom, ρ_pipe, CSA, mass_ld, mass""")
 
 def linepipe_properties(*, D_o, t_nom, ρ_pipe, joint_length=12.2, ρ_xwater, retInputs=False, **kwargs):
-    retItems = ["D_o", "t_nom", "ρ_pipe"] if retInputs else []
     CSA, mass_ld, mass = tubular_properties(D_o, t_nom, ρ_pipe, joint_length, ρ_xwater)
-    retItems.extend(["CSA", "mass_ld", "mass"])  # """CSA, mass_ld, mass"""
-    return make_return_namedtuple(retItems)
+    if retInputs:
+        return _linepipe_properties_inputs_result(D_o, t_nom, ρ_pipe, CSA, mass_ld, mass)
+    return _linepipe_properties_result(CSA, mass_ld, mass)
 
 
+_pipeline_properties_result = result_namedtuple("pipeline_properties", """D_o, mass_ld, D_buoy, buoy_ld, submass_ld""")
+
 def pipeline_properties(*, coat=None, D_o=None, mass_ld=None, lp_props=None, ρ_xwater, **kwargs):
-    """
+    """Coated pipeline properties.
+
+    The coating is either `coat`, a `PipeCoat` or list of `pipeCoatLayer`,
+    or the `coat_thk`, `coat_ρ` layer arrays (e.g. from a `PipeSet` passed
+    as `**pipes`), see `pipeline_properties_batch`.
     """
     # if lp_props and isinstance_namedtuple(lp_props, "linepipe_properties"):
     #     for varname, value in lp_props._asdict():
@@ -83,6 +111,13 @@ def pipeline_properties(*, coat=None, D_o=None, mass_ld=None, lp_props=None, ρ_
         if D_o is None and "D_o" in lp_props._fields: D_o = lp_props.D_o
         if mass_ld is None and "mass_ld" in lp_props._fields: mass_ld = lp_props.mass_ld
     #_do = D_o
+    if kwargs.get("coat_thk") is not None:
+        if coat:
+            raise ValueError("pipeline_properties: specify one of «coat», «coat_thk».")
+        if kwargs.get("coat_ρ") is None:
+            raise ValueError("pipeline_properties: «coat_thk» specified without «coat_ρ».")
+        return pipeline_properties_batch(D_o=D_o, mass_ld=mass_ld, coat_thk=kwargs["coat_thk"],
+                    coat_ρ=kwargs["coat_ρ"], ρ_xwater=ρ_xwater)
     if coat:
         if isinstance(coat, (list, tuple)) and isinstance_namedtuple(coat[0], typename="PipeCoatLayer"):
             _coat = coat
@@ -94,11 +129,97 @@ def pipeline_properties(*, coat=None, D_o=None, mass_ld=None, lp_props=None, ρ_
             _di = D_o
             D_o = _di + 2.0 * thk
             _CSA, _massld, _ = tubular_properties(D_o, thk, density)
-            mass_ld +=  _massld
+            mass_ld = mass_ld + _massld
     D_buoy = D_o
     buoy_ld = pi / 4.0 *D_buoy*D_buoy * ρ_xwater
     submass_ld = mass_ld - buoy_ld
-    return make_return_namedtuple(["D_o","mass_ld", "D_buoy", "buoy_ld", "submass_ld"])
+    return _pipeline_properties_result(D_o, mass_ld, D_buoy, buoy_ld, submass_ld)
+
+
+def pipeline_properties_batch(*, D_o, mass_ld, coat_thk, coat_ρ, ρ_xwater, **kwargs):
+    """Coated pipeline properties for N configurations in one pass.
+
+    Array version of `pipeline_properties`: the coating layer diameters
+    are the cumulative sum of the layer thicknesses, and the layer masses
+    are summed over the layer axis, without a Python loop over layers or
+    configurations.
+
+    :param D_o: steel pipe outer diameter, number or array (N,)
+    :param mass_ld: steel pipe (and contents) linear mass, number or array (N,)
+    :param coat_thk: layer thicknesses, array (N, L) (or (L,)), innermost
+        layer first; pad with zero thickness for fewer layers, a bare pipe
+        has an empty layer axis (N, 0)
+    :param coat_ρ: layer densities, broadcast against `coat_thk`
+    :param ρ_xwater: external water density
+    :returns: namedtuple of arrays, as `pipeline_properties`
+    """
+    coat_thk = np.asarray(coat_thk, dtype=float)
+    coat_ρ = np.asarray(coat_ρ, dtype=float)
+    D_o = np.asarray(D_o, dtype=float)
+    # layer outer diameters, D_o + 2*(cumulative thickness)
+    D_layer = D_o[..., None] + 2.0 * np.cumsum(coat_thk, axis=-1)
+    layer_mass_ld = pi * (D_layer - coat_thk) * coat_thk * coat_ρ
+    mass_ld = mass_ld + layer_mass_ld.sum(axis=-1)
+    D_buoy = D_o + 2.0 * coat_thk.sum(axis=-1)
+    buoy_ld = pi / 4.0 *D_buoy*D_buoy * ρ_xwater
+    submass_ld = mass_ld - buoy_ld
+    return _pipeline_properties_result(D_buoy, mass_ld, D_buoy, buoy_ld, submass_ld)
+
+
+_concrete_coating_thickness_result = result_namedtuple("concrete_coating_thickness", """t_conc, D_buoy, mass_ld, buoy_ld, submass_ld, SG""")
+
+def concrete_coating_thickness(*, D_o, t_nom, ρ_pipe, ρ_cont=0.0, coat_thk=0.0,
+        coat_ρ=0.0, ρ_conc, ρ_xwater, target_submass_ld=None, target_SG=None,
+        t_round=None, **kwargs):
+    r"""Minimum concrete (weight) coating thickness for a target submerged
+    weight or specific gravity, for arrays of configurations.
+
+    The concrete is the outer layer, over the steel pipe, contents and the
+    inner coating layers (`coat_thk`, `coat_ρ` as in
+    `pipeline_properties_batch`).  With $D_1$ the diameter under the
+    concrete and $m_0$ the linear mass of pipe, contents and inner layers,
+    the submerged linear mass is quadratic in the concrete thickness $t$:
+
+    .. math::
+        \pi \left(\rho_{conc} - \rho^*\right) \left(t^2 + D_1 t\right)
+            = m^* - m_0 + \rho^* \pi D_1^2 / 4
+
+    with $\rho^* = \rho_{xwater}$, $m^*$ = target submerged mass for a target
+    submerged weight, and $\rho^* = SG \cdot \rho_{xwater}$, $m^* = 0$ for
+    a target specific gravity; the positive root is taken.
+
+    :param target_submass_ld: target submerged linear mass (kg/m)
+    :param target_SG: target specific gravity (instead of `target_submass_ld`)
+    :param t_round: round the thickness up to a multiple of `t_round`
+    :returns: namedtuple of arrays, concrete thickness `t_conc` (0.0 if no
+        concrete is needed, NaN if the target cannot be reached) and the
+        coated pipeline properties
+    """
+    if (target_submass_ld is None) == (target_SG is None):
+        raise ValueError("concrete_coating_thickness: specify one of «target_submass_ld», «target_SG».")
+    coat_thk = np.atleast_1d(np.asarray(coat_thk, dtype=float))
+    D_i = D_o - 2.0 * t_nom
+    m_steel = tubular_properties(D_o, t_nom, ρ_pipe).mass_ld
+    m_cont = pi / 4.0 * D_i*D_i * ρ_cont
+    inner = pipeline_properties_batch(D_o=D_o, mass_ld=m_steel + m_cont,
+                coat_thk=coat_thk, coat_ρ=coat_ρ, ρ_xwater=ρ_xwater)
+    D_1, m_0 = inner.D_buoy, inner.mass_ld
+    if target_SG is None:
+        ρ_star, m_star = ρ_xwater, target_submass_ld
+    else:
+        ρ_star, m_star = target_SG * ρ_xwater, 0.0
+    a = pi * (ρ_conc - ρ_star)
+    rhs = m_star - m_0 + ρ_star * pi / 4.0 * D_1*D_1
+    with np.errstate(invalid="ignore", divide="ignore"):
+        t_conc = 0.5 * (np.sqrt(D_1*D_1 + 4.0*rhs/a) - D_1)
+    t_conc = np.where(rhs <= 0.0, 0.0, np.where(a > 0.0, t_conc, np.nan))
+    if t_round:
+        t_conc = np.ceil(t_conc / t_round - 1.e-9) * t_round
+    ret = pipeline_properties_batch(D_o=D_1, mass_ld=m_0, coat_thk=t_conc[..., None],
+                coat_ρ=ρ_conc, ρ_xwater=ρ_xwater)
+    SG = ret.mass_ld / ret.buoy_ld
+    return _concrete_coating_thickness_result(t_conc, ret.D_buoy, ret.mass_ld,
+                ret.buoy_ld, ret.submass_ld, SG)
 
 
 
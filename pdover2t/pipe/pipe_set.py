@@ -0,0 +1,249 @@
+"""
+Array backed pipe and coating configurations.
+
+A `PipeSet` stores N pipe configurations as columns (one array per
+property, struct-of-arrays) rather than N dicts or namedtuples.  It is a
+read-only mapping of property name: column, so it can be passed straight
+to the calculation functions, e.g.
+`pressure_containment_bursting_batch(**pipes, **loads)`.  Indexing with an
+integer gives a `PipeView` of one configuration, and slicing gives a new
+`PipeSet` sharing the column memory (basic slices are zero-copy views).
+
+Coating stacks are stored as two (N, L) arrays `coat_thk` and `coat_ρ`
+(innermost layer first, zero thickness padding), as used by
+`pipeline_properties_batch`.
+"""
+from collections.abc import Mapping
+import logging
+import numbers
+
+import numpy as np
+
+from .pipe import PipeCoat, tubular_properties, pipeline_properties_batch
+
+
+logger = logging.getLogger(__name__)
+
+
+_coat_keys = ("coat_thk", "coat_ρ")
+
+
+def _column(name, value, size):
+    """Read-only 1-d column of length `size` (numbers are broadcast, no copy)."""
+    arr = np.asarray(value)
+    if arr.dtype.kind in "iu":
+        arr = arr.astype(float)
+    if arr.ndim == 0:
+        arr = np.broadcast_to(arr, (size,))
+    elif arr.shape != (size,):
+        raise ValueError(f"PipeSet: column «{name}» shape {arr.shape}, expected ({size},).")
+    arr = arr.view()
+    arr.flags.writeable = False
+    return arr
+
+
+def _size(columns):
+    sizes = {np.shape(v)[0] for v in columns.values() if np.ndim(v) > 0}
+    if len(sizes) > 1:
+        raise ValueError(f"PipeSet: columns of different lengths {sorted(sizes)}.")
+    return sizes.pop() if sizes else 1
+
+
+class PipeSet(Mapping):
+    """N pipe configurations stored as columns.
+
+    :param coat_thk: coating layer thicknesses, array (N, L) or (L,) for the
+        same coating on all configurations
+    :param coat_ρ: coating layer densities, broadcast against `coat_thk`
+    :param columns: pipe properties (e.g. `D_o`, `t_nom`, `ρ_pipe`, `SMYS`),
+        arrays (N,) or numbers
+
+    As a mapping, the keys are the column names and `len()` is the number of
+    columns; the number of configurations is `size`.
+
+    >>> pipes = PipeSet(D_o=[0.2731, 0.3239, 0.3239], t_nom=[0.0127, 0.0143, 0.0159],
+    ...                 ρ_pipe=7850., coat_thk=[0.003, 0.05], coat_ρ=[1450., 2400.])
+    >>> pipes.size
+    3
+    >>> pipes[1].D_o
+    0.3239
+    >>> pipes[1:].pipeline_properties(ρ_xwater=1025.).submass_ld.shape
+    (2,)
+    """
+
+    __slots__ = ("_columns", "size")
+
+    def __init__(self, coat_thk=None, coat_ρ=None, **columns):
+        size = _size(columns)
+        if coat_thk is not None and np.ndim(coat_thk) == 2:
+            if columns and size != np.shape(coat_thk)[0]:
+                raise ValueError(f"PipeSet: coating for {np.shape(coat_thk)[0]} configurations, {size} expected.")
+            size = np.shape(coat_thk)[0]
+        self.size = size
+        self._columns = {name: _column(name, value, size) for name, value in columns.items()}
+        if coat_thk is not None:
+            thk = np.asarray(coat_thk, dtype=float)
+            thk = np.broadcast_to(thk, (size, thk.shape[-1]))
+            ρ = np.broadcast_to(np.asarray(0.0 if coat_ρ is None else coat_ρ, dtype=float), thk.shape)
+            for name, arr in zip(_coat_keys, (thk, ρ)):
+                arr = arr.view()
+                arr.flags.writeable = False
+                self._columns[name] = arr
+
+    @classmethod
+    def _from_columns(cls, columns, size):
+        # no checks or copies, for slices of an existing set
+        self = cls.__new__(cls)
+        self._columns = columns
+        self.size = size
+        return self
+
+    @classmethod
+    def from_records(cls, records):
+        """PipeSet from an iterable of dicts (or `PipeView`); a `coat` item
+        (`PipeCoat`, or list of `pipeCoatLayer`) gives the coating stack,
+        padded to the largest number of layers."""
+        records = list(records)
+        names = [k for k in records[0] if k != "coat"] if records else []
+        columns = {name: [rec[name] for rec in records] for name in names}
+        coats = [rec.get("coat") for rec in records]
+        if any(coat is not None for coat in coats):
+            coats = [_layers(coat) for coat in coats]
+            nlayer = max(len(layers) for layers in coats)
+            thk = np.zeros((len(records), nlayer))
+            ρ = np.zeros((len(records), nlayer))
+            for ii, layers in enumerate(coats):
+                for jj, (t, density, *_) in enumerate(layers):
+                    thk[ii, jj], ρ[ii, jj] = t, density
+            columns.update(coat_thk=thk, coat_ρ=ρ)
+        elif "coat_thk" in columns:
+            columns.update(coat_thk=np.array(columns["coat_thk"], dtype=float),
+                           coat_ρ=np.array(columns["coat_ρ"], dtype=float))
+        return cls(**columns)
+
+    def __repr__(self):
+        return f"PipeSet(size={self.size}, columns={list(self._columns)})"
+
+    def __len__(self):
+        return len(self._columns)
+
+    def __iter__(self):
+        return iter(self._columns)
+
+    def __contains__(self, key):
+        return key in self._columns
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self._columns[key]
+        if isinstance(key, numbers.Integral):
+            if key < 0:
+                key += self.size
+            if not 0 <= key < self.size:
+                raise IndexError(f"PipeSet index {key} out of range.")
+            return PipeView(self, key)
+        # slice (zero-copy views), integer index array or boolean mask (copies)
+        columns = {name: arr[key] for name, arr in self._columns.items()}
+        size = len(range(*key.indices(self.size))) if isinstance(key, slice) else _size(columns)
+        return PipeSet._from_columns(columns, size)
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self._columns[name]
+        except KeyError:
+            raise AttributeError(f"PipeSet has no column «{name}»") from None
+
+    def rows(self):
+        """Iterate over the configurations, as `PipeView`."""
+        return (PipeView(self, ii) for ii in range(self.size))
+
+    @property
+    def nbytes(self):
+        """Memory size of the columns (broadcast values count once)."""
+        return sum(arr.itemsize * np.prod([n for n, st in zip(arr.shape, arr.strides) if st],
+                                          dtype=int)
+                   for arr in self._columns.values())
+
+    def with_columns(self, **columns):
+        """New PipeSet with `columns` added or replaced, sharing the other
+        columns."""
+        new = dict(self._columns)
+        for name, value in columns.items():
+            if name in _coat_keys:
+                value = np.broadcast_to(np.asarray(value, dtype=float), new["coat_thk"].shape)
+                value = value.view()
+                value.flags.writeable = False
+                new[name] = value
+            else:
+                new[name] = _column(name, value, self.size)
+        return PipeSet._from_columns(new, self.size)
+
+    def linepipe_mass_ld(self):
+        """Steel pipe linear mass, array (N,)."""
+        return tubular_properties(self["D_o"], self["t_nom"], self["ρ_pipe"]).mass_ld
+
+    def pipeline_properties(self, ρ_xwater, mass_ld=None):
+        """Coated pipeline properties of all configurations, see
+        `pipeline_properties_batch`.
+
+        :param mass_ld: pipe (and contents) linear mass (default the steel
+            pipe linear mass)
+        """
+        if mass_ld is None:
+            mass_ld = self.linepipe_mass_ld()
+        coat_thk = self._columns.get("coat_thk", np.zeros((self.size, 1)))
+        coat_ρ = self._columns.get("coat_ρ", 0.0)
+        return pipeline_properties_batch(D_o=self["D_o"], mass_ld=mass_ld,
+                    coat_thk=coat_thk, coat_ρ=coat_ρ, ρ_xwater=ρ_xwater)
+
+
+class PipeView(Mapping):
+    """One configuration of a `PipeSet`, a read-only mapping (and attribute
+    access) of property name: value, without copying the data."""
+
+    __slots__ = ("_pipes", "_index")
+
+    def __init__(self, pipes, index):
+        self._pipes = pipes
+        self._index = index
+
+    def __repr__(self):
+        return f"PipeView({dict(self)})"
+
+    def __len__(self):
+        return len(self._pipes._columns)
+
+    def __iter__(self):
+        return iter(self._pipes._columns)
+
+    def __contains__(self, key):
+        return key in self._pipes._columns
+
+    def __getitem__(self, key):
+        value = self._pipes._columns[key][self._index]
+        return value.item() if np.ndim(value) == 0 else value
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(f"PipeView has no column «{name}»") from None
+
+    @property
+    def coat(self):
+        """Coating stack as a `PipeCoat` (None if the set has no coating)."""
+        if "coat_thk" not in self:
+            return None
+        return PipeCoat.from_arrays(self["coat_thk"], self["coat_ρ"])
+
+
+def _layers(coat):
+    if coat is None:
+        return []
+    if isinstance(coat, PipeCoat):
+        return coat.layers
+    return list(coat)
@@ -1,7 +1,7 @@
 """
 for testing calculate pressure containment using Barlow formula with a design factor
 """
-from ...util.named_tuple import make_return_namedtuple
+from ...util.named_tuple import result_namedtuple
 
 
 
@@ -19,13 +19,15 @@ def pressure_contain_unity(σ_hoop, SMYS, Df):
     return pc_unity
 
 
+_pressure_containment_result = result_namedtuple("pressure_containment", """σ_hoop, pc_unity""")
+
 def pressure_containment(*,
     t_nom, p_d, D_o,
     SMYS, Df,
     **kwargs):
     σ_hoop = hoop_stress_barlow(t_nom, p_d, D_o)
     pc_unity = pressure_contain_unity(σ_hoop, SMYS, Df)
-    return make_return_namedtuple("""σ_hoop, pc_unity""") 
+    return _pressure_containment_result(σ_hoop, pc_unity)
 
 
 if __name__ == "__main__":
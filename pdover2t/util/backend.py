@@ -0,0 +1,82 @@
+"""
+Scalar/array math backend.
+
+The functions here pick the implementation per call from the argument
+type: Python (and NumPy scalar) numbers go to the `math` module, anything
+else (arrays, sequences) goes to `numpy`.  This replaces binding `sqrt`,
+`exp`, ... to `math` or `numpy` at import time from `config.use_numpy`, so
+that one process can mix fast scalar calls with batch array calls.
+
+https://docs.python.org/3/library/math.html
+https://numpy.org/doc/stable/reference/ufuncs.html
+"""
+import math
+
+import numpy as np
+
+
+pi = math.pi
+
+# numpy.float64 is a subclass of float, so numpy scalars take the fast path
+_scalar_types = (int, float)
+
+
+def is_scalar(x):
+    """True if `x` is a plain number, i.e. will take the `math` path.
+    """
+    return isinstance(x, _scalar_types)
+
+
+def any_array(*args):
+    """True if any of `args` is not a plain number (array, sequence, ...).
+    """
+    for x in args:
+        if not isinstance(x, _scalar_types):
+            return True
+    return False
+
+
+def sqrt(x):
+    if isinstance(x, _scalar_types):
+        return math.sqrt(x)
+    return np.sqrt(x)
+
+
+def exp(x):
+    if isinstance(x, _scalar_types):
+        return math.exp(x)
+    return np.exp(x)
+
+
+def cos(x):
+    if isinstance(x, _scalar_types):
+        return math.cos(x)
+    return np.cos(x)
+
+
+def acos(x):
+    if isinstance(x, _scalar_types):
+        return math.acos(x)
+    return np.arccos(x)
+
+
+def absolute(x):
+    if isinstance(x, _scalar_types):
+        return abs(x)
+    return np.absolute(x)
+
+
+def maximum(x, y):
+    """Element-wise maximum of `x` and `y`.
+    """
+    if isinstance(x, _scalar_types) and isinstance(y, _scalar_types):
+        return x if x >= y else y
+    return np.maximum(x, y)
+
+
+def minimum(x, y):
+    """Element-wise minimum of `x` and `y`.
+    """
+    if isinstance(x, _scalar_types) and isinstance(y, _scalar_types):
+        return x if x <= y else y
+    return np.minimum(x, y)
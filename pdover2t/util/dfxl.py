@@ -1,42 +1,64 @@
+import csv
+import math
+
+import numpy as np
 import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Alignment, Font
 
 from .named_tuple import isinstance_namedtuple
+from .result_store import ResultStore
 
 
-def loadcases2excel(xl_filename, dfObj, ws_header_lines=4):
-    """
+def _make_transposed_df(_data):
+    """Pandas work-around; field/value table of `_data`, array values
+    expanded across columns (scalars broadcast)."""
+    try:
+        df = pd.DataFrame(data=_data)   
+    except:     # ValueError:
+        df = pd.DataFrame(data=_data, index=[0]) # ValueError: If using all scalar values, you must pass an index    
+    return df.T        
+
+
+def loadcases2excel(xl_filename, dfObj, ws_header_lines=4, write_only=False):
+    """Write load case results to an Excel workbook, one sheet per spec.
+
+    :param dfObj: sequence of specs `(dataObj, sheetName, *rowStrings)`;
+        `dataObj` a dict, namedtuple, list of namedtuples or ResultStore
+    :param ws_header_lines: number of header rows (`rowStrings`) above
+        the data
+    :param write_only: stream rows with an openpyxl write-only workbook,
+        writing header rows and cell styles inline (see
+        `loadcases2excel_stream`); memory use is independent of row count
     """
-    def make_transposed_df(_data):
-        """Pandas work-around"""
-        try:
-            df = pd.DataFrame(data=_data)   
-        except:     # ValueError:
-            df = pd.DataFrame(data=_data, index=[0]) # ValueError: If using all scalar values, you must pass an index    
-        return df.T        
+    if write_only:
+        return loadcases2excel_stream(xl_filename, dfObj, ws_header_lines)
     with pd.ExcelWriter(xl_filename, engine="openpyxl", mode='w') as writer:
         for wsidx, spec in enumerate(dfObj):
             dataObj, sheetName, *rowStrings = spec
             #print(wsidx, rowStrings)
             if isinstance(dataObj, dict):
                 _data = dataObj
-                df = make_transposed_df(_data)
+                df = _make_transposed_df(_data)
             elif isinstance_namedtuple(dataObj):
                 #_data = dataObj._asdict()
                 _data = {type(dataObj).__name__: ""}
                 _data.update(dataObj._asdict()) 
-                df = make_transposed_df(_data)
+                df = _make_transposed_df(_data)
             elif isinstance(dataObj, (list, tuple)) and isinstance_namedtuple(dataObj[0]):
                 # _data = {}
                 # for nt in dataObj:
                 #     _data[type(nt).__name__] = ""
                 #     _data.update(nt._asdict())
-                df = pd.DataFrame()
+                _dfs = []
                 for rnt in dataObj:
                     _data = {type(rnt).__name__: ""}
                     _data.update(rnt._asdict()) 
-                    _df = make_transposed_df(_data)
-                    df = pd.concat([df, _df])
+                    _dfs.append(_make_transposed_df(_data))
+                df = pd.concat(_dfs)  # single concat, not one per load case
+            elif isinstance(dataObj, ResultStore):
+                df = dataObj.to_dataframe()
             else:
                 continue
             #with pd.ExcelWriter("atestpipeline.xlsx", engine="openpyxl", mode='a', if_sheet_exists='replace') as writer:
@@ -55,4 +77,123 @@ def loadcases2excel(xl_filename, dfObj, ws_header_lines=4):
             #ws['A1'].font = Font(bold=True)
 
 
-#local_buckling_propagation_all.__code__.co_varnames.index("kwargs")
\ No newline at end of file
+#local_buckling_propagation_all.__code__.co_varnames.index("kwargs")
+
+
+def _xl_value(value):
+    """Cell value for openpyxl, written as `DataFrame.to_excel` does: numpy
+    scalars as Python scalars, NaN as an empty cell, inf as text."""
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None if math.isnan(value) else str(value)
+    return value
+
+
+def iter_loadcase_rows(dataObj):
+    """Rows of a load case sheet, laid out as `loadcases2excel`.
+
+    The first row is the column header; the first item of each row is the
+    index (field name, or row number for a ResultStore).  Array values of
+    dicts and namedtuples are expanded across columns, as the pandas
+    layout.  Returns None for unsupported `dataObj`.
+    """
+    if isinstance(dataObj, dict):
+        return _iter_frame(_make_transposed_df(dataObj))
+    elif isinstance_namedtuple(dataObj):
+        return _iter_frame(_make_transposed_df({type(dataObj).__name__: "", **dataObj._asdict()}))
+    elif isinstance(dataObj, (list, tuple)) and isinstance_namedtuple(dataObj[0]):
+        return _iter_frame(pd.concat([_make_transposed_df({type(rnt).__name__: "", **rnt._asdict()})
+                                      for rnt in dataObj]))
+    elif isinstance(dataObj, ResultStore):
+        return _iter_store(dataObj)
+    return None
+
+
+def _iter_frame(df):
+    yield (None, *df.columns)
+    for index, row in zip(df.index, df.itertuples(index=False)):
+        yield (index, *map(_xl_value, row))
+
+
+def _iter_store(store, blocksize=10000):
+    yield (None, *store.fields)
+    columns = store.columns
+    for start in range(0, len(store), blocksize):
+        # tolist() converts a block of each column to Python scalars at once
+        block = [columns[field][start:start+blocksize].tolist() for field in store.fields]
+        yield from zip(range(start, start+len(block[0])), *block)
+
+
+def loadcases2excel_stream(xl_filename, dfObj, ws_header_lines=4):
+    """Write load case results to Excel with an openpyxl write-only workbook.
+
+    Same layout and styling as `loadcases2excel`, but rows are streamed to
+    the file as they are produced: the header rows and the column-A styles
+    are written inline, so there is no `insert_rows` and no pass over
+    the sheet afterwards, and memory use does not grow with row count.
+
+    https://openpyxl.readthedocs.io/en/stable/optimized.html#write-only-mode
+    """
+    wb = Workbook(write_only=True)
+    align = Alignment(horizontal='left')
+    bold = Font(bold=True)
+    for spec in dfObj:
+        dataObj, sheetName, *rowStrings = spec
+        rows = iter_loadcase_rows(dataObj)
+        if rows is None:
+            continue
+        ws = wb.create_sheet(sheetName)
+
+        def first_cell(value, rownum):
+            cell = WriteOnlyCell(ws, value=value)
+            cell.alignment = align
+            if not 1 <= rownum <= ws_header_lines:
+                cell.font = bold
+            return cell
+
+        for jj in range(ws_header_lines):
+            txt = rowStrings[jj] if jj < len(rowStrings) else None
+            ws.append([first_cell(txt, jj)])
+        for jj, row in enumerate(rows, start=ws_header_lines):
+            ws.append([first_cell(row[0], jj), *row[1:]])
+    wb.save(xl_filename)
+
+
+def loadcases2files(basename, dfObj, fmt="csv"):
+    """Write load case results as one CSV or Parquet file per sheet spec.
+
+    Fallback for result sets too large for Excel.  Files are named
+    `{basename}_{sheetName}.csv` (or `.parquet`).  CSV files are streamed
+    row by row with the `rowStrings` as leading `#` comment lines;
+    ResultStore data is written to Parquet from its columns (requires
+    pyarrow or fastparquet), other data as a field/value table.
+
+    :returns: list of files written
+    """
+    filenames = []
+    for spec in dfObj:
+        dataObj, sheetName, *rowStrings = spec
+        filename = f"{basename}_{sheetName}.{fmt}"
+        if fmt == "parquet":
+            if isinstance(dataObj, ResultStore):
+                dataObj.to_parquet(filename)
+            else:
+                rows = iter_loadcase_rows(dataObj)
+                if rows is None:
+                    continue
+                header = next(rows)
+                df = pd.DataFrame(rows, columns=["field", *map(str, header[1:])]).astype(str)
+                df.to_parquet(filename, index=False)
+        elif fmt == "csv":
+            rows = iter_loadcase_rows(dataObj)
+            if rows is None:
+                continue
+            with open(filename, "w", newline="") as fh:
+                for txt in rowStrings:
+                    fh.write(f"# {txt}\n")
+                csv.writer(fh).writerows(rows)
+        else:
+            raise ValueError(f"loadcases2files: unknown format «{fmt}».")
+        filenames.append(filename)
+    return filenames
@@ -0,0 +1,263 @@
+"""
+Forward-mode automatic differentiation with dual numbers.
+
+A `Dual` carries a value (number or array) and its gradient with respect
+to n seeded inputs (an array with a trailing axis of length n).  NumPy
+ufuncs dispatch to `Dual.__array_ufunc__`, and the `util.backend`
+functions send anything that is not a plain number to NumPy, so the
+calculation functions propagate exact derivatives without changes, for
+all elements of array inputs in one pass.
+
+https://numpy.org/doc/stable/user/basics.dispatch.html
+https://en.wikipedia.org/wiki/Automatic_differentiation#Forward_accumulation
+"""
+from functools import wraps
+import logging
+
+import numpy as np
+
+from .named_tuple import isinstance_namedtuple, result_namedtuple
+
+
+logger = logging.getLogger(__name__)
+
+
+class Dual:
+    """Value and gradient; `grad` has the shape of `value` plus a trailing
+    axis, one element per seeded input (None for a zero gradient)."""
+
+    __slots__ = ("value", "grad")
+    __array_priority__ = 1000
+
+    def __init__(self, value, grad=None):
+        self.value = np.asarray(value, dtype=float)
+        self.grad = grad
+
+    def __repr__(self):
+        return f"Dual({self.value!r}, grad={self.grad!r})"
+
+    @property
+    def shape(self):
+        return self.value.shape
+
+    @property
+    def ndim(self):
+        return self.value.ndim
+
+    def __len__(self):
+        return len(self.value)
+
+    def __getitem__(self, idx):
+        idx = idx if isinstance(idx, tuple) else (idx,)
+        grad = None if self.grad is None else self.grad[idx + (Ellipsis, slice(None))]
+        return Dual(self.value[idx], grad)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if method != "__call__" or kwargs.get("out") is not None:
+            return NotImplemented
+        if ufunc in _value_ufuncs:
+            return ufunc(*(value_of(x) for x in inputs), **kwargs)
+        rule = _ufunc_rules.get(ufunc)
+        if rule is None:
+            return NotImplemented
+        return rule(*(x if isinstance(x, Dual) else Dual(x) for x in inputs))
+
+    # arithmetic and comparison operators go through the ufuncs
+    def __add__(self, other): return np.add(self, other)
+    def __radd__(self, other): return np.add(other, self)
+    def __sub__(self, other): return np.subtract(self, other)
+    def __rsub__(self, other): return np.subtract(other, self)
+    def __mul__(self, other): return np.multiply(self, other)
+    def __rmul__(self, other): return np.multiply(other, self)
+    def __truediv__(self, other): return np.true_divide(self, other)
+    def __rtruediv__(self, other): return np.true_divide(other, self)
+    def __pow__(self, other): return np.power(self, other)
+    def __rpow__(self, other): return np.power(other, self)
+    def __neg__(self): return np.negative(self)
+    def __pos__(self): return self
+    def __abs__(self): return np.absolute(self)
+    def __lt__(self, other): return np.less(self, other)
+    def __le__(self, other): return np.less_equal(self, other)
+    def __gt__(self, other): return np.greater(self, other)
+    def __ge__(self, other): return np.greater_equal(self, other)
+
+
+def value_of(x):
+    """Value of a `Dual`, other objects unchanged."""
+    return x.value if isinstance(x, Dual) else x
+
+
+def is_dual(*args):
+    """True if any of `args` is a `Dual`."""
+    return any(isinstance(x, Dual) for x in args)
+
+
+def _chain(d, grad):
+    """Gradient `d * grad` (None for a zero gradient)."""
+    if grad is None:
+        return None
+    return np.asarray(d)[..., None] * grad
+
+
+def _sum(*grads):
+    grads = [g for g in grads if g is not None]
+    if not grads:
+        return None
+    total = grads[0]
+    for g in grads[1:]:
+        total = total + g
+    return total
+
+
+def _add(a, b):
+    return Dual(a.value + b.value, _sum(a.grad, b.grad))
+
+def _subtract(a, b):
+    return Dual(a.value - b.value, _sum(a.grad, _chain(-1.0, b.grad)))
+
+def _multiply(a, b):
+    return Dual(a.value * b.value, _sum(_chain(b.value, a.grad), _chain(a.value, b.grad)))
+
+def _divide(a, b):
+    value = a.value / b.value
+    return Dual(value, _sum(_chain(1.0 / b.value, a.grad), _chain(-value / b.value, b.grad)))
+
+def _power(a, b):
+    value = a.value ** b.value
+    grad_a = _chain(b.value * a.value ** (b.value - 1.0), a.grad)
+    grad_b = None
+    if b.grad is not None:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            grad_b = _chain(value * np.log(a.value), b.grad)
+    return Dual(value, _sum(grad_a, grad_b))
+
+def _unary(func, deriv):
+    def rule(a):
+        value = func(a.value)
+        return Dual(value, _chain(deriv(a.value, value), a.grad))
+    return rule
+
+def _select(choose_a):
+    def rule(a, b):
+        mask = choose_a(a.value, b.value)
+        value = np.where(mask, a.value, b.value)
+        grad = None
+        if a.grad is not None or b.grad is not None:
+            shape = value.shape + (_nseeds(a, b),)
+            ga = np.broadcast_to(0.0 if a.grad is None else a.grad, shape)
+            gb = np.broadcast_to(0.0 if b.grad is None else b.grad, shape)
+            grad = np.where(np.asarray(mask)[..., None], ga, gb)
+        return Dual(value, grad)
+    return rule
+
+def _nseeds(*args):
+    return next(x.grad.shape[-1] for x in args if x.grad is not None)
+
+
+_ufunc_rules = {
+    np.add: _add,
+    np.subtract: _subtract,
+    np.multiply: _multiply,
+    np.true_divide: _divide,
+    np.power: _power,
+    np.negative: _unary(np.negative, lambda x, v: -1.0),
+    np.positive: _unary(np.positive, lambda x, v: 1.0),
+    np.absolute: _unary(np.absolute, lambda x, v: np.sign(x)),
+    np.square: _unary(np.square, lambda x, v: 2.0 * x),
+    np.sqrt: _unary(np.sqrt, lambda x, v: 0.5 / v),
+    np.exp: _unary(np.exp, lambda x, v: v),
+    np.log: _unary(np.log, lambda x, v: 1.0 / x),
+    np.log1p: _unary(np.log1p, lambda x, v: 1.0 / (1.0 + x)),
+    np.sin: _unary(np.sin, lambda x, v: np.cos(x)),
+    np.cos: _unary(np.cos, lambda x, v: -np.sin(x)),
+    np.arccos: _unary(np.arccos, lambda x, v: -1.0 / np.sqrt(1.0 - x*x)),
+    np.minimum: _select(lambda a, b: a <= b),
+    np.maximum: _select(lambda a, b: a >= b),
+}
+
+# ufuncs of the values only (comparisons, tests)
+_value_ufuncs = {np.less, np.less_equal, np.greater, np.greater_equal,
+                 np.equal, np.not_equal, np.isnan, np.isfinite, np.isinf,
+                 np.sign, np.logical_and, np.logical_or, np.logical_not}
+
+
+def seed(values):
+    """`Dual` inputs seeded for differentiation, one gradient axis element
+    per input.
+
+    :param values: dict of input name: value (number or array)
+    :returns: dict of input name: `Dual`
+    """
+    n = len(values)
+    seeded = {}
+    for ii, (name, value) in enumerate(values.items()):
+        value = np.asarray(value, dtype=float)
+        grad = np.zeros(value.shape + (n,))
+        grad[..., ii] = 1.0
+        seeded[name] = Dual(value, grad)
+    return seeded
+
+
+def implicit_root(solve, residual, *args):
+    """Root `x` of `residual(x, *args) = 0`, by `solve(*args)`, with its
+    gradient from the implicit function theorem when `args` contain `Dual`
+    values: dx = -(∂F/∂args · dargs) / (∂F/∂x).
+    """
+    values = [value_of(a) for a in args]
+    x = solve(*values)
+    if not is_dual(*args):
+        return x
+    F_args = residual(Dual(x), *args).grad
+    if F_args is None:
+        return Dual(x)
+    F_x = residual(Dual(x, np.ones(np.shape(x) + (1,))), *values).grad[..., 0]
+    return Dual(x, -F_args / np.asarray(F_x)[..., None])
+
+
+def _value(x):
+    value = value_of(x)
+    if isinstance(value, np.ndarray) and value.ndim == 0:
+        return float(value)
+    return value
+
+
+def with_gradients(func, wrt, **kwargs):
+    """Evaluate `func` with forward-mode gradients.
+
+    :param func: calculation function, of keyword arguments, returning a
+        result namedtuple
+    :param wrt: names of the inputs to differentiate with respect to
+    :param kwargs: function inputs
+    :returns: namedtuple `value` (the result, with plain values) and `grad`
+        (dict of result field: dict of input name: derivative, for the
+        fields depending on the inputs)
+
+    Example:
+    >>> ret = with_gradients(local_buckling_collapse_all, ["t_nom", "h_l"], **basecase)
+    >>> ret.grad["lb_collapse_uty"]["t_nom"]
+    """
+    wrt = [wrt] if isinstance(wrt, str) else list(wrt)
+    kwargs.update(seed({name: kwargs[name] for name in wrt}))
+    ret = func(**kwargs)
+    fields = ret._asdict() if isinstance_namedtuple(ret) else dict(ret)
+    grad = {}
+    for field, value in fields.items():
+        if isinstance(value, Dual) and value.grad is not None:
+            grad[field] = {name: value.grad[..., ii] if value.grad.ndim > 1
+                           else float(value.grad[ii]) for ii, name in enumerate(wrt)}
+    values = {field: _value(value) for field, value in fields.items()}
+    value = ret._make(values.values()) if isinstance_namedtuple(ret) else values
+    return _gradients_result(value, grad)
+
+_gradients_result = result_namedtuple("with_gradients", """value, grad""")
+
+
+def gradient_option(func):
+    """Add a `wrt` keyword to a calculation function: if given, the function
+    returns `with_gradients(func, wrt, ...)` instead of the plain result."""
+    @wraps(func)
+    def wrapper(*args, wrt=None, **kwargs):
+        if wrt:
+            return with_gradients(func, wrt, **kwargs)
+        return func(*args, **kwargs)
+    return wrapper
@@ -3,41 +3,64 @@
 https://stackoverflow.com/questions/26180528/convert-a-namedtuple-into-a-dictionary/26180604#26180604
 """
 from collections import namedtuple
-import inspect
 import logging
+import sys
 
 logger = logging.getLogger(__name__)
 
 
+# cache of result types, keyed on (typename, field_names)
+_result_types = {}
 
-def make_return_namedtuple(field_names, typename=None, prepend_name=False):
 
-    # https://github.com/python/cpython/blob/main/Lib/collections/__init__.py
+def result_namedtuple(typename, field_names):
+    """Return the result namedtuple type for `typename` and `field_names`.
+
+    Result types are built once and cached, calculation modules define them
+    at import time and construct results positionally, e.g.
+    `_result(p_el, f_y)`, which costs about the same as building a plain
+    tuple.  The types pickle by name and fields (see `_rebuild_result`), so
+    results can be passed between processes and stored on disk.
+    """
     if isinstance(field_names, str):
         field_names = field_names.replace(',', ' ').split()
-    field_names = list(map(str, field_names))
+    key = (typename, tuple(map(str, field_names)))
+    try:
+        return _result_types[key]
+    except KeyError:
+        pass
+    # https://docs.python.org/3/library/collections.html#collections.somenamedtuple._make
+    base = namedtuple(typename, key[1])
+    retTuple = type(typename, (base,), {"__slots__": (), "__reduce__": _reduce_result})
+    _result_types[key] = retTuple
+    return retTuple
+
+
+def _reduce_result(self):
+    return (_rebuild_result, (type(self).__name__, self._fields, tuple(self)))
+
 
-    # https://docs.python.org/3/library/inspect.html#inspect.currentframe
-    # https://stackoverflow.com/a/900404
+def _rebuild_result(typename, field_names, values):
+    return result_namedtuple(typename, field_names)._make(values)
+
+
+def make_return_namedtuple(field_names, typename=None, prepend_name=False):
+    """Build a result namedtuple from the calling function's local variables.
+
+    Kept for compatibility, prefer a precompiled type from
+    `result_namedtuple`; this still has to inspect the caller's frame, but
+    the type itself is cached.
+    """
+    # https://docs.python.org/3/library/sys.html#sys._getframe
+    frame = sys._getframe(1)
     if not typename:
-        typename = inspect.currentframe().f_back.f_code.co_name # .title().replace("_", "")
-        #print(f"{typename=}")
-    func_locals = dict(inspect.currentframe().f_back.f_locals)
-
-    field_dict = {}
-    # if prepend_name:
-    #     field_dict[typename] = ""
-    for _name in field_names:
-        if _name in func_locals:
-            field_dict[_name] = func_locals[_name]
-        else:
-            raise ValueError('make_return_namedtuple: ' + typename + ' Field missing: ' + _name)
-
-    # if prepend_name:
-    #     field_names.insert(0, typename)
-
-    retTuple = namedtuple(typename, field_names)
-    return retTuple(**field_dict)
+        typename = frame.f_code.co_name # .title().replace("_", "")
+    retTuple = result_namedtuple(typename, field_names)
+    func_locals = frame.f_locals
+    try:
+        return retTuple._make([func_locals[_name] for _name in retTuple._fields])
+    except KeyError as err:
+        raise ValueError('make_return_namedtuple: ' + typename + ' Field missing: ' + err.args[0]) from None
 
 
 
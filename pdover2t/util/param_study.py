@@ -1,30 +1,108 @@
+from concurrent.futures import ProcessPoolExecutor
+import math
+import multiprocessing
 import numbers
+import os
 
 import numpy as np
 import pandas as pd
 
 
+class ParamGrid:
+    """Lazy grid-search/parameter sweep over parameter lists.
+
+    Index-addressable view of the Cartesian product of the parameter
+    lists; rows are generated on demand and the full grid is never built.
+    Rows are ordered as `param_sweep` (the first parameter varies slowest)
+    and each parameter keeps its own dtype.
+
+    >>> grid = ParamGrid([1.0, 2.0], [11, 12, 13], ("a", "b"), names=["x", "n", "s"])
+    >>> len(grid)
+    12
+    >>> grid[5]
+    (1.0, 13, 'b')
+    >>> grid[4:6]
+    (array([1., 1.]), array([13, 13]), array(['a', 'b'], dtype='<U1'))
+    """
+
+    def __init__(self, *paramlists, names=None):
+        if not paramlists:
+            raise ValueError("ParamGrid: no parameter lists.")
+        self.params = []
+        for li in paramlists:
+            if len(li)==0:
+                raise ValueError(f"Empty list not allowed.")
+            self.params.append(np.asarray(li))
+        if names is None:
+            names = list(range(len(self.params)))
+        elif len(names) != len(self.params):
+            raise ValueError(f"ParamGrid: {len(names)} names for {len(self.params)} parameter lists.")
+        self.names = list(names)
+        self.shape = tuple(len(li) for li in self.params)
+        self.size = math.prod(self.shape)
+
+    def __len__(self):
+        return self.size
+
+    def __repr__(self):
+        return f"ParamGrid(names={self.names}, shape={self.shape})"
+
+    def __getitem__(self, idx):
+        if isinstance(idx, numbers.Integral):
+            if idx < 0:
+                idx += self.size
+            if not 0 <= idx < self.size:
+                raise IndexError(f"ParamGrid index {idx} out of range.")
+            subs = np.unravel_index(idx, self.shape)
+            return tuple(li[ii].item() for li, ii in zip(self.params, subs))
+        if isinstance(idx, slice):
+            start, stop, step = idx.indices(self.size)
+            return self.take(np.arange(start, stop, step))
+        return self.take(idx)
+
+    def take(self, indices):
+        """Grid rows at `indices` (flat row numbers), as a tuple of arrays.
+        """
+        indices = np.asarray(indices, dtype=np.intp)
+        indices = np.where(indices < 0, indices + self.size, indices)
+        if np.any((indices < 0) | (indices >= self.size)):
+            raise IndexError(f"ParamGrid index out of range (grid size {self.size}).")
+        subs = np.unravel_index(indices, self.shape)
+        return tuple(li[ii] for li, ii in zip(self.params, subs))
+
+    def columns(self, indices):
+        """Grid rows at `indices`, as a dict of arrays keyed on `names`.
+        """
+        return dict(zip(self.names, self.take(indices)))
+
+    def chunks(self, chunksize):
+        """Iterate over the grid in chunks of (at most) `chunksize` rows.
+
+        :returns: generator of (start, stop, tuple of arrays)
+        """
+        for start in range(0, self.size, chunksize):
+            stop = min(start + chunksize, self.size)
+            yield start, stop, self[start:stop]
+
+    def sample(self, n, replace=False, seed=None):
+        """Random sample of `n` grid rows.
+
+        :returns: (indices, tuple of arrays)
+        """
+        rng = np.random.default_rng(seed)
+        indices = rng.choice(self.size, size=n, replace=replace)
+        return indices, self.take(indices)
+
+    def dataframe(self, start=0, stop=None):
+        """Grid rows `start:stop` as a pandas DataFrame.
+        """
+        return pd.DataFrame(dict(zip(self.names, self[start:stop])))
+
+
 def param_sweep(*paramlists, table=False, dataframe=False):
     "Create a grid-search/parameter sweep from parameter lists"
-    # https://peps.python.org/pep-3102/#specification
-    op = []
-    for ii, li in enumerate(paramlists):
-        if len(li)==0:
-            raise ValueError(f"Empty list not allowed.")
-        li = np.array(li)
-        if ii<len(paramlists)-1:
-            #print(paramlists[ii+1:])
-            flen = 1
-            for li2 in paramlists[ii+1:]:
-                flen = flen*len(li2)
-            li = np.repeat(li, flen)
-        if ii>0:
-            rlen = 1
-            for li2 in paramlists[:ii]:
-                rlen = rlen*len(li2)    
-            li = np.tile(li, rlen)        
-        li = np.array(li)
-        op.append(li)
+    # NOTE: builds the whole grid, use ParamGrid for large sweeps
+    op = ParamGrid(*paramlists)[:] if paramlists else ()
     if table:  # NOTE np.array has a single type
         op = np.array(op).T
         return op
@@ -39,6 +117,56 @@ def param_sweep(*paramlists, table=False, dataframe=False):
     return tuple(op)
 
 
+def _evaluate_grid_chunk(func, grid, start, stop, fixed):
+    """Evaluate `func` on grid rows `start:stop` (process pool task)."""
+    kwargs = dict(fixed)
+    kwargs.update(grid.columns(np.arange(start, stop)))
+    ret = func(**kwargs)
+    nrows = stop - start
+    return {field: np.broadcast_to(value, (nrows,)).copy()
+            for field, value in zip(ret._fields, ret)}
+
+
+def run_param_study(func, grid, chunksize=10000, processes=None,
+        start_method="spawn", **fixed):
+    """Evaluate a check function over a parameter grid, in parallel.
+
+    The grid is split into chunks of `chunksize` rows, and the chunks are
+    evaluated across a process pool; each chunk is a single vectorised call
+    of `func`.  Results are gathered in grid order.
+
+    :param func: check function returning a namedtuple, e.g.
+        `local_buckling_collapse_all` (must be importable, i.e. picklable)
+    :param grid: `ParamGrid`, its `names` are passed to `func` as keyword
+        arguments
+    :param chunksize: number of grid rows per task
+    :param processes: number of worker processes (default all cores);
+        `processes=1` evaluates in the calling process
+    :param start_method: multiprocessing start method; "spawn" is safe to
+        use from multi-threaded programs, unlike "fork"
+    :param fixed: keyword arguments common to all grid rows
+    :returns: dict of columns (arrays of length `len(grid)`), the grid
+        parameters followed by the `func` result fields
+    """
+    if processes is None:
+        processes = os.cpu_count() or 1
+    bounds = [(start, min(start + chunksize, len(grid)))
+              for start in range(0, len(grid), chunksize)]
+    if processes == 1 or len(bounds) == 1:
+        chunks = [_evaluate_grid_chunk(func, grid, start, stop, fixed) for start, stop in bounds]
+    else:
+        with ProcessPoolExecutor(max_workers=min(processes, len(bounds)),
+                mp_context=multiprocessing.get_context(start_method)) as executor:
+            # executor.map returns results in submission (grid) order
+            chunks = list(executor.map(_evaluate_grid_chunk,
+                [func]*len(bounds), [grid]*len(bounds),
+                *zip(*bounds), [fixed]*len(bounds)))
+    columns = dict(zip(grid.names, grid[:]))
+    for field in chunks[0]:
+        columns[field] = np.concatenate([chunk[field] for chunk in chunks])
+    return columns
+
+
 def ttest(a):
     a = np.array(a)
     print(f"ttest: type of a {type(a)}")
@@ -0,0 +1,293 @@
+"""
+Content-addressed cache of load case results.
+
+Results are keyed on a BLAKE2b hash of the function name and the
+normalised inputs: keyword order does not matter, numbers hash by value
+(`1` and `1.0` are the same input) and NumPy arrays hash by dtype, shape
+and content.  There is an in-memory LRU tier, and optionally an SQLite
+file tier shared between sessions, each with entry/size limits.
+
+https://docs.python.org/3/library/hashlib.html#blake2
+https://docs.python.org/3/library/sqlite3.html
+"""
+from collections import OrderedDict
+from functools import wraps
+import hashlib
+import logging
+import pickle
+import sqlite3
+import struct
+import sys
+import threading
+import time
+
+import numpy as np
+
+from .named_tuple import result_namedtuple, isinstance_namedtuple
+
+
+logger = logging.getLogger(__name__)
+
+
+def _feed(h, value):
+    """Feed a normalised, type tagged representation of `value` to hash `h`."""
+    if value is None:
+        h.update(b"N")
+    elif isinstance(value, (bool, np.bool_)):
+        h.update(b"B1" if value else b"B0")
+    elif isinstance(value, (int, float, np.integer, np.floating)):
+        h.update(b"F" + struct.pack("<d", float(value)))
+    elif isinstance(value, str):
+        data = value.encode("utf-8")
+        h.update(b"S%d:" % len(data) + data)
+    elif isinstance(value, bytes):
+        h.update(b"Y%d:" % len(value) + value)
+    elif isinstance(value, np.ndarray):
+        if value.dtype.hasobject:
+            h.update(b"O%s:" % str(value.shape).encode())
+            for item in value.ravel().tolist():
+                _feed(h, item)
+        else:
+            h.update(b"A%s%s:" % (value.dtype.str.encode(), str(value.shape).encode()))
+            h.update(np.ascontiguousarray(value).data)
+    elif isinstance(value, dict):
+        h.update(b"D%d:" % len(value))
+        for key in sorted(value, key=str):
+            _feed(h, str(key))
+            _feed(h, value[key])
+    elif isinstance_namedtuple(value):
+        _feed(h, type(value).__name__)
+        _feed(h, value._asdict())
+    elif isinstance(value, (list, tuple)):
+        h.update(b"L%d:" % len(value))
+        for item in value:
+            _feed(h, item)
+    else:
+        # fall back on the pickled representation
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        h.update(b"P%d:" % len(data) + data)
+
+
+def input_hash(name, args=(), kwargs=None):
+    """Stable hash of a function call, hex digest.
+
+    :param name: function (qualified) name
+    :param args: positional arguments
+    :param kwargs: keyword arguments
+    """
+    h = hashlib.blake2b(digest_size=20)
+    _feed(h, name)
+    _feed(h, tuple(args))
+    _feed(h, kwargs or {})
+    return h.hexdigest()
+
+
+def _readonly(value):
+    """Results are shared between cache hits: return arrays read-only, and
+    lists (e.g. governing limit labels) as tuples."""
+    if isinstance(value, np.ndarray):
+        value = value.copy()
+        value.flags.writeable = False
+        return value
+    if isinstance_namedtuple(value):
+        return value._make(map(_readonly, value))
+    if isinstance(value, (list, tuple)):
+        return tuple(map(_readonly, value))
+    if isinstance(value, dict):
+        return {k: _readonly(v) for k, v in value.items()}
+    return value
+
+
+def _nbytes(value):
+    """Approximate memory size of a result."""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (tuple, list)):
+        return sys.getsizeof(value) + sum(_nbytes(v) for v in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(_nbytes(v) for v in value.values())
+    return sys.getsizeof(value)
+
+
+_cache_stats = result_namedtuple("cache_stats", """hits, misses, disk_hits, evictions, currsize, nbytes""")
+
+
+class ResultCache:
+    """Two tier (memory, SQLite) content-addressed result cache.
+
+    :param maxsize: maximum number of entries in memory
+    :param max_bytes: maximum (approximate) size of the memory entries
+    :param path: SQLite database file of the disk tier (default no disk tier)
+    :param disk_max_bytes: maximum size of the disk tier values
+
+    >>> cache = ResultCache(maxsize=4096, path="results.sqlite")
+    >>> collapse = cache.cached(local_buckling_collapse_all)
+    >>> collapse(**basecase)  # evaluated
+    >>> collapse(**basecase)  # cached
+    >>> cache.stats()
+    """
+
+    def __init__(self, maxsize=1024, max_bytes=None, path=None, disk_max_bytes=None):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.path = path
+        self.disk_max_bytes = disk_max_bytes
+        self._memory = OrderedDict()  # key -> (value, nbytes)
+        self._nbytes = 0
+        self._lock = threading.RLock()
+        self.hits = self.misses = self.disk_hits = self.evictions = 0
+        self._db = None
+        self._touched = {}  # key -> access time, written to disk with the next write
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute("CREATE TABLE IF NOT EXISTS results "
+                "(key TEXT PRIMARY KEY, value BLOB, nbytes INTEGER, atime REAL)")
+            self._db.execute("CREATE INDEX IF NOT EXISTS results_atime ON results (atime)")
+            self._db.commit()
+
+    def __len__(self):
+        return len(self._memory)
+
+    def __contains__(self, key):
+        return key in self._memory or self._disk_get(key, touch=False) is not None
+
+    def __repr__(self):
+        return f"ResultCache(maxsize={self.maxsize}, max_bytes={self.max_bytes}, path={self.path!r})"
+
+    def stats(self):
+        """Hit/miss statistics, and the memory tier size."""
+        return _cache_stats(self.hits, self.misses, self.disk_hits, self.evictions,
+                            len(self._memory), self._nbytes)
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value, _ = self._memory[key]
+            except KeyError:
+                pass
+            else:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return value
+            data = self._disk_get(key)
+            if data is None:
+                self.misses += 1
+                return default
+            value = _readonly(pickle.loads(data))
+            self._memory_set(key, value)
+            self.hits += 1
+            self.disk_hits += 1
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            value = _readonly(value)
+            self._memory_set(key, value)
+            if self._db is not None:
+                data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+                self._db.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                                 (key, data, len(data), time.time()))
+                self._disk_touch()
+                self._disk_evict()
+                self._db.commit()
+            return value
+
+    def clear(self, disk=False):
+        """Clear the memory tier (and the disk tier), and the statistics."""
+        with self._lock:
+            self._memory.clear()
+            self._nbytes = 0
+            self.hits = self.misses = self.disk_hits = self.evictions = 0
+            if disk and self._db is not None:
+                self._touched.clear()
+                self._db.execute("DELETE FROM results")
+                self._db.commit()
+
+    def close(self):
+        if self._db is not None:
+            if self._touched:
+                self._disk_touch()
+                self._db.commit()
+            self._db.close()
+            self._db = None
+
+    def _memory_set(self, key, value):
+        if key in self._memory:
+            self._nbytes -= self._memory.pop(key)[1]
+        nbytes = _nbytes(value)
+        self._memory[key] = (value, nbytes)
+        self._nbytes += nbytes
+        while self._memory and (len(self._memory) > self.maxsize or
+                (self.max_bytes is not None and self._nbytes > self.max_bytes)):
+            _, (_, nbytes) = self._memory.popitem(last=False)
+            self._nbytes -= nbytes
+            self.evictions += 1
+
+    def _disk_get(self, key, touch=True):
+        if self._db is None:
+            return None
+        row = self._db.execute("SELECT value FROM results WHERE key=?", (key,)).fetchone()
+        if row is None:
+            return None
+        if touch:
+            self._touched[key] = time.time()
+        return row[0]
+
+    def _disk_touch(self):
+        """Write the access times of the disk hits since the last write."""
+        self._db.executemany("UPDATE results SET atime=? WHERE key=?",
+                             [(atime, key) for key, atime in self._touched.items()])
+        self._touched.clear()
+
+    def _disk_evict(self):
+        if self.disk_max_bytes is None:
+            return
+        total, = self._db.execute("SELECT COALESCE(SUM(nbytes), 0) FROM results").fetchone()
+        while total > self.disk_max_bytes:
+            row = self._db.execute("SELECT key, nbytes FROM results ORDER BY atime LIMIT 1").fetchone()
+            if row is None:
+                break
+            self._db.execute("DELETE FROM results WHERE key=?", (row[0],))
+            total -= row[1]
+            self.evictions += 1
+
+    def cached(self, func):
+        """Wrap `func` so that its results are cached on its inputs."""
+        name = f"{func.__module__}.{func.__qualname__}"
+        _missing = object()
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = input_hash(name, args, kwargs)
+            value = self.get(key, _missing)
+            if value is _missing:
+                value = self.set(key, func(*args, **kwargs))
+            return value
+        wrapper.cache = self
+        return wrapper
+
+
+def cached_entry_points(cache=None):
+    """The DNVSTF101 and DNV1981 check functions wrapped with a result cache.
+
+    :param cache: `ResultCache` (default a new memory-only cache)
+    :returns: dict of function name: cached function
+    """
+    from ..DNVSTF101 import pressure_containment_bursting, buckling_collapse, propagation_buckling
+    from ..DNV1981 import strength as DNV1981_strength
+    cache = ResultCache() if cache is None else cache
+    funcs = (
+        pressure_containment_bursting.pressure_containment_bursting,
+        pressure_containment_bursting.pressure_containment_bursting_check,
+        pressure_containment_bursting.pressure_containment_bursting_batch,
+        buckling_collapse.local_buckling_collapse_all,
+        propagation_buckling.local_buckling_propagation_all,
+        propagation_buckling.buckle_arrestor_batch,
+        DNV1981_strength.pressure_containment,
+    )
+    entry_points = {}
+    for func in funcs:
+        name = func.__name__
+        if func.__module__.endswith("DNV1981.strength"):
+            name = "DNV1981_" + name
+        entry_points[name] = cache.cached(func)
+    return entry_points
@@ -0,0 +1,135 @@
+"""
+Columnar store for load-case results.
+
+https://numpy.org/doc/stable/user/basics.types.html
+https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.to_parquet.html
+"""
+import logging
+
+import numpy as np
+import pandas as pd
+
+from .named_tuple import isinstance_namedtuple
+
+
+logger = logging.getLogger(__name__)
+
+
+class ResultStore:
+    """Columnar container for check function results.
+
+    Rows (namedtuples of scalars, e.g. one `local_buckling_collapse_all`
+    result per load case) or blocks (namedtuples, or dicts, of arrays) are
+    appended into preallocated typed NumPy columns, which grow by doubling.
+    Exports to pandas, Parquet and Excel use the columns directly, without
+    per-row copies.
+
+    >>> store = ResultStore()
+    >>> for case in loadcases:
+    ...     store.append(local_buckling_collapse_all(**case))
+    >>> df = store.to_dataframe()
+    """
+
+    def __init__(self, fields=None, capacity=1024):
+        self.fields = list(fields) if fields is not None else None
+        self.typename = None
+        self._capacity = capacity
+        self._columns = None
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def __repr__(self):
+        return f"ResultStore(typename={self.typename!r}, fields={self.fields}, rows={self._size})"
+
+    def __getitem__(self, field):
+        if self._columns is None:
+            raise KeyError(field)
+        return self._columns[field][:self._size]
+
+    @property
+    def columns(self):
+        """Dict of the stored columns (views, no copies)."""
+        if self._columns is None:
+            return {}
+        return {field: col[:self._size] for field, col in self._columns.items()}
+
+    def _allocate(self, values):
+        if self.fields is None:
+            self.fields = list(values)
+        self._columns = {}
+        for field in self.fields:
+            dtype = np.asarray(values[field]).dtype
+            if dtype.kind in "US":  # variable length strings
+                dtype = np.dtype(object)
+            self._columns[field] = np.empty(self._capacity, dtype=dtype)
+
+    def _promote(self, field, value):
+        """Widen the dtype of column `field` to hold `value`, e.g. an int
+        column (first row `p_min=0`) to float."""
+        col = self._columns[field]
+        dtype = np.asarray(value).dtype
+        if dtype.kind in "US":
+            dtype = np.dtype(object)
+        newdtype = np.result_type(col.dtype, dtype)
+        if newdtype != col.dtype:
+            newcol = np.empty(self._capacity, dtype=newdtype)
+            newcol[:self._size] = col[:self._size]
+            self._columns[field] = newcol
+
+    def _reserve(self, nrows):
+        needed = self._size + nrows
+        if needed <= self._capacity:
+            return
+        capacity = self._capacity
+        while capacity < needed:
+            capacity *= 2
+        for field, col in self._columns.items():
+            newcol = np.empty(capacity, dtype=col.dtype)
+            newcol[:self._size] = col[:self._size]
+            self._columns[field] = newcol
+        self._capacity = capacity
+
+    @staticmethod
+    def _as_dict(result):
+        if isinstance_namedtuple(result):
+            return type(result).__name__, result._asdict()
+        return None, result
+
+    def append(self, result):
+        """Append one row, a namedtuple (or dict) of scalar values."""
+        typename, values = self._as_dict(result)
+        if self._columns is None:
+            self.typename = typename
+            self._allocate(values)
+        self._reserve(1)
+        for field in self.fields:
+            self._promote(field, values[field])
+            self._columns[field][self._size] = values[field]
+        self._size += 1
+
+    def extend(self, result):
+        """Append a block of rows, a namedtuple (or dict) of arrays;
+        scalar values are broadcast to the block length."""
+        typename, values = self._as_dict(result)
+        nrows = max(np.size(values[field]) for field in (self.fields or values))
+        if self._columns is None:
+            self.typename = typename
+            self._allocate(values)
+        self._reserve(nrows)
+        for field in self.fields:
+            self._promote(field, values[field])
+            self._columns[field][self._size:self._size+nrows] = values[field]
+        self._size += nrows
+
+    def to_dataframe(self):
+        return pd.DataFrame(self.columns, copy=False)
+
+    def to_parquet(self, path, **kwargs):
+        """Write to a Parquet file (requires pyarrow or fastparquet)."""
+        self.to_dataframe().to_parquet(path, index=False, **kwargs)
+
+    def to_excel(self, path, sheet_name=None, **kwargs):
+        self.to_dataframe().to_excel(path, sheet_name=sheet_name or self.typename or "Sheet1",
+                                     index=False, **kwargs)
@@ -4,15 +4,14 @@ https://stackoverflow.com/questions/26180528/convert-a-namedtuple-into-a-diction
 """
 #from collections import namedtuple
 #import inspect
+from functools import reduce
 import logging
-import sys
 
-logger = logging.getLogger(__name__)
+import numpy as np
 
-from ..config import use_numpy
+from .backend import is_scalar
 
-if use_numpy:
-    import numpy as np
+logger = logging.getLogger(__name__)
 
 # use_numpy = False
 # if use_numpy:
@@ -53,15 +52,13 @@ if use_numpy:
 
 
 def min_nums_vectors(nums_vectors):
-    if all( list( map(lambda ii: isinstance(ii, (int, float)), nums_vectors) ) ):
+    if all(map(is_scalar, nums_vectors)):
         return min(nums_vectors)
-    # if use_numpy:
-    if "numpy" in sys.modules:
-        import numpy as np
-        # for itm in nums_vectors:
-        #     if isinstance(itm, np.ndarray):
-        mins = np.min( np.column_stack( np.broadcast_arrays(*nums_vectors) ), axis=1)
-        return mins
+    # element-wise pairwise minimum, avoids stacking the vectors into a
+    # temporary (N, k) array
+    # mins = np.min( np.column_stack( np.broadcast_arrays(*nums_vectors) ), axis=1)
+    mins = reduce(np.minimum, nums_vectors)
+    return mins
 
 
 
@@ -71,8 +68,6 @@ if __name__=="__main__":
     minval = min_nums_vectors(larray)
     print(f"{larray=} {minval=}")
 
-    if use_numpy:
-        import numpy as np
-        larray = [3, np.array([4,-6.2,3.2, -100.1]), -5, np.array([4,-2,3.2,40.1]), 0.8]
-        minval = min_nums_vectors(larray)
-        print(f"{larray=} {minval=}")
+    larray = [3, np.array([4,-6.2,3.2, -100.1]), -5, np.array([4,-2,3.2,40.1]), 0.8]
+    minval = min_nums_vectors(larray)
+    print(f"{larray=} {minval=}")
@@ -0,0 +1,62 @@
+import unittest
+
+import numpy as np
+
+from pdover2t.DNVSTF101.propagation_buckling import (crossover_pressure,
+    buckle_arrestor_unity, buckle_arrestor_batch, buckle_arrestor_band_length)
+
+
+basecase = {
+    "D_o": 0.3239, "t_nom": 0.0159, "t_fab": 0.001, "t_corr": 0.0, "t_ero": 0.0,
+    "SMYS": 450.e6, "α_U": 0.96, "f_ytemp": 0.0, "α_fab": 0.93,
+    "ρ_xwater": 1025., "γ_m": 1.15, "γ_SCLB": 1.14,
+}
+
+
+class BuckleArrestorTests(unittest.TestCase):
+
+    def setUp(self):
+        self.h_l = np.linspace(-100.0, -2000.0, 200)
+        self.L_BA = np.array([2.0, 6.0, 12.0])
+        self.t_BA = np.array([0.030, 0.040])
+
+    def test_unity_labels(self):
+        self.assertAlmostEqual(buckle_arrestor_unity(1.e6, 2.e6, limit_state="ULS", SC="high"),
+                               1.1 * 1.15 * 1.26 / 2.0)
+
+    def test_batch_matches_scalar(self):
+        res = buckle_arrestor_batch(**dict(basecase, h_l=self.h_l[:,None,None],
+                L_BA=self.L_BA[None,:,None], t_BA=self.t_BA[None,None,:]))
+        self.assertEqual(res.ba_uty.shape, (200, 3, 2))
+        ii, jj, kk = 150, 1, 0
+        p_prBA = buckle_arrestor_batch(**dict(basecase, h_l=self.h_l[ii],
+                L_BA=self.L_BA[jj], t_BA=self.t_BA[kk])).p_prBA
+        p_x = crossover_pressure(res.p_pr[ii,jj,kk], p_prBA, 0.3239, 0.0159, self.L_BA[jj])
+        self.assertAlmostEqual(res.p_x[ii,jj,kk], p_x)
+        self.assertAlmostEqual(res.ba_uty[ii,jj,kk],
+                buckle_arrestor_unity(res.p_e[ii,jj,kk], p_x, gamma_m=1.15, gamma_SCLB=1.14))
+
+    def test_min_length(self):
+        res = buckle_arrestor_batch(**dict(basecase, h_l=self.h_l[:,None],
+                L_BA=1.0, t_BA=self.t_BA[None,:]))
+        L_BA = res.L_BA_min
+        self.assertTrue(np.any(L_BA == 0.0))
+        self.assertTrue(np.any(L_BA > 0.0))
+        needed = L_BA > 0.0
+        check = buckle_arrestor_batch(**dict(basecase, h_l=self.h_l[:,None],
+                L_BA=np.where(needed, L_BA, 1.0), t_BA=self.t_BA[None,:]))
+        np.testing.assert_allclose(check.ba_uty[needed], 1.0)
+        bands = buckle_arrestor_band_length(self.h_l, L_BA, [0., 500., 1000., 1500., 2000.])
+        self.assertEqual(bands.shape, (4, 2))
+        self.assertTrue(np.all(np.diff(bands[:,1]) >= 0.0))
+        self.assertEqual(bands[3,1], np.nanmax(L_BA[:,1]))
+
+    def test_empty_band(self):
+        bands = buckle_arrestor_band_length([-100., -200., -900.], [0.0, 2.0, 5.0],
+                    [0., 500., 800., 1000.])
+        np.testing.assert_array_equal(bands, [2.0, np.nan, 5.0])
+
+
+
+if __name__ == '__main__':
+    unittest.main()
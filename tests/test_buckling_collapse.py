@@ -0,0 +1,96 @@
+import unittest
+
+import numpy as np
+
+from pdover2t.DNVSTF101.buckling_collapse import (pipe_ovality,
+    elastic_collapse_pressure, plastic_collapse_pressure,
+    characteristic_collapse_pressure_analytic,
+    characteristic_collapse_pressure_vectorized, local_buckling_collapse_all)
+
+
+basecase = {
+    "D_o": 0.6096, "t_nom": 0.0159, "t_fab": 0.001, "t_corr": 0.0, "t_ero": 0.0,
+    "SMYS": 450.e6, "f_ytemp": 35.e6, "α_U": 0.96, "α_fab": 0.93,
+    "E": 207.e9, "ν": 0.3, "O_0": 0.01, "ρ_xwater": 1025., "h_l": -55.0,
+    "γ_m": 1.15, "γ_SCLB": 1.14,
+}
+
+
+class CollapsePressureTests(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        N = 500
+        self.D_o = rng.uniform(0.1683, 1.0668, N)
+        self.t = self.D_o / rng.uniform(12.0, 45.0, N)
+        self.O_0 = rng.uniform(0.005, 0.03, N)
+        self.p_el = elastic_collapse_pressure(self.D_o, self.t, 207.e9, 0.3)
+        self.p_p = plastic_collapse_pressure(self.D_o, self.t, 432.e6, 0.93)
+
+    def test_vectorized_matches_analytic(self):
+        p_c = characteristic_collapse_pressure_vectorized(self.D_o, self.t,
+                    self.p_el, self.p_p, self.O_0)
+        for ii in range(0, len(p_c), 50):
+            p_c_ii = characteristic_collapse_pressure_analytic(self.D_o[ii],
+                    self.t[ii], self.p_el[ii], self.p_p[ii], self.O_0[ii])
+            self.assertAlmostEqual(p_c[ii] / p_c_ii, 1.0, places=10)
+
+    def test_vectorized_root(self):
+        p_c = characteristic_collapse_pressure_vectorized(self.D_o, self.t,
+                    self.p_el, self.p_p, self.O_0, tol=1.e-14)
+        # DNV-ST-F101 eq:5.11, smallest positive root
+        lhs = (p_c - self.p_el) * (p_c**2 - self.p_p**2)
+        rhs = p_c * self.p_el * self.p_p * self.O_0 * self.D_o / self.t
+        np.testing.assert_allclose(lhs, rhs, rtol=1.e-8)
+        self.assertTrue(np.all(p_c > 0.0))
+        self.assertTrue(np.all(p_c < np.minimum(self.p_el, self.p_p)))
+
+    def test_vectorized_broadcast(self):
+        p_c = characteristic_collapse_pressure_vectorized(0.6096, 0.0149,
+                    6.64e6, 18.1e6, [0.005, 0.01, 0.02])
+        self.assertEqual(p_c.shape, (3,))
+        self.assertTrue(np.all(np.diff(p_c) < 0.0))
+
+
+class LocalBucklingCollapseBatchTests(unittest.TestCase):
+
+    def test_pipe_ovality(self):
+        self.assertEqual(pipe_ovality(0.6096), 0.005)
+        O_0 = pipe_ovality(0.6096, np.array([0.6100, 0.6150]), np.array([0.6090, 0.6040]))
+        np.testing.assert_allclose(O_0, [0.005, 0.011/0.6096])
+
+    def test_batch_matches_scalar(self):
+        t_nom = [0.0159, 0.0191, 0.0254]
+        O_0 = [0.005, 0.01, 0.02]
+        h_l = [-55.0, -800.0, -2000.0]
+        res = local_buckling_collapse_all(**dict(basecase, t_nom=t_nom, O_0=O_0, h_l=h_l))
+        self.assertEqual(res.lb_collapse_uty.shape, (3,))
+        for ii in range(3):
+            res_ii = local_buckling_collapse_all(**dict(basecase, t_nom=t_nom[ii],
+                        O_0=O_0[ii], h_l=h_l[ii]))
+            self.assertAlmostEqual(res.lb_collapse_uty[ii], res_ii.lb_collapse_uty, places=10)
+            self.assertEqual(res.lb_collapse_check[ii], res_ii.lb_collapse_check)
+
+    def test_batch_other_columns(self):
+        D_o = [0.3239, 0.6096]
+        SMYS = [415.e6, 450.e6]
+        p_min = (0.0, 5.e5)
+        res = local_buckling_collapse_all(**dict(basecase, D_o=D_o, SMYS=SMYS, p_min=p_min))
+        self.assertEqual(res.lb_collapse_uty.shape, (2,))
+        for ii in range(2):
+            res_ii = local_buckling_collapse_all(**dict(basecase, D_o=D_o[ii],
+                        SMYS=SMYS[ii], p_min=p_min[ii]))
+            self.assertAlmostEqual(res.lb_collapse_uty[ii], res_ii.lb_collapse_uty, places=10)
+
+    def test_batch_measured_diameters(self):
+        D_max = np.array([0.6100, 0.6150, 0.6200])
+        D_min = np.array([0.6090, 0.6040, 0.5990])
+        case = dict(basecase, O_0=None, D_max=D_max, D_min=D_min)
+        res = local_buckling_collapse_all(**case)
+        self.assertEqual(res.lb_collapse_check.dtype, bool)
+        self.assertTrue(np.all(np.diff(res.lb_collapse_uty) > 0.0))
+
+
+
+if __name__ == '__main__':
+    unittest.main()
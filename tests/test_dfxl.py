@@ -0,0 +1,67 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import openpyxl
+
+from pdover2t.util.dfxl import loadcases2excel, loadcases2files
+from pdover2t.util.result_store import ResultStore
+from pdover2t.DNVSTF101.propagation_buckling import local_buckling_propagation_all
+
+
+basecase = {
+    "D_o": 0.6096, "t_nom": 0.0159, "t_fab": 0.001, "t_corr": 0.0, "t_ero": 0.0,
+    "SMYS": 450.e6, "SMTS": 535.e6, "α_U": 0.96, "f_ytemp": 35.e6,
+    "α_fab": 0.93, "ρ_xwater": 1025., "γ_m": 1.15, "γ_SCLB": 1.14,
+}
+
+
+class LoadcasesExportTests(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        results = [local_buckling_propagation_all(**dict(basecase, h_l=-h))
+                   for h in np.linspace(10.0, 1000.0, 50)]
+        store = ResultStore()
+        for ret in results:
+            store.append(ret)
+        batch = local_buckling_propagation_all(**dict(basecase, h_l=np.array([-10.0, -500.0, -1000.0])))
+        self.spec = [(results, "cases", "Propagation buckling", "24in"),
+                     (store, "store", "Propagation buckling"),
+                     (basecase, "inputs", "Inputs"),
+                     (batch, "batch", "Array fields"),
+                     ([results[0], batch], "mixed", "Scalar and array fields")]
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_write_only_matches(self):
+        xl_a = os.path.join(self.tmpdir.name, "a.xlsx")
+        xl_b = os.path.join(self.tmpdir.name, "b.xlsx")
+        loadcases2excel(xl_a, self.spec)
+        loadcases2excel(xl_b, self.spec, write_only=True)
+        wb_a, wb_b = openpyxl.load_workbook(xl_a), openpyxl.load_workbook(xl_b)
+        self.assertEqual(wb_a.sheetnames, wb_b.sheetnames)
+        for ws_a, ws_b in zip(wb_a.worksheets, wb_b.worksheets):
+            self.assertEqual([[c.value for c in r] for r in ws_a.iter_rows()],
+                             [[c.value for c in r] for r in ws_b.iter_rows()])
+            self.assertEqual([c.font.b for c in ws_a['A']], [c.font.b for c in ws_b['A']])
+        ws = wb_b["batch"]
+        self.assertEqual([c.value for c in ws[5]], [None, 0, 1, 2])
+        self.assertEqual(ws["A9"].value, "p_e")
+        self.assertAlmostEqual(ws["B9"].value, 10.0 * 1025. * 9.80665)
+
+    def test_csv_files(self):
+        basename = os.path.join(self.tmpdir.name, "study")
+        filenames = loadcases2files(basename, self.spec)
+        self.assertEqual(len(filenames), 5)
+        with open(basename + "_store.csv") as fh:
+            lines = fh.read().splitlines()
+        self.assertEqual(lines[0], "# Propagation buckling")
+        self.assertEqual(len(lines), 2 + 50)
+
+
+
+if __name__ == '__main__':
+    unittest.main()
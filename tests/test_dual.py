@@ -0,0 +1,61 @@
+import unittest
+
+import numpy as np
+
+from pdover2t.util.dual import seed, with_gradients
+from pdover2t.DNVSTF101.pressure_containment_bursting import pressure_containment_bursting
+from pdover2t.DNVSTF101.buckling_collapse import local_buckling_collapse_all
+from pdover2t.DNVSTF101.propagation_buckling import local_buckling_propagation_all
+
+
+basecase = {
+    "D_o": 24 * 25.4 * 1.e-3, "p_d": 150.e5, "t_nom": 0.0159, "t_corr": 0.0,
+    "t_ero": 0.0, "t_fab": 0.001, "SMYS": 450.e6, "f_ytemp": 35.e6,
+    "SMTS": 535.e6, "f_utemp": 0.e6, "α_U": 0.96, "γ_m": 1.15, "α_fab": 0.93,
+    "E": 207.e9, "ν": 0.3, "O_0": 0.01, "γ_inc": 1.10, "ρ_cont_d": 20.,
+    "ρ_t": 1025., "ρ_xwater": 1025., "α_spt": 1.05, "α_mpt": 1.088,
+    "γ_SCPC": 1.138, "γ_SCLB": 1.14, "h_ref": 0.0, "h_l": -350.0,
+}
+wrt = ["t_nom", "D_o", "SMYS", "p_d", "h_l"]
+
+
+class DualTests(unittest.TestCase):
+
+    def test_ufuncs(self):
+        x = seed({"x": np.array([0.2, 0.5])})["x"]
+        y = np.sqrt(x) * np.exp(2.0 * x) / (1.0 + x**2) - np.minimum(x, 0.3)
+        f = lambda x: np.sqrt(x) * np.exp(2.0 * x) / (1.0 + x**2) - np.minimum(x, 0.3)
+        fd = (f(x.value + 1.e-7) - f(x.value - 1.e-7)) / 2.e-7
+        np.testing.assert_allclose(y.grad[:, 0], fd, rtol=1.e-6)
+        np.testing.assert_array_equal(x < 0.3, [True, False])
+
+
+class GradientOptionTests(unittest.TestCase):
+
+    def check_gradients(self, func, field, case):
+        ret = func(**case, wrt=wrt)
+        np.testing.assert_allclose(getattr(ret.value, field), getattr(func(**case), field), rtol=1.e-12)
+        for name in wrt:
+            h = abs(case[name]) * 1.e-6
+            fd = (getattr(func(**dict(case, **{name: case[name] + h})), field) -
+                  getattr(func(**dict(case, **{name: case[name] - h})), field)) / (2 * h)
+            np.testing.assert_allclose(ret.grad[field][name], fd, rtol=1.e-6, atol=1.e-12,
+                                       err_msg=f"{field} {name}")
+
+    def test_scalar(self):
+        self.check_gradients(pressure_containment_bursting, "p_cont_res_uty", basecase)
+        self.check_gradients(local_buckling_collapse_all, "lb_collapse_uty", basecase)
+        self.check_gradients(local_buckling_propagation_all, "lb_prop_uty", basecase)
+
+    def test_arrays(self):
+        case = dict(basecase, h_l=np.linspace(-50., -2000., 20),
+                    t_nom=np.linspace(0.0143, 0.0254, 20))
+        self.check_gradients(local_buckling_collapse_all, "lb_collapse_uty", case)
+        ret = with_gradients(local_buckling_collapse_all, "O_0", **case)
+        self.assertEqual(ret.grad["p_c"]["O_0"].shape, (20,))
+        self.assertTrue(np.all(ret.grad["p_c"]["O_0"] < 0.0))
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import unittest
+
+import numpy as np
+
+from pdover2t.DNVSTF101.evaluation_graph import (evaluate_limit_states,
+    evaluate_nodes, evaluation_plan, graph_nodes, IncrementalEvaluation)
+from pdover2t.DNVSTF101.pressure_containment_bursting import (
+    pressure_containment_bursting_batch, pressure_containment_limits)
+from pdover2t.DNVSTF101.buckling_collapse import (local_buckling_collapse_all,
+    characteristic_collapse_pressure_solve, local_buckling_collapse_check)
+from pdover2t.DNVSTF101.propagation_buckling import (local_buckling_propagation_all,
+    propagating_pressure, local_buckling_propagation_check)
+
+
+basecase = {
+    "D_o": 24 * 25.4 * 1.e-3, "p_d": 150.e5, "t_nom": 0.0159, "t_corr": 0.0,
+    "t_ero": 0.0, "t_fab": 0.001, "SMYS": 450.e6, "f_ytemp": 35.e6,
+    "SMTS": 535.e6, "f_utemp": 0.e6, "α_U": 0.96, "γ_m": 1.15, "α_fab": 0.93,
+    "E": 207.e9, "ν": 0.3, "O_0": 0.01, "γ_inc": 1.10, "ρ_cont_d": 20.,
+    "ρ_t": 1025., "ρ_xwater": 1025., "α_spt": 1.05, "α_mpt": 1.088,
+    "γ_SCPC": 1.138, "γ_SCLB": 1.14, "h_ref": 0.0, "h_l": -350.0,
+}
+
+
+class EvaluationGraphTests(unittest.TestCase):
+
+    def check_results(self, case):
+        res = evaluate_limit_states(**case)
+        refs = (pressure_containment_bursting_batch(**case),
+                local_buckling_collapse_all(**case),
+                local_buckling_propagation_all(**case))
+        for ref in refs:
+            for field, value in ref._asdict().items():
+                np.testing.assert_allclose(res[field], value, err_msg=field)
+
+    def test_matches_check_functions(self):
+        self.check_results(basecase)
+        self.check_results(dict(basecase, h_l=np.linspace(-50., -2500., 50),
+                                t_nom=np.repeat([0.0159, 0.0254], 25)))
+
+    def test_nodes_wrap_check_functions(self):
+        for name, func in (("pressure_containment_limits", pressure_containment_limits),
+                           ("p_c", characteristic_collapse_pressure_solve),
+                           ("lb_collapse_check", local_buckling_collapse_check),
+                           ("p_pr", propagating_pressure),
+                           ("lb_prop_check", local_buckling_propagation_check)):
+            self.assertIs(graph_nodes[name][0], func, name)
+
+    def test_nodes_evaluated_once(self):
+        counts = {}
+        saved = dict(graph_nodes)
+        def counted(name, func):
+            def wrapper(*args):
+                counts[name] = counts.get(name, 0) + 1
+                return func(*args)
+            return wrapper
+        try:
+            for name, (func, inputs) in saved.items():
+                graph_nodes[name] = (counted(name, func), inputs)
+            evaluate_limit_states(**basecase)
+        finally:
+            graph_nodes.update(saved)
+        self.assertEqual(set(counts.values()), {1})
+        self.assertIn("f_y", counts)
+        self.assertNotIn("O_0", counts)  # given as input
+
+    def test_plan(self):
+        plan, inputs = evaluation_plan(("p_b",))
+        self.assertEqual(plan, ("t_1", "f_y", "f_u", "p_b"))
+        self.assertEqual(set(inputs), {"D_o", "t_nom", "t_fab", "t_corr", "t_ero",
+                                       "SMYS", "α_U", "f_ytemp", "SMTS", "f_utemp"})
+        with self.assertRaises(TypeError):
+            evaluate_nodes(["p_b"], D_o=0.3)
+        res = evaluate_nodes(["p_b"], **dict(basecase, f_y=400.e6))
+        self.assertEqual(res["f_y"], 400.e6)
+
+
+class IncrementalEvaluationTests(unittest.TestCase):
+
+    def setUp(self):
+        self.case = dict(basecase, h_l=np.linspace(-50., -2500., 200))
+        self.ev = IncrementalEvaluation(**self.case)
+
+    def assert_matches_full(self):
+        ref = evaluate_limit_states(**self.ev.inputs)
+        for name, value in self.ev.results.items():
+            np.testing.assert_array_equal(value, ref[name], err_msg=name)
+
+    def test_update_design_pressure(self):
+        recomputed = self.ev.update(p_d=200.e5)
+        self.assertIn("p_li", recomputed)
+        self.assertIn("uty_p_li", recomputed)
+        for name in ("t_1", "f_y", "p_b", "p_e", "p_c", "lb_collapse_uty", "p_pr"):
+            self.assertNotIn(name, recomputed)
+        self.assert_matches_full()
+
+    def test_update_corrosion(self):
+        recomputed = self.ev.update(t_corr=0.003)
+        self.assertTrue({"t_1", "t_2", "p_b", "p_c", "p_pr"} <= set(recomputed))
+        self.assertNotIn("t_min_mpt", recomputed)
+        self.assertNotIn("p_e", recomputed)
+        self.assert_matches_full()
+
+    def test_unchanged(self):
+        self.assertEqual(self.ev.update(p_d=basecase["p_d"],
+                                        h_l=self.case["h_l"].copy()), ())
+        self.assertEqual(self.ev.update(f_y=380.e6)[0], "p_b")
+        self.assert_matches_full()
+
+
+
+if __name__ == '__main__':
+    unittest.main()
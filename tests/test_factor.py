@@ -0,0 +1,40 @@
+import unittest
+
+import numpy as np
+
+from pdover2t.pipe.factor import (gamma_m_map, gamma_SCPC_map, gamma_SCLB_map,
+    alpha_U_map, alpha_mpt_map, alpha_spt_map, alpha_fab_map)
+
+
+class FactorMapTests(unittest.TestCase):
+
+    def test_labels(self):
+        self.assertEqual(gamma_m_map("uls"), 1.15)
+        self.assertEqual(gamma_SCPC_map("Medium"), 1.138)
+        self.assertEqual(gamma_SCLB_map("low"), 1.04)
+        self.assertEqual(alpha_U_map(supplementary_requirement="U"), 1.00)
+        self.assertEqual(alpha_U_map(), 0.96)
+        self.assertEqual(alpha_spt_map("LOW"), 1.03)
+        self.assertEqual(alpha_fab_map("UOE"), 0.85)
+        self.assertEqual(alpha_fab_map("unknown"), 0.85)
+        self.assertAlmostEqual(alpha_mpt_map(gamma_m=1.15, gamma_SCPC=1.138),
+                               1.15 * 1.138 * 0.96 * 3**0.5 / 2)
+
+    def test_numbers(self):
+        self.assertEqual(gamma_m_map(1.15), 1.15)
+        with self.assertLogs("pdover2t.pipe.factor", "WARNING"):
+            self.assertEqual(alpha_fab_map(0.5), 0.5)
+
+    def test_label_arrays(self):
+        SC = np.array(["high", "medium", "medium", "low", "high"])
+        np.testing.assert_array_equal(gamma_SCPC_map(SC),
+                                      [1.308, 1.138, 1.138, 1.046, 1.308])
+        np.testing.assert_array_equal(alpha_mpt_map(SC.reshape(5, 1))[:,0],
+                                      [1.251, 1.088, 1.088, 1.000, 1.251])
+        np.testing.assert_array_equal(alpha_fab_map(["seamless", 0.9, "UO"]),
+                                      [1.0, 0.9, 0.93])
+
+
+
+if __name__ == '__main__':
+    unittest.main()
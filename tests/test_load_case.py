@@ -0,0 +1,103 @@
+import pickle
+import re
+import unittest
+
+import numpy as np
+
+from pdover2t.DNVSTF101.load_case import (validate_load_case, LoadCase,
+    canonical_name)
+from pdover2t.DNVSTF101.buckling_collapse import local_buckling_collapse_all
+from pdover2t.DNVSTF101.pressure_containment_bursting import pressure_containment_bursting_batch
+from pdover2t.pipe.pipe_set import PipeSet
+
+
+basecase = {
+    "D_o": 24 * 25.4 * 1.e-3, "t_nom": 0.0159, "p_d": 150.e5, "t_corr": 0.0,
+    "t_ero": 0.0, "t_fab": 0.001, "SMYS": 450.e6, "f_ytemp": 35.e6,
+    "SMTS": 535.e6, "f_utemp": 0.e6, "α_U": 0.96, "γ_m": 1.15, "α_fab": 0.93,
+    "E": 207.e9, "ν": 0.3, "O_0": 0.01, "γ_inc": 1.10, "ρ_cont_d": 20.,
+    "ρ_t": 1025., "ρ_xwater": 1025., "α_spt": 1.05, "α_mpt": 1.088,
+    "γ_SCPC": 1.138, "γ_SCLB": 1.14, "h_ref": 0.0,
+}
+
+
+class LoadCaseValidationTests(unittest.TestCase):
+
+    def setUp(self):
+        self.h_l = np.linspace(-50.0, -2000.0, 100)
+
+    def test_columnar_frozen(self):
+        case = validate_load_case(basecase, {"h_l": self.h_l},
+                                  entry_points=[local_buckling_collapse_all])
+        self.assertIsInstance(case, LoadCase)
+        self.assertEqual(case.size, 100)
+        self.assertIsInstance(case["SMYS"], float)
+        self.assertFalse(case["h_l"].flags.writeable)
+        with self.assertRaises(AttributeError):
+            case.size = 3
+        ret = local_buckling_collapse_all(**case)
+        ref = local_buckling_collapse_all(**dict(basecase, h_l=self.h_l))
+        np.testing.assert_array_equal(ret.lb_collapse_uty, ref.lb_collapse_uty)
+        # already validated: returned as is
+        self.assertIs(validate_load_case(case), case)
+        copy = pickle.loads(pickle.dumps(case))
+        np.testing.assert_array_equal(copy["h_l"], case["h_l"])
+
+    def test_records_units_and_labels(self):
+        records = [dict(basecase, p_d=p_d, h_l=h_l, γ_SCPC="medium")
+                   for p_d, h_l in [(150., -100.), (200., -500.)]]
+        case = validate_load_case(records, units={"p_d": "bar"})
+        np.testing.assert_array_equal(case["p_d"], [150.e5, 200.e5])
+        np.testing.assert_array_equal(case["γ_SCPC"], [1.138, 1.138])
+        ret = pressure_containment_bursting_batch(**case)
+        self.assertEqual(ret.uty_p_li.shape, (2,))
+
+    def test_unknown_and_misspelled(self):
+        with self.assertRaisesRegex(ValueError, "«SMYs», did you mean «SMYS»"):
+            validate_load_case(dict(basecase, SMYs=450.e6))
+        case = validate_load_case(dict(basecase, SMYs=450.e6), strict=False)
+        self.assertNotIn("SMYs", case)
+
+    def test_duplicates(self):
+        self.assertEqual(canonical_name("alpha_U"), "α_U")
+        self.assertEqual(canonical_name("rho_xwater"), "ρ_xwater")
+        with self.assertRaisesRegex(ValueError, "duplicate parameter «α_U»"):
+            validate_load_case(dict(basecase, alpha_U=1.0))
+        with self.assertRaisesRegex(ValueError, "duplicate parameter «D_o»"):
+            validate_load_case(basecase, PipeSet(D_o=[0.3, 0.4]))
+
+    def test_ranges_types_units(self):
+        msgs = {
+            "«p_d»: value(s) 150..150 outside": dict(basecase, p_d=150.),
+            "«t_nom»: NaN": dict(basecase, t_nom=np.array([0.015, np.nan])),
+            "«E»: not numeric": dict(basecase, E="steel"),
+            "«γ_SCPC»: unknown label": dict(basecase, γ_SCPC="mediun"),
+        }
+        for msg, case in msgs.items():
+            with self.assertRaisesRegex(ValueError, re.escape(msg)):
+                validate_load_case(case)
+        with self.assertRaisesRegex(ValueError, "unit «bar» not convertible"):
+            validate_load_case(basecase, units={"D_o": "bar"})
+        with self.assertRaisesRegex(ValueError, "different lengths"):
+            validate_load_case(basecase, dict(h_l=self.h_l, p_min=[0.0, 1.0]))
+
+    def test_missing_required(self):
+        case = dict(basecase)
+        del case["γ_SCLB"]
+        with self.assertRaisesRegex(ValueError, "requires «h_l», «γ_SCLB»"):
+            validate_load_case(case, entry_points=[local_buckling_collapse_all])
+
+    def test_pipe_set_take_replace(self):
+        loads = {k: v for k, v in basecase.items() if k not in ("D_o", "t_nom")}
+        pipes = PipeSet(D_o=np.full(100, 0.6096), t_nom=np.linspace(0.012, 0.03, 100))
+        case = validate_load_case(pipes, loads, {"h_l": self.h_l})
+        sub = case.take(slice(10, 20))
+        self.assertEqual(sub.size, 10)
+        self.assertTrue(np.shares_memory(sub["t_nom"], case["t_nom"]))
+        deeper = case.replace(h_l=self.h_l - 100.)
+        self.assertIs(deeper["t_nom"], case["t_nom"])
+        np.testing.assert_array_equal(deeper["h_l"], self.h_l - 100.)
+
+
+if __name__ == '__main__':
+    unittest.main()
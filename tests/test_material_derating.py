@@ -0,0 +1,77 @@
+import unittest
+
+import numpy as np
+
+from pdover2t.pipe.material import (material_strength_derating,
+    register_derating_curve, temperature_derating, derating_curves,
+    characteristic_material_strength, temperature_profile,
+    characteristic_strength_profile)
+
+
+class MaterialDeratingTests(unittest.TestCase):
+
+    def test_registered_materials(self):
+        self.assertEqual(material_strength_derating(100, material="22Cr"), 90.e6)
+        self.assertEqual(material_strength_derating(100, material="C-Mn"), 30.e6)
+        self.assertEqual(material_strength_derating(120, curve=[(40,0), (100,50), (200,100)]), 60.0)
+        self.assertIsNone(material_strength_derating(100, material="unobtainium"))
+
+    def test_profile(self):
+        T = np.linspace(0., 250., 1001)
+        f_ytemp = material_strength_derating(T, material="13 Cr")
+        self.assertEqual(f_ytemp.shape, T.shape)
+        for ii in range(0, len(T), 100):
+            self.assertEqual(f_ytemp[ii], material_strength_derating(T[ii], material="CMn"))
+        ret = temperature_derating(T, "DSS")
+        np.testing.assert_array_equal(ret.f_ytemp, ret.f_utemp)
+
+    def test_unknown_material(self):
+        with self.assertLogs("pdover2t.pipe.material", level="ERROR"):
+            with self.assertRaisesRegex(ValueError, "unobtainium.*22CR"):
+                temperature_derating(100., "unobtainium")
+        with self.assertLogs("pdover2t.pipe.material", level="ERROR"):
+            with self.assertRaises(ValueError):
+                temperature_derating(100., None)
+
+    def test_user_curve(self):
+        register_derating_curve("test-mat", [(0., 0.), (100., 10.e6)],
+                                curve_u=[(0., 0.), (50., 10.e6)])
+        try:
+            ret = temperature_derating([25., 75.], "TESTMAT")
+            np.testing.assert_allclose(ret.f_ytemp, [2.5e6, 7.5e6])
+            np.testing.assert_allclose(ret.f_utemp, [5.0e6, 10.e6])
+        finally:
+            derating_curves.pop("TESTMAT")
+        with self.assertRaises(ValueError):
+            register_derating_curve("bad", [(100., 0.), (50., 1.e6)])
+
+
+class StrengthProfileTests(unittest.TestCase):
+
+    def setUp(self):
+        self.KP = np.linspace(0.0, 40.0, 401)
+
+    def test_temperature_profile(self):
+        T = temperature_profile(self.KP, T_inlet=120., T_ambient=4., decay_length=10.)
+        self.assertEqual(T[0], 120.)
+        self.assertAlmostEqual(T[100], 4. + 116. * np.exp(-1.0))
+        self.assertTrue(np.all(np.diff(T) < 0.0))
+        T = temperature_profile(self.KP, table=[(0., 90.), (20., 30.), (40., 10.)])
+        self.assertEqual(T[100], 60.)
+        with self.assertRaises(ValueError):
+            temperature_profile(self.KP, T_inlet=120.)
+
+    def test_matches_scalar(self):
+        sp = characteristic_strength_profile(self.KP, 450.e6, 535.e6, 0.96, "22Cr",
+                T_inlet=150., T_ambient=4., decay_length=8.)
+        self.assertEqual(sp.f_y.shape, self.KP.shape)
+        for ii in range(0, len(self.KP), 40):
+            self.assertAlmostEqual(sp.f_y[ii], characteristic_material_strength(
+                450.e6, 0.96, material="22Cr", T=sp.T[ii]))
+            self.assertAlmostEqual(sp.f_u[ii], characteristic_material_strength(
+                535.e6, 0.96, material="22Cr", T=sp.T[ii]))
+
+
+
+if __name__ == '__main__':
+    unittest.main()
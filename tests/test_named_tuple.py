@@ -0,0 +1,46 @@
+import pickle
+import unittest
+
+from pdover2t.util.named_tuple import (make_return_namedtuple,
+    result_namedtuple, isinstance_namedtuple)
+from pdover2t.DNVSTF101.propagation_buckling import local_buckling_propagation_all
+
+
+basecase = {
+    "D_o": 0.6096, "t_nom": 0.0159, "t_fab": 0.001, "t_corr": 0.0, "t_ero": 0.0,
+    "SMYS": 450.e6, "SMTS": 535.e6, "α_U": 0.96, "f_ytemp": 35.e6,
+    "α_fab": 0.93, "ρ_xwater": 1025., "h_l": -55.0, "γ_m": 1.15, "γ_SCLB": 1.14,
+}
+
+
+def a_function():
+    a = 1
+    b = "2"
+    return make_return_namedtuple("a b")
+
+
+class ResultNamedtupleTests(unittest.TestCase):
+
+    def test_type_cached(self):
+        self.assertIs(result_namedtuple("a_result", "x, y"),
+                      result_namedtuple("a_result", ["x", "y"]))
+        self.assertIsNot(result_namedtuple("a_result", "x, y"),
+                         result_namedtuple("a_result", "x, z"))
+
+    def test_make_return_namedtuple(self):
+        ret = a_function()
+        self.assertEqual(type(ret).__name__, "a_function")
+        self.assertEqual(ret._asdict(), {"a": 1, "b": "2"})
+        self.assertIs(type(ret), type(a_function()))
+
+    def test_pickle(self):
+        ret = local_buckling_propagation_all(**basecase)
+        self.assertTrue(isinstance_namedtuple(ret, "local_buckling_propagation_all"))
+        ret2 = pickle.loads(pickle.dumps(ret))
+        self.assertEqual(ret, ret2)
+        self.assertIs(type(ret), type(ret2))
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import unittest
+
+import numpy as np
+
+from pdover2t.util.param_study import ParamGrid, param_sweep, run_param_study
+from pdover2t.DNVSTF101.propagation_buckling import local_buckling_propagation_all
+from pdover2t.DNVSTF101.buckling_collapse import local_buckling_collapse_all
+
+
+basecase = {
+    "D_o": 0.6096, "t_fab": 0.001, "t_corr": 0.0, "t_ero": 0.0,
+    "SMYS": 450.e6, "SMTS": 535.e6, "α_U": 0.96, "f_ytemp": 35.e6,
+    "α_fab": 0.93, "ρ_xwater": 1025., "γ_m": 1.15, "γ_SCLB": 1.14,
+    "E": 207.e9, "ν": 0.3,
+}
+
+
+class ParamGridTests(unittest.TestCase):
+
+    def setUp(self):
+        self.lists = ([1.0, 2.0, 3.0, 4.0], np.array([11, 12, 13]), ("a", "b"))
+        self.grid = ParamGrid(*self.lists, names=["x", "n", "s"])
+
+    def test_matches_param_sweep(self):
+        full = param_sweep(*self.lists)
+        self.assertEqual(len(self.grid), 24)
+        for arr, ref in zip(self.grid[:], full):
+            np.testing.assert_array_equal(arr, ref)
+        for arr, ref in zip(self.grid[5:17:3], full):
+            np.testing.assert_array_equal(arr, ref[5:17:3])
+        self.assertEqual(self.grid[-1], (4.0, 13, "b"))
+
+    def test_dtypes_kept(self):
+        x, n, s = self.grid[0:4]
+        self.assertEqual(x.dtype, np.float64)
+        self.assertTrue(np.issubdtype(n.dtype, np.integer))
+        self.assertEqual(s.dtype.kind, "U")
+
+    def test_chunks(self):
+        chunks = list(self.grid.chunks(10))
+        self.assertEqual([(a, b) for a, b, _ in chunks], [(0, 10), (10, 20), (20, 24)])
+
+    def test_lazy_large_grid(self):
+        grid = ParamGrid(*[np.arange(100)] * 9)
+        self.assertEqual(len(grid), 100**9)
+        indices, (p0, *_, p8) = grid.sample(5, seed=1)
+        np.testing.assert_array_equal(p0, indices // 100**8)
+        np.testing.assert_array_equal(p8, indices % 100)
+        self.assertEqual(len(grid.columns([0, 1])[0]), 2)
+
+    def test_take_indices(self):
+        for arr, ref in zip(self.grid.take([-1, -24, 5]), zip(self.grid[-1], self.grid[0], self.grid[5])):
+            self.assertEqual(list(arr), list(ref))
+        with self.assertRaises(IndexError):
+            self.grid.take([24])
+        with self.assertRaises(IndexError):
+            self.grid.take([0, -25])
+
+    def test_no_lists(self):
+        with self.assertRaises(ValueError):
+            ParamGrid()
+        self.assertEqual(param_sweep(), ())
+
+
+class RunParamStudyTests(unittest.TestCase):
+
+    def test_parallel_matches_serial(self):
+        grid = ParamGrid(np.linspace(0.012, 0.030, 7), np.linspace(-50., -1500., 11),
+                         names=["t_nom", "h_l"])
+        serial = run_param_study(local_buckling_propagation_all, grid,
+                        chunksize=10, processes=1, **basecase)
+        parallel = run_param_study(local_buckling_propagation_all, grid,
+                        chunksize=10, processes=2, **basecase)
+        self.assertEqual(list(serial), ["t_nom", "h_l", "D_over_t_check",
+                        "p_pr", "p_e", "lb_prop_uty", "lb_prop_check"])
+        for field in serial:
+            np.testing.assert_array_equal(serial[field], parallel[field])
+        ret = local_buckling_propagation_all(**dict(basecase, t_nom=grid[40][0], h_l=grid[40][1]))
+        self.assertAlmostEqual(parallel["lb_prop_uty"][40], ret.lb_prop_uty)
+
+    def test_empty_axis(self):
+        with self.assertRaises(ValueError):
+            ParamGrid(np.linspace(0.012, 0.030, 7), [], names=["t_nom", "h_l"])
+
+
+class RunParamStudyCollapseTests(unittest.TestCase):
+
+    def setUp(self):
+        self.grid = ParamGrid(np.linspace(0.012, 0.030, 7), [0.005, 0.01, 0.02],
+                        np.linspace(-50.0, -2500.0, 11), names=["t_nom", "O_0", "h_l"])
+
+    def test_parallel_matches_serial(self):
+        serial = run_param_study(local_buckling_collapse_all, self.grid,
+                    chunksize=50, processes=1, **basecase)
+        parallel = run_param_study(local_buckling_collapse_all, self.grid,
+                    chunksize=17, processes=2, **basecase)
+        self.assertEqual(list(serial), list(parallel))
+        for field in serial:
+            self.assertEqual(len(serial[field]), len(self.grid))
+            np.testing.assert_array_equal(serial[field], parallel[field])
+
+    def test_row_order(self):
+        res = run_param_study(local_buckling_collapse_all, self.grid,
+                    chunksize=40, processes=1, **basecase)
+        ii = 123
+        row = dict(zip(self.grid.names, self.grid[ii]))
+        ref = local_buckling_collapse_all(**basecase, **row)
+        self.assertAlmostEqual(res["lb_collapse_uty"][ii], ref.lb_collapse_uty, places=12)
+        self.assertEqual(res["t_nom"][ii], row["t_nom"])
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import pickle
+import unittest
+
+import numpy as np
+
+from pdover2t.pipe.pipe import (PipeCoat, pipeCoatLayer, pipeline_properties,
+    linepipe_properties)
+from pdover2t.pipe.pipe_set import PipeSet, PipeView
+from pdover2t.DNVSTF101.pressure_containment_bursting import pressure_containment_bursting_batch
+
+
+class PipeSetTests(unittest.TestCase):
+
+    def setUp(self):
+        N = 1000
+        self.D_o = np.linspace(0.2, 0.9, N)
+        self.pipes = PipeSet(D_o=self.D_o, t_nom=self.D_o / 20, ρ_pipe=7850.,
+                             coat_thk=[0.003, 0.05], coat_ρ=[1450., 2400.])
+
+    def test_columns(self):
+        pipes = self.pipes
+        self.assertEqual(pipes.size, 1000)
+        self.assertEqual(set(pipes), {"D_o", "t_nom", "ρ_pipe", "coat_thk", "coat_ρ"})
+        self.assertEqual(pipes["ρ_pipe"].shape, (1000,))
+        self.assertEqual(pipes.coat_thk.shape, (1000, 2))
+        self.assertFalse(pipes.D_o.flags.writeable)
+        # broadcast numbers and coating are stored once
+        self.assertEqual(pipes.nbytes, 2 * 1000 * 8 + 8 + 2 * 2 * 8)
+
+    def test_zero_copy_slice(self):
+        sub = self.pipes[100:200:2]
+        self.assertIsInstance(sub, PipeSet)
+        self.assertEqual(sub.size, 50)
+        self.assertTrue(np.shares_memory(sub.D_o, self.D_o))
+        np.testing.assert_array_equal(sub.t_nom, self.D_o[100:200:2] / 20)
+        mask = self.pipes[self.pipes.D_o > 0.5]
+        self.assertEqual(mask.size, int(np.sum(self.D_o > 0.5)))
+
+    def test_view(self):
+        view = self.pipes[-1]
+        self.assertIsInstance(view, PipeView)
+        self.assertEqual(view.D_o, 0.9)
+        self.assertEqual(view["ρ_pipe"], 7850.)
+        self.assertFalse(hasattr(view, "__dict__"))
+        self.assertEqual(view.coat.thickness.tolist(), [0.003, 0.05])
+        with self.assertRaises(IndexError):
+            self.pipes[1000]
+        with self.assertRaises(AttributeError):
+            view.SMYS
+
+    def test_unpacking(self):
+        loads = dict(t_fab=0.001, t_corr=0.0, t_ero=0.0, SMYS=450.e6, SMTS=535.e6,
+            α_U=1.0, f_ytemp=0.0, f_utemp=0.0, p_d=240.e5, p_t=264.e5, γ_inc=1.1,
+            h_ref=30., ρ_cont_d=275., ρ_t=1025., ρ_xwater=1025., h_l=-300.,
+            α_spt=1.05, γ_m=1.15, γ_SCPC=1.138, α_mpt=1.251)
+        ret = pressure_containment_bursting_batch(**self.pipes[:10], **loads)
+        self.assertEqual(ret.uty_p_li.shape, (10,))
+        one = pressure_containment_bursting_batch(**self.pipes[3], **loads)
+        self.assertAlmostEqual(one.uty_p_li.item(), ret.uty_p_li[3])
+
+    def test_pipeline_properties(self):
+        ret = self.pipes.pipeline_properties(ρ_xwater=1025.)
+        view = self.pipes[500]
+        lp = linepipe_properties(D_o=view.D_o, t_nom=view.t_nom, ρ_pipe=7850., ρ_xwater=1025.)
+        ref = pipeline_properties(coat=view.coat, D_o=view.D_o, mass_ld=lp.mass_ld, ρ_xwater=1025.)
+        self.assertAlmostEqual(ret.submass_ld[500], ref.submass_ld, places=9)
+
+    def test_unpack_into_pipeline_properties(self):
+        pipes = PipeSet(D_o=[0.3239, 0.2731], mass_ld=[120., 83.], coat_thk=[0.003],
+                        coat_ρ=[1450.])
+        ret = pipeline_properties(**pipes, ρ_xwater=1025.)
+        coat = [pipeCoatLayer(0.003, 1450., "FBE")]
+        for ii in range(2):
+            ref = pipeline_properties(coat=coat, D_o=pipes.D_o[ii],
+                        mass_ld=pipes.mass_ld[ii], ρ_xwater=1025.)
+            self.assertAlmostEqual(ret.submass_ld[ii], ref.submass_ld, places=9)
+        # read-only mass_ld column with a layer list
+        bare = PipeSet(D_o=[0.3239, 0.2731], mass_ld=[120., 83.])
+        ret = pipeline_properties(coat=coat, **bare, ρ_xwater=1025.)
+        np.testing.assert_allclose(ret.submass_ld,
+            pipeline_properties(**pipes, ρ_xwater=1025.).submass_ld, rtol=1e-12)
+        self.assertEqual(list(bare.mass_ld), [120., 83.])
+        with self.assertRaises(ValueError):
+            pipeline_properties(coat=coat, **pipes, ρ_xwater=1025.)
+
+    def test_from_records(self):
+        records = [dict(D_o=0.3239, t_nom=0.0159, coat=PipeCoat([pipeCoatLayer(0.003, 1450., "FBE")])),
+                   dict(D_o=0.2731, t_nom=0.0127, coat=[pipeCoatLayer(0.003, 1450., "FBE"),
+                                                        pipeCoatLayer(0.04, 2400., "CWC")])]
+        pipes = PipeSet.from_records(records)
+        self.assertEqual(pipes.size, 2)
+        np.testing.assert_array_equal(pipes.coat_thk, [[0.003, 0.0], [0.003, 0.04]])
+        again = PipeSet.from_records(pipes.rows())
+        np.testing.assert_array_equal(again.coat_ρ, pipes.coat_ρ)
+
+    def test_with_columns_and_pickle(self):
+        pipes = self.pipes.with_columns(SMYS=450.e6)
+        self.assertIs(pipes.D_o, self.pipes.D_o)
+        self.assertNotIn("SMYS", self.pipes)
+        copy = pickle.loads(pickle.dumps(pipes))
+        np.testing.assert_array_equal(copy.D_o, pipes.D_o)
+
+    def test_length_mismatch(self):
+        with self.assertRaises(ValueError):
+            PipeSet(D_o=[0.3, 0.4], t_nom=[0.01, 0.02, 0.03])
+
+
+if __name__ == '__main__':
+    unittest.main()
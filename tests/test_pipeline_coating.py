@@ -0,0 +1,96 @@
+import unittest
+
+import numpy as np
+
+from pdover2t.pipe.pipe import (pipeline_properties, pipeline_properties_batch,
+    pipeCoatLayer, concrete_coating_thickness, tubular_properties)
+
+
+class PipelineCoatingBatchTests(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(4)
+        N = 50
+        self.D_o = rng.uniform(0.2, 0.9, N)
+        self.mass_ld = rng.uniform(80.0, 400.0, N)
+        self.thk = np.column_stack([np.full(N, 0.003), np.full(N, 0.005),
+                                    rng.uniform(0.0, 0.12, N)])
+        self.ρ = np.array([1450., 900., 3040.])
+
+    def test_matches_layer_loop(self):
+        ret = pipeline_properties_batch(D_o=self.D_o, mass_ld=self.mass_ld,
+                    coat_thk=self.thk, coat_ρ=self.ρ, ρ_xwater=1025.)
+        self.assertEqual(ret.submass_ld.shape, (50,))
+        for ii in range(0, 50, 7):
+            coat = [pipeCoatLayer(t, ρ, "") for t, ρ in zip(self.thk[ii], self.ρ)]
+            ref = pipeline_properties(coat=coat, D_o=self.D_o[ii],
+                    mass_ld=self.mass_ld[ii], ρ_xwater=1025.)
+            for field, value in ref._asdict().items():
+                self.assertAlmostEqual(getattr(ret, field)[ii], value, places=9)
+
+    def test_zero_padding(self):
+        one = pipeline_properties_batch(D_o=0.3239, mass_ld=120., coat_thk=[0.05],
+                    coat_ρ=[2400.], ρ_xwater=1025.)
+        padded = pipeline_properties_batch(D_o=0.3239, mass_ld=120., coat_thk=[0.05, 0.0],
+                    coat_ρ=[2400., 900.], ρ_xwater=1025.)
+        self.assertEqual(tuple(one), tuple(padded))
+
+    def test_bare_pipe(self):
+        ret = pipeline_properties_batch(D_o=self.D_o, mass_ld=self.mass_ld,
+                    coat_thk=np.empty((50, 0)), coat_ρ=[], ρ_xwater=1025.)
+        np.testing.assert_array_equal(ret.D_buoy, self.D_o)
+        np.testing.assert_array_equal(ret.mass_ld, self.mass_ld)
+        ref = pipeline_properties(coat=[], D_o=self.D_o[3], mass_ld=self.mass_ld[3],
+                    ρ_xwater=1025.)
+        self.assertAlmostEqual(ret.submass_ld[3], ref.submass_ld, places=9)
+
+
+class ConcreteCoatingThicknessTests(unittest.TestCase):
+
+    def setUp(self):
+        # design matrix: contents density x corrosion coating x seawater density
+        self.case = dict(D_o=0.3239, t_nom=0.0159, ρ_pipe=7850.,
+            ρ_cont=np.array([0., 150., 1025.])[:, None, None],
+            coat_thk=np.array([[0.003, 0.0], [0.003, 0.05]])[None, :, None, :],
+            coat_ρ=[1450., 900.], ρ_conc=3040.,
+            ρ_xwater=np.array([1020., 1025., 1030.]))
+
+    def test_target_submerged_weight(self):
+        ret = concrete_coating_thickness(target_submass_ld=150., **self.case)
+        self.assertEqual(ret.t_conc.shape, (3, 2, 3))
+        self.assertTrue(np.all(ret.t_conc >= 0.0))
+        np.testing.assert_allclose(ret.submass_ld[ret.t_conc > 0], 150., rtol=1e-10)
+        # check one configuration against the coating layer loop
+        D_i = 0.3239 - 2*0.0159
+        mass_ld = (tubular_properties(0.3239, 0.0159, 7850.).mass_ld
+                   + np.pi/4*D_i**2*150.)
+        coat = [pipeCoatLayer(0.003, 1450., ""), pipeCoatLayer(0.05, 900., ""),
+                pipeCoatLayer(ret.t_conc[1, 1, 2], 3040., "")]
+        ref = pipeline_properties(coat=coat, D_o=0.3239, mass_ld=mass_ld, ρ_xwater=1030.)
+        self.assertAlmostEqual(ref.submass_ld, 150., places=8)
+
+    def test_target_specific_gravity(self):
+        ret = concrete_coating_thickness(target_SG=1.3, **self.case)
+        np.testing.assert_allclose(ret.SG[ret.t_conc > 0], 1.3, rtol=1e-10)
+
+    def test_no_concrete_and_unreachable(self):
+        ret = concrete_coating_thickness(target_submass_ld=[-50., 150.], D_o=0.3239,
+                t_nom=0.0159, ρ_pipe=7850., ρ_conc=3040., ρ_xwater=1025.)
+        self.assertEqual(ret.t_conc[0], 0.0)
+        self.assertGreater(ret.t_conc[1], 0.0)
+        ret = concrete_coating_thickness(target_SG=3.5, D_o=0.3239,
+                t_nom=0.0159, ρ_pipe=7850., ρ_conc=3040., ρ_xwater=1025.)
+        self.assertTrue(np.isnan(ret.t_conc))
+
+    def test_rounding(self):
+        ret = concrete_coating_thickness(target_submass_ld=150., t_round=0.005, **self.case)
+        np.testing.assert_allclose(ret.t_conc / 0.005, np.round(ret.t_conc / 0.005))
+        self.assertTrue(np.all(ret.submass_ld >= 150. - 1e-9))
+
+    def test_target_required(self):
+        with self.assertRaises(ValueError):
+            concrete_coating_thickness(**self.case)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+
+import numpy as np
+
+from pdover2t.DNVSTF101.pressure_containment_bursting import (
+    pressure_containment_bursting, pressure_containment_bursting_check,
+    pressure_containment_bursting_batch, governing_p_li_labels,
+    governing_p_lt_labels)
+
+
+basecase = {
+    "D_o": 24 * 25.4 * 1.e-3,
+    "p_d": 50.e5,
+    "t_nom": 0.0159,
+    "t_corr": 0.0,
+    "t_ero": 0.0,
+    "t_fab": 0.001,
+    "SMYS": 450.e6,
+    "f_ytemp": 35.e6,
+    "SMTS": 535.e6,
+    "f_utemp": 0.e6,
+    "α_U": 0.96,
+    "γ_m": 1.15,
+    "γ_inc": 1.10,
+    "ρ_cont_d": 20.,
+    "ρ_t": 1025.,
+    "ρ_xwater": 1025.,
+    "α_spt": 1.05,
+    "α_mpt": 1.088,
+    "γ_SCPC": 1.138,
+    "h_ref": 0.0,
+    "h_l": -55.0,
+}
+
+
+class PressureContainmentBatchTests(unittest.TestCase):
+
+    def setUp(self):
+        self.h_l = np.linspace(-10.0, -2500.0, 101)
+        self.p_d = np.where(np.arange(101) % 2, 50.e5, 250.e5)
+        self.case = dict(basecase, h_l=self.h_l, p_d=self.p_d)
+
+    def test_batch_matches_scalar(self):
+        res = pressure_containment_bursting_batch(**self.case)
+        for ii in range(len(self.h_l)):
+            case = dict(basecase, h_l=float(self.h_l[ii]), p_d=float(self.p_d[ii]))
+            pc = pressure_containment_bursting(**case)
+            check = pressure_containment_bursting_check(**case, **pc._asdict())
+            self.assertAlmostEqual(res.p_cont_res_uty[ii], pc.p_cont_res_uty, places=10)
+            self.assertEqual(res.check_p_li[ii], check.check_p_li)
+            self.assertEqual(res.check_p_lt[ii], check.check_p_lt)
+            self.assertEqual(governing_p_li_labels[res.governing_p_li[ii]], check.governing_p_li)
+            self.assertEqual(governing_p_lt_labels[res.governing_p_lt[ii]], check.governing_p_lt)
+
+    def test_batch_shapes(self):
+        res = pressure_containment_bursting_batch(**self.case)
+        for arr in res:
+            self.assertEqual(arr.shape, self.h_l.shape)
+        self.assertEqual(res.governing_p_li.dtype, np.int8)
+        self.assertEqual(res.check_p_li.dtype, bool)
+
+    def test_check_array_labels(self):
+        pc = pressure_containment_bursting(**self.case)
+        check = pressure_containment_bursting_check(**self.case, **pc._asdict())
+        self.assertIsInstance(check.governing_p_li, list)
+        self.assertEqual(len(check.governing_p_li), len(self.h_l))
+        self.assertTrue(set(check.governing_p_li) <= set(governing_p_li_labels))
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+
+import numpy as np
+from scipy import stats
+
+from pdover2t.DNVSTF101.reliability import failure_probability, sample_uniform
+
+
+basecase = {
+    "D_o": 24 * 25.4 * 1.e-3, "p_d": 150.e5, "t_nom": 0.0254, "t_corr": 0.0,
+    "t_ero": 0.0, "t_fab": 0.001, "SMYS": 450.e6, "f_ytemp": 0.0,
+    "SMTS": 535.e6, "f_utemp": 0.e6, "α_U": 1.0, "α_fab": 0.93,
+    "E": 207.e9, "ν": 0.3, "O_0": 0.01, "γ_inc": 1.10, "ρ_cont_d": 20.,
+    "ρ_xwater": 1025., "γ_m": 1.15, "γ_SCLB": 1.14, "h_ref": 0.0, "h_l": -1500.,
+}
+
+
+def linear_limit_state(R, S, **kwargs):
+    return R - S
+
+
+class FailureProbabilityTests(unittest.TestCase):
+
+    def setUp(self):
+        # g = R - S, β = 5/√2
+        self.variables = {"R": stats.norm(10., 1.), "S": stats.norm(5., 1.)}
+        self.pf = stats.norm.cdf(-5. / np.sqrt(2.))
+
+    def test_linear(self):
+        for method, nsamples in (("mc", 400000), ("lhs", 400000), ("is", 10000)):
+            ret = failure_probability(linear_limit_state, self.variables,
+                    nsamples=nsamples, method=method, chunksize=50000, seed=1)
+            self.assertLess(ret.ci_low, self.pf, method)
+            self.assertGreater(ret.ci_high, self.pf, method)
+        self.assertLess(ret.cov, 0.05)
+        self.assertAlmostEqual(ret.beta, 5. / np.sqrt(2.), places=1)
+
+    def test_lhs_strata(self):
+        u, w = sample_uniform("lhs", 100, 3, np.random.default_rng(0))
+        self.assertIsNone(w)
+        for col in u.T:
+            np.testing.assert_array_equal(np.sort(np.floor(col * 100)), np.arange(100))
+
+    def test_collapse(self):
+        variables = {"t_nom": stats.norm(0.0254, 0.0008),
+                     "SMYS": stats.lognorm(0.05, scale=480.e6),
+                     "O_0": stats.uniform(0.005, 0.015)}
+        mc = failure_probability("collapse", variables, nsamples=200000, seed=2, **basecase)
+        is_ = failure_probability("collapse", variables, nsamples=10000, method="is",
+                                  seed=3, **basecase)
+        self.assertGreater(mc.nfail, 100)
+        self.assertLess(abs(is_.pf - mc.pf), 3 * (mc.ci_high - mc.ci_low))
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from pdover2t.util.result_cache import ResultCache, input_hash, cached_entry_points
+from pdover2t.DNVSTF101.buckling_collapse import local_buckling_collapse_all
+from pdover2t.DNVSTF101.pressure_containment_bursting import pressure_containment_bursting_check
+
+
+basecase = {
+    "D_o": 0.6096, "t_nom": 0.0159, "t_fab": 0.001, "t_corr": 0.0, "t_ero": 0.0,
+    "SMYS": 450.e6, "f_ytemp": 35.e6, "α_U": 0.96, "α_fab": 0.93,
+    "E": 207.e9, "ν": 0.3, "O_0": 0.01, "ρ_xwater": 1025., "h_l": -55.0,
+    "γ_m": 1.15, "γ_SCLB": 1.14,
+}
+
+
+class InputHashTests(unittest.TestCase):
+
+    def test_normalised(self):
+        a = input_hash("f", (), {"x": 1, "y": np.arange(3.0)})
+        self.assertEqual(a, input_hash("f", (), {"y": np.array([0., 1., 2.]), "x": 1.0}))
+        self.assertNotEqual(a, input_hash("f", (), {"x": 1, "y": np.arange(3)}))
+        self.assertNotEqual(a, input_hash("f", (), {"x": 1, "y": np.array([0., 1., 2.5])}))
+        self.assertNotEqual(a, input_hash("g", (), {"x": 1, "y": np.arange(3.0)}))
+        self.assertNotEqual(input_hash("f", (True,)), input_hash("f", (1.0,)))
+
+
+class ResultCacheTests(unittest.TestCase):
+
+    def test_memory_lru(self):
+        cache = ResultCache(maxsize=2)
+        collapse = cache.cached(local_buckling_collapse_all)
+        ref = local_buckling_collapse_all(**basecase)
+        self.assertEqual(collapse(**basecase), ref)
+        self.assertEqual(collapse(**dict(basecase, h_l=-55)), ref)
+        self.assertEqual(cache.stats()[:2], (1, 1))
+        collapse(**dict(basecase, h_l=-100.0))
+        collapse(**dict(basecase, h_l=-200.0))
+        collapse(**basecase)
+        stats = cache.stats()
+        self.assertEqual((stats.misses, stats.evictions, stats.currsize), (4, 2, 2))
+
+    def test_arrays_readonly(self):
+        cache = ResultCache(max_bytes=10**6)
+        collapse = cache.cached(local_buckling_collapse_all)
+        h_l = np.linspace(-50., -1000., 100)
+        res = collapse(**dict(basecase, h_l=h_l))
+        self.assertIs(collapse(**dict(basecase, h_l=h_l.copy())), res)
+        self.assertFalse(res.lb_collapse_uty.flags.writeable)
+        self.assertLessEqual(cache.stats().nbytes, 10**6)
+
+    def test_lists_frozen(self):
+        cache = ResultCache()
+        check = cache.cached(pressure_containment_bursting_check)
+        case = {"p_e": 5.e5, "p_li": 150.e5, "p_b": np.array([300.e5, 200.e5]),
+                "p_lt": 170.e5, "p_mpt": 250.e5, "γ_m": 1.15, "γ_SCPC": 1.138,
+                "α_spt": 1.05, "α_U": 0.96, "α_mpt": 1.088}
+        res = check(**case)
+        self.assertIsInstance(res.governing_p_li, tuple)
+        with self.assertRaises(TypeError):
+            res.governing_p_li[0] = "p_mpt"
+        self.assertEqual(check(**case).governing_p_li, res.governing_p_li)
+
+    def test_disk_read_no_commit(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "cache.sqlite")
+            cache = ResultCache(path=path)
+            cache.set("a", 1.0)
+            cache._memory.clear()
+            self.assertEqual(cache.get("a"), 1.0)
+            self.assertFalse(cache._db.in_transaction)
+            cache.close()
+
+    def test_disk_tier(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "cache.sqlite")
+            cache = ResultCache(path=path)
+            points = cached_entry_points(cache)
+            res = points["local_buckling_collapse_all"](**basecase)
+            cache.close()
+            cache = ResultCache(path=path)
+            points = cached_entry_points(cache)
+            self.assertEqual(points["local_buckling_collapse_all"](**basecase), res)
+            self.assertEqual(cache.stats().disk_hits, 1)
+            self.assertIn("DNV1981_pressure_containment", points)
+            cache.close()
+
+
+
+if __name__ == '__main__':
+    unittest.main()
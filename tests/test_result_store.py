@@ -0,0 +1,71 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from pdover2t.util.result_store import ResultStore
+from pdover2t.DNVSTF101.pressure_containment_bursting import pressure_containment_bursting_check
+
+
+basecase = {
+    "p_e": 552849.9, "p_li": 5510787.3, "p_b": 23051915.7, "p_lt": 6327849.9,
+    "p_mpt": 19219863.7, "γ_m": 1.15, "γ_SCPC": 1.138, "α_spt": 1.05,
+    "α_U": 0.96, "α_mpt": 1.088,
+}
+
+
+class ResultStoreTests(unittest.TestCase):
+
+    def test_append_rows(self):
+        store = ResultStore(capacity=4)
+        p_li = np.linspace(5.e6, 25.e6, 11)
+        for val in p_li:
+            store.append(pressure_containment_bursting_check(**dict(basecase, p_li=val)))
+        self.assertEqual(len(store), 11)
+        self.assertEqual(store.typename, "pressure_containment_bursting_check")
+        self.assertEqual(store["check_p_li"].dtype, bool)
+        block = pressure_containment_bursting_check(**dict(basecase, p_li=p_li))
+        np.testing.assert_allclose(store["delta_p_li"], block.delta_p_li)
+        self.assertTrue(np.all(store["governing_p_li"] == block.governing_p_li))
+
+    def test_extend_blocks(self):
+        store = ResultStore()
+        for p_li in np.split(np.linspace(5.e6, 25.e6, 3000), 3):
+            store.extend(pressure_containment_bursting_check(**dict(basecase, p_li=p_li)))
+        self.assertEqual(len(store), 3000)
+        np.testing.assert_allclose(store["limit_p_b"], basecase["p_b"] / (1.15*1.138))
+        df = store.to_dataframe()
+        self.assertEqual(df.shape, (3000, 9))
+
+    def test_empty_store(self):
+        store = ResultStore()
+        self.assertEqual(store.columns, {})
+        with self.assertRaises(KeyError):
+            store["x"]
+
+    def test_dtype_promotion(self):
+        store = ResultStore(capacity=2)
+        store.append({"x": 1, "y": True, "s": "p_b"})
+        store.append({"x": 2.7, "y": 0.5, "s": "p_mpt"})
+        store.extend({"x": np.array([3.5, 4.5]), "y": np.array([1.5, 2.5]), "s": "p_lt"})
+        np.testing.assert_array_equal(store["x"], [1.0, 2.7, 3.5, 4.5])
+        np.testing.assert_array_equal(store["y"], [1.0, 0.5, 1.5, 2.5])
+        self.assertEqual(list(store["s"]), ["p_b", "p_mpt", "p_lt", "p_lt"])
+
+    def test_export(self):
+        store = ResultStore()
+        store.extend({"x": np.arange(5.0), "ok": np.arange(5) < 3})
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "results.parquet")
+            try:
+                store.to_parquet(path)
+            except ImportError:
+                self.skipTest("no parquet engine")
+            pd.testing.assert_frame_equal(pd.read_parquet(path), store.to_dataframe())
+
+
+
+if __name__ == '__main__':
+    unittest.main()
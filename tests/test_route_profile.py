@@ -0,0 +1,83 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from pdover2t.DNVSTF101.route_profile import (read_route_chunks,
+    evaluate_route_chunk, evaluate_route_profile)
+from pdover2t.DNVSTF101.pressure_containment_bursting import pressure_containment_bursting_batch
+
+
+basecase = {
+    "D_o": 24 * 25.4 * 1.e-3, "p_d": 150.e5, "t_nom": 0.0159, "t_corr": 0.0,
+    "t_ero": 0.0, "t_fab": 0.001, "SMYS": 450.e6, "f_ytemp": 35.e6,
+    "SMTS": 535.e6, "f_utemp": 0.e6, "α_U": 0.96, "γ_m": 1.15, "α_fab": 0.93,
+    "E": 207.e9, "ν": 0.3, "O_0": 0.01, "γ_inc": 1.10, "ρ_cont_d": 20.,
+    "ρ_t": 1025., "ρ_xwater": 1025., "α_spt": 1.05, "α_mpt": 1.088,
+    "γ_SCPC": 1.138, "γ_SCLB": 1.14, "h_ref": 0.0,
+}
+
+
+class RouteProfileTests(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.KP = np.linspace(0.0, 25.0, 1001)
+        self.elevation = -30.0 - 20.0 * self.KP
+        self.route_csv = os.path.join(self.tmpdir.name, "route.csv")
+        pd.DataFrame({"KP": self.KP, "elevation": self.elevation}).to_csv(
+            self.route_csv, index=False)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_read_chunks(self):
+        chunks = list(read_route_chunks(self.route_csv, chunksize=300,
+                        column_map={"elevation": "h_l"}))
+        self.assertEqual([len(c["KP"]) for c in chunks], [300, 300, 300, 101])
+        np.testing.assert_allclose(np.concatenate([c["h_l"] for c in chunks]), self.elevation)
+
+    def test_evaluate_csv(self):
+        output = os.path.join(self.tmpdir.name, "results.csv")
+        summary = evaluate_route_profile(self.route_csv, output, chunksize=300,
+                        column_map={"elevation": "h_l"}, **basecase)
+        self.assertEqual(summary.nrows, 1001)
+        self.assertEqual(summary.nchunks, 4)
+        df = pd.read_csv(output)
+        self.assertEqual(len(df), 1001)
+        ref = pressure_containment_bursting_batch(**dict(basecase, h_l=self.elevation))
+        np.testing.assert_allclose(df["uty_p_li"], ref.uty_p_li)
+        self.assertAlmostEqual(summary.max_uty["lb_prop_uty"], df["lb_prop_uty"].max())
+        self.assertEqual(summary.nfail["lb_prop_check"], (~df["lb_prop_check"]).sum())
+
+    def test_evaluate_binary(self):
+        records = np.empty(len(self.KP), dtype=[("KP", "f8"), ("h_l", "f8")])
+        records["KP"], records["h_l"] = self.KP, self.elevation
+        route_npy = os.path.join(self.tmpdir.name, "route.npy")
+        np.save(route_npy, records)
+        output = os.path.join(self.tmpdir.name, "results.bin")
+        evaluate_route_profile(route_npy, output, chunksize=256, **basecase)
+        chunk = evaluate_route_chunk({"KP": self.KP[:1], "h_l": self.elevation[:1]}, **basecase)
+        dtype = [(k, v.dtype) for k, v in chunk.items()]
+        results = np.fromfile(output, dtype=dtype)
+        self.assertEqual(len(results), len(self.KP))
+        np.testing.assert_allclose(results["h_l"], self.elevation)
+
+
+    def test_thermal_profile(self):
+        thermal = {"material": "CMn", "T_inlet": 110., "T_ambient": 5., "decay_length": 5.}
+        output = os.path.join(self.tmpdir.name, "results.csv")
+        evaluate_route_profile(self.route_csv, output, chunksize=300,
+                        column_map={"elevation": "h_l"}, thermal=thermal, **basecase)
+        df = pd.read_csv(output)
+        self.assertAlmostEqual(df["f_ytemp"][0], 34.e6)
+        self.assertEqual(df["f_ytemp"].iloc[-1], 0.0)
+        ref = pressure_containment_bursting_batch(**dict(basecase, h_l=self.elevation,
+                        f_ytemp=df["f_ytemp"].to_numpy(), f_utemp=df["f_utemp"].to_numpy()))
+        np.testing.assert_allclose(df["uty_p_li"], ref.uty_p_li)
+
+
+if __name__ == '__main__':
+    unittest.main()
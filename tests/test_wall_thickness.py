@@ -0,0 +1,57 @@
+import unittest
+
+import numpy as np
+
+from pdover2t.DNVSTF101.wall_thickness import (wall_thickness_sizing,
+    sizing_limit_states)
+
+
+basecase = {
+    "D_o": 24 * 25.4 * 1.e-3, "p_d": 150.e5, "t_corr": 0.0,
+    "t_ero": 0.0, "t_fab": 0.001, "SMYS": 450.e6, "f_ytemp": 35.e6,
+    "SMTS": 535.e6, "f_utemp": 0.e6, "α_U": 0.96, "γ_m": 1.15, "α_fab": 0.93,
+    "E": 207.e9, "ν": 0.3, "O_0": 0.01, "γ_inc": 1.10, "ρ_cont_d": 20.,
+    "ρ_t": 1025., "ρ_xwater": 1025., "α_spt": 1.05, "α_mpt": 1.088,
+    "γ_SCPC": 1.138, "γ_SCLB": 1.14, "h_ref": 0.0,
+}
+limit_states = ("pressure_containment", "collapse")
+
+
+class WallThicknessSizingTests(unittest.TestCase):
+
+    def setUp(self):
+        self.h_l = np.linspace(-50.0, -2000.0, 40)
+        self.case = dict(basecase, h_l=self.h_l)
+
+    def max_unity(self, t_nom):
+        case = dict(self.case, t_nom=t_nom)
+        return np.max([sizing_limit_states[ls](**case) for ls in limit_states], axis=0)
+
+    def test_minimum_thickness(self):
+        ret = wall_thickness_sizing(limit_states=limit_states, tol=1.e-7, **self.case)
+        self.assertTrue(np.all(self.max_unity(ret.t_nom_req) <= 1.0))
+        self.assertTrue(np.all(self.max_unity(ret.t_nom_req - 2.e-7) > 1.0))
+        self.assertEqual(ret.governing[0], "pressure_containment")
+        self.assertEqual(ret.governing[-1], "collapse")
+
+    def test_catalogue(self):
+        catalogue = np.arange(0.0095, 0.0400, 0.0008)
+        ret = wall_thickness_sizing(limit_states=limit_states, catalogue=catalogue,
+                                    **self.case)
+        self.assertTrue(np.all(np.isin(ret.t_nom, catalogue)))
+        self.assertTrue(np.all(ret.uty <= 1.0))
+        self.assertTrue(np.all(self.max_unity(ret.t_nom - 0.0008) > 1.0))
+        ret = wall_thickness_sizing(limit_states=limit_states, catalogue=[0.0127, 0.0143],
+                                    **self.case)
+        self.assertTrue(np.isnan(ret.t_nom[-1]))
+
+    def test_scalar(self):
+        ret = wall_thickness_sizing(**dict(basecase, h_l=-300.0))
+        self.assertIsInstance(ret.t_nom, float)
+        self.assertEqual(ret.governing, "propagation")
+        self.assertAlmostEqual(ret.uty, 1.0, places=3)
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+
+import numpy as np
+
+from pdover2t.DNVSTF101.zoning import RouteZones
+from pdover2t.DNVSTF101.route_profile import evaluate_route_chunk
+from pdover2t.DNVSTF101.pressure_containment_bursting import pressure_containment_bursting_batch
+from pdover2t.DNVSTF101.buckling_collapse import local_buckling_collapse_all
+
+
+basecase = {
+    "D_o": 24 * 25.4 * 1.e-3, "p_d": 150.e5, "t_nom": 0.0159, "t_corr": 0.0,
+    "t_ero": 0.0, "t_fab": 0.001, "SMYS": 450.e6, "f_ytemp": 35.e6,
+    "SMTS": 535.e6, "f_utemp": 0.e6, "α_U": 0.96, "γ_m": 1.15, "α_fab": 0.93,
+    "E": 207.e9, "ν": 0.3, "O_0": 0.01, "γ_inc": 1.10, "ρ_cont_d": 20.,
+    "ρ_t": 1025., "ρ_xwater": 1025., "α_spt": 1.05, "α_mpt": 1.088,
+    "γ_SCPC": 1.138, "γ_SCLB": 1.14, "h_ref": 0.0,
+}
+
+
+class RouteZonesTests(unittest.TestCase):
+
+    def setUp(self):
+        self.zones = RouteZones([(24.5, 25.0, "high"), (0.0, 0.5, "high"),
+                                 (0.5, 24.5, "medium")])
+        self.KP = np.linspace(0.0, 25.0, 1001)
+
+    def test_index(self):
+        idx = self.zones.index([0.0, 0.25, 0.5, 12.0, 24.5, 25.0])
+        np.testing.assert_array_equal(idx, [0, 0, 1, 1, 2, 2])
+        with self.assertRaises(ValueError):
+            self.zones.index([25.1])
+        zones = RouteZones([(0.0, 0.5, "high")], default="low")
+        np.testing.assert_array_equal(zones.factors([0.1, 3.0])["γ_SCLB"], [1.26, 1.04])
+
+    def test_overlap(self):
+        with self.assertRaises(ValueError):
+            RouteZones([(0.0, 1.0, "high"), (0.5, 2.0, "medium")])
+
+    def test_factors(self):
+        f = self.zones.factors(self.KP)
+        zone2 = (self.KP < 0.5) | (self.KP >= 24.5)
+        np.testing.assert_array_equal(f["γ_SCPC"], np.where(zone2, 1.308, 1.138))
+        np.testing.assert_array_equal(f["α_mpt"], np.where(zone2, 1.251, 1.088))
+        np.testing.assert_array_equal(f["γ_m"], 1.15)
+
+    def test_route_checks(self):
+        h_l = -30.0 - 20.0 * self.KP
+        res = evaluate_route_chunk({"KP": self.KP, "h_l": h_l}, zones=self.zones,
+                                   **basecase)
+        for sc in ("high", "medium"):
+            mask = res["safety_class"] == sc
+            case = dict(basecase, h_l=h_l[mask], γ_SCPC=res["γ_SCPC"][mask][0],
+                        γ_SCLB=res["γ_SCLB"][mask][0], α_mpt=res["α_mpt"][mask][0],
+                        α_spt=res["α_spt"][mask][0])
+            pc = pressure_containment_bursting_batch(**case)
+            np.testing.assert_allclose(res["uty_p_li"][mask], pc.uty_p_li)
+            lb = local_buckling_collapse_all(**case)
+            np.testing.assert_allclose(res["lb_collapse_uty"][mask], lb.lb_collapse_uty)
+
+
+
+if __name__ == '__main__':
+    unittest.main()